@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+"""
+crewai's console listener vs headless mode cost per report.
+
+Replays the event stream of one report run (crew kickoff, the six tasks of
+AcoReportPocCrew, their agent executions, LLM calls and tool usages)
+through crewai's event bus, with stdout redirected to /dev/null as it is in
+our containers. Measured first with crewai's own EventListener as it is
+registered on import (verbose crew), then after
+``setup_event_bus(headless=True)`` replaced it, which is what ``main.run``
+does under CREWAI_HEADLESS=1. The dispatch cache is installed for both, so
+only the listener work differs; no LLM is called.
+
+Usage:
+    python benchmarks/bench_headless.py [n_reports] [llm_calls_per_task]
+"""
+
+import contextlib
+import os
+import sys
+import time
+from datetime import datetime
+
+os.environ.setdefault("MODEL", "azure/gpt-4.1-mini")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+
+from crewai.tasks.task_output import TaskOutput  # noqa: E402
+from crewai.utilities.events.agent_events import (  # noqa: E402
+    AgentExecutionCompletedEvent,
+    AgentExecutionStartedEvent,
+)
+from crewai.utilities.events.crew_events import (  # noqa: E402
+    CrewKickoffCompletedEvent,
+    CrewKickoffStartedEvent,
+)
+from crewai.utilities.events.crewai_event_bus import crewai_event_bus  # noqa: E402
+from crewai.utilities.events.event_listener import event_listener  # noqa: E402
+from crewai.utilities.events.llm_events import (  # noqa: E402
+    LLMCallCompletedEvent,
+    LLMCallStartedEvent,
+    LLMCallType,
+)
+from crewai.utilities.events.task_events import (  # noqa: E402
+    TaskCompletedEvent,
+    TaskStartedEvent,
+)
+from crewai.utilities.events.tool_usage_events import (  # noqa: E402
+    ToolUsageFinishedEvent,
+    ToolUsageStartedEvent,
+)
+
+from aco_report_poc_crew.crew import AcoReportPocCrew  # noqa: E402
+from aco_report_poc_crew.event_bus import setup_event_bus  # noqa: E402
+from aco_report_poc_crew.utilities.events.crewai_event_bus import (  # noqa: E402
+    CrewAIEventsBus,
+)
+
+
+def _replay_report(crew, llm_calls_per_task: int) -> None:
+    emit = crewai_event_bus.emit
+    emit(crew, CrewKickoffStartedEvent(crew_name=crew.name, inputs={}))
+    for task in crew.tasks:
+        agent = task.agent
+        emit(task, TaskStartedEvent(context="", task=task))
+        emit(
+            agent,
+            AgentExecutionStartedEvent(
+                agent=agent, task=task, tools=agent.tools, task_prompt=task.description
+            ),
+        )
+        for _ in range(llm_calls_per_task):
+            emit(agent, LLMCallStartedEvent(messages="...", from_task=task))
+            emit(
+                agent,
+                LLMCallCompletedEvent(
+                    response="{}", call_type=LLMCallType.LLM_CALL, from_task=task
+                ),
+            )
+            if agent.tools:
+                args = dict(tool_name="json_schema_check", tool_args={}, agent=agent)
+                emit(agent, ToolUsageStartedEvent(**args))
+                emit(
+                    agent,
+                    ToolUsageFinishedEvent(
+                        **args,
+                        started_at=datetime.now(),
+                        finished_at=datetime.now(),
+                        output="[]",
+                    ),
+                )
+        emit(agent, AgentExecutionCompletedEvent(agent=agent, task=task, output="{}"))
+        output = TaskOutput(description=task.description, agent=agent.role, raw="{}")
+        emit(task, TaskCompletedEvent(output=output, task=task))
+    emit(
+        crew,
+        CrewKickoffCompletedEvent(crew_name=crew.name, output=output, total_tokens=0),
+    )
+
+
+def _measure(crew, n_reports: int, llm_calls_per_task: int):
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        wall, cpu = time.perf_counter(), time.process_time()
+        for _ in range(n_reports):
+            _replay_report(crew, llm_calls_per_task)
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    return wall / n_reports * 1000, cpu / n_reports * 1000
+
+
+def main(n_reports: int = 20, llm_calls_per_task: int = 3) -> None:
+    crew = AcoReportPocCrew().crew()
+    CrewAIEventsBus.install()
+    print(f"{'mode':<10}{'wall ms/report':>16}{'cpu ms/report':>16}")
+    results = {}
+    for mode in ("console", "headless"):
+        if mode == "console":
+            # crewai's listener as registered on import, rendering a verbose crew
+            event_listener.formatter.verbose = True
+        else:
+            setup_event_bus(headless=True)
+        results[mode] = _measure(crew, n_reports, llm_calls_per_task)
+        print(f"{mode:<10}{results[mode][0]:>16.2f}{results[mode][1]:>16.2f}")
+    saved_wall = results["console"][0] - results["headless"][0]
+    saved_cpu = results["console"][1] - results["headless"][1]
+    print(f"{'saved':<10}{saved_wall:>16.2f}{saved_cpu:>16.2f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark for the crew's interpolation inputs.
+
+Interpolates the processed ``test_data1.json`` payload into every task
+description/expected_output and agent role/goal/backstory from the YAML
+config, which is what one kickoff does, using crewai's own
+``interpolate_only`` (the one ``Task`` and ``BaseAgent`` call). It compares
+the raw inputs, i.e. after ``prepare_skeletons`` only, with the inputs the
+crew's ``prepare_kickoff`` hook hands to crewai, where dict/list values
+are already rendered to strings.
+
+Usage:
+    python benchmarks/bench_interpolation.py [n_kickoffs]
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+os.environ.setdefault("MODEL", "azure/gpt-4.1-mini")
+
+from crewai.utilities.string_utils import interpolate_only  # noqa: E402
+
+from aco_report_poc_crew.crew import AcoReportPocCrew  # noqa: E402
+from aco_report_poc_crew.jsonparser import process_payload  # noqa: E402
+
+PACKAGE = Path(__file__).resolve().parents[1] / "src" / "aco_report_poc_crew"
+
+
+def _templates():
+    config = PACKAGE / "config"
+    tasks = yaml.safe_load((config / "tasks.yaml").read_text())
+    agents = yaml.safe_load((config / "agents.yaml").read_text())
+    templates = []
+    for task in tasks.values():
+        templates += [task["description"], task["expected_output"]]
+    for agent in agents.values():
+        templates += [agent["role"], agent["goal"], agent["backstory"]]
+    return templates
+
+
+def _per_kickoff_ms(render, templates, inputs, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        render(templates, inputs)
+    return (time.perf_counter() - start) / n * 1000
+
+
+def main(n: int = 200) -> None:
+    payload = json.loads((PACKAGE / "data" / "test_data1.json").read_text())
+    crew = AcoReportPocCrew()
+    inputs = {"payload": process_payload(payload), "fixture_name": "test_data1"}
+    raw = crew.prepare_skeletons(inputs)
+    prepared = crew.prepare_kickoff(inputs)
+    templates = _templates()
+
+    assert [interpolate_only(t, raw) for t in templates] == [
+        interpolate_only(t, prepared) for t in templates
+    ]
+
+    render = lambda ts, i: [interpolate_only(t, i) for t in ts]  # noqa: E731
+    print(f"{len(templates)} templates per kickoff")
+    baseline = None
+    for name, kickoff_inputs in (("raw inputs", raw), ("prepare_kickoff", prepared)):
+        ms = _per_kickoff_ms(render, templates, kickoff_inputs, n)
+        baseline = baseline or ms
+        print(f"{name:<20}{ms:>8.3f} ms/kickoff{baseline / ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+"""
+Event payload serialization: recursive vs iterative ``to_serializable``.
+
+Builds the event stream of one report run (crew kickoff with the processed
+``test_data1.json`` payload, the six tasks of AcoReportPocCrew, their LLM
+calls carrying the full prompt, tool usages and task outputs of report size)
+and serializes every event with the installed crewai implementation (the
+previous version of ours) and with ``utilities.serialization``.
+
+Usage:
+    python benchmarks/bench_serialization.py [n_reports] [max_str_len]
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+os.environ.setdefault("MODEL", "azure/gpt-4.1-mini")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+
+from crewai.tasks.task_output import TaskOutput  # noqa: E402
+from crewai.utilities.serialization import (  # noqa: E402
+    to_serializable as legacy_to_serializable,
+)
+
+from aco_report_poc_crew.crew import AcoReportPocCrew  # noqa: E402
+from aco_report_poc_crew.jsonparser import process_payload  # noqa: E402
+from aco_report_poc_crew.utilities.events.agent_events import (  # noqa: E402
+    AgentExecutionCompletedEvent,
+)
+from aco_report_poc_crew.utilities.events.crew_events import (  # noqa: E402
+    CrewKickoffCompletedEvent,
+    CrewKickoffStartedEvent,
+)
+from aco_report_poc_crew.utilities.events.llm_events import (  # noqa: E402
+    LLMCallCompletedEvent,
+    LLMCallStartedEvent,
+    LLMCallType,
+)
+from aco_report_poc_crew.utilities.events.task_events import (  # noqa: E402
+    TaskCompletedEvent,
+)
+from aco_report_poc_crew.utilities.events.tool_usage_events import (  # noqa: E402
+    ToolUsageFinishedEvent,
+)
+from aco_report_poc_crew.utilities.serialization import (  # noqa: E402
+    to_serializable,
+)
+
+PACKAGE = Path(__file__).resolve().parents[1] / "src" / "aco_report_poc_crew"
+
+
+def _report_events(llm_calls_per_task: int = 3):
+    crew = AcoReportPocCrew().crew()
+    raw = json.loads((PACKAGE / "data" / "test_data1.json").read_text())
+    payload = process_payload(raw)
+    report = json.dumps(payload, indent=2)
+    inputs = {"payload": payload, "fixture_name": "test_data1"}
+
+    events = [CrewKickoffStartedEvent(crew_name=crew.name, inputs=inputs)]
+    for task in crew.tasks:
+        agent = task.agent
+        prompt = f"{task.description}\n\n{report}"
+        messages = [
+            {"role": "system", "content": agent.backstory},
+            {"role": "user", "content": prompt},
+        ]
+        for _ in range(llm_calls_per_task):
+            events.append(LLMCallStartedEvent(messages=messages))
+            events.append(
+                LLMCallCompletedEvent(
+                    messages=messages, response=report, call_type=LLMCallType.LLM_CALL
+                )
+            )
+            events.append(
+                ToolUsageFinishedEvent(
+                    tool_name="json_schema_check",
+                    tool_args={"data": report, "schema": "stories_data"},
+                    started_at=datetime.now(),
+                    finished_at=datetime.now(),
+                    output="[]",
+                )
+            )
+        output = TaskOutput(
+            description=task.description,
+            agent=agent.role,
+            raw=report,
+            json_dict=payload,
+        )
+        events.append(
+            AgentExecutionCompletedEvent(agent=agent, task=task, output=report)
+        )
+        events.append(TaskCompletedEvent(output=output))
+    events.append(
+        CrewKickoffCompletedEvent(crew_name=crew.name, output=output, total_tokens=0)
+    )
+    return events
+
+
+def _per_report_ms(serialize, events, n, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(n):
+            for event in events:
+                serialize(event, {"agent", "task"})
+        best = min(best, time.perf_counter() - start)
+    return best / n * 1000
+
+
+def main(n_reports: int = 50, max_str_len: int = 4096) -> None:
+    events = _report_events()
+    for event in events:
+        expected = legacy_to_serializable(event, exclude={"agent", "task"})
+        assert to_serializable(event, exclude={"agent", "task"}) == expected
+
+    runs = {
+        "recursive": legacy_to_serializable,
+        "iterative": to_serializable,
+        f"iterative cap={max_str_len}": lambda obj, exclude: to_serializable(
+            obj, exclude=exclude, max_str_len=max_str_len
+        ),
+    }
+    print(f"{len(events)} events per report")
+    baseline = None
+    for name, serialize in runs.items():
+        ms = _per_report_ms(serialize, events, n_reports)
+        baseline = baseline or ms
+        size = sum(
+            len(json.dumps(serialize(event, {"agent", "task"}))) for event in events
+        )
+        print(f"{name:<24}{ms:>8.2f} ms/report{baseline / ms:>7.1f}x{size:>10} bytes")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
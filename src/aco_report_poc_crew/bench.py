@@ -0,0 +1,389 @@
+#!/usr/bin/env python
+"""
+End-to-end benchmark of the report pipeline.
+
+Runs ``process_payload`` → the six crew tasks → artifact writes N times per
+fixture against the stub LLM server (default) or a replayed LLM cassette,
+and prints per-stage p50/p95/p99 latency, token usage, how task outputs
+were parsed (incl. guardrail retries), LLM stream buffer sizes and peak
+RSS as JSON. Fixtures without initiatives are rendered from templates as
+in ``main.run``; set TEMPLATE_REPORTS=0 to put them through the crew.
+
+Usage:
+    bench [--runs 5] [--fixture data/test_data1.json ...]
+          [--synthetic days=365,granularity=hourly,initiatives=3 ...]
+          [--stub-latency fixed:0 | --cassette FILE] [--output results.json]
+          [--save-baseline FILE] [--baseline FILE [--tolerance 0.10]]
+          [--profile DIR] [--event-dispatch inline|background] [--stream]
+
+With ``--baseline``, every stage whose p50 grew by more than the tolerance
+is listed under ``regressions`` and the command exits with status 1.
+CREW_TRACE=1 writes one span trace per report as in ``main.run``.
+``--event-dispatch`` overrides CREW_EVENT_DISPATCH; run the benchmark once
+per mode to compare kickoff latency with handlers inline vs. on the
+background thread.
+"""
+
+import argparse
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from crewai.utilities.events import crewai_event_bus
+from crewai.utilities.events.task_events import TaskCompletedEvent, TaskStartedEvent
+from dotenv import load_dotenv
+
+from . import crew as crew_module
+from .event_bus import (
+    dispatch_metrics,
+    reset_stream_metrics,
+    setup_event_bus,
+    stream_metrics,
+)
+from .jsonparser import process_payload
+from .listeners import ProfilingListener, tracing_from_env
+from .partial_regen import get_conversion_stats, reset_conversion_stats
+from .payload_generator import parse_spec, write_payload
+from .stub_llm_server import StubLLMServer
+from .template_report import kickoff_template
+from .utilities.llm_cassette import CASSETTE_ENV_VAR, CASSETTE_MODE_ENV_VAR
+from .utilities.llm_utils import get_shared_llm
+
+load_dotenv()
+
+DATA_DIR = Path(__file__).parent / "data"
+PERCENTILES = (50, 95, 99)
+TOKEN_FIELDS = ("prompt_tokens", "completion_tokens", "cached_prompt_tokens")
+
+
+# ---------- stage recording -------------------------------------------
+class StageRecorder:
+    """
+    Collects per-stage durations (ms) and token usage across runs.
+
+    Task stages come from ``TaskStartedEvent``/``TaskCompletedEvent``:
+    ``<task>`` spans ``task.start_time`` → ``task.end_time`` and
+    ``<task>.artifacts`` the callbacks that run between ``end_time`` and
+    the completion event (the report files written by the crew).
+    """
+
+    def __init__(self):
+        self.durations: Dict[str, List[float]] = defaultdict(list)
+        self.tokens: Dict[str, List[int]] = defaultdict(list)
+        self._token_starts: Dict[int, Dict[str, int]] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[name].append((time.perf_counter() - start) * 1000)
+
+    @contextmanager
+    def listening(self):
+        """Record task stages from the event bus while the block runs."""
+        global _active_recorder
+        _install_handlers()
+        _active_recorder = self
+        try:
+            yield
+        finally:
+            _active_recorder = None
+
+    def _task_started(self, task: Any) -> None:
+        self._token_starts[id(task)] = _token_snapshot(task)
+
+    def _task_completed(self, task: Any, completed_at: datetime) -> None:
+        # Event time, not handler time: with background dispatch the handler
+        # may run after the next task has started
+        name = _stage_name(task)
+        if task.start_time and task.end_time:
+            self.durations[name].append(
+                (task.end_time - task.start_time).total_seconds() * 1000
+            )
+            if task.callback:
+                self.durations[f"{name}.artifacts"].append(
+                    (completed_at - task.end_time).total_seconds() * 1000
+                )
+        before = self._token_starts.pop(id(task), {})
+        after = _token_snapshot(task)
+        self.tokens[name].append(
+            sum(after.get(k, 0) - before.get(k, 0) for k in TOKEN_FIELDS[:2])
+        )
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        stages = {}
+        for name, values in self.durations.items():
+            stats = {"count": len(values), "mean_ms": round(sum(values) / len(values), 3)}
+            for q in PERCENTILES:
+                stats[f"p{q}_ms"] = round(percentile(values, q), 3)
+            if name in self.tokens:
+                tokens = self.tokens[name]
+                stats["tokens_mean"] = round(sum(tokens) / len(tokens), 1)
+            stages[name] = stats
+        return stages
+
+
+# Registered once and left in place (scoped_handlers() would also silence
+# crewai's own listeners during the measured kickoff).
+_active_recorder: Optional[StageRecorder] = None
+_handlers_installed = False
+
+
+def _install_handlers() -> None:
+    global _handlers_installed
+    if _handlers_installed:
+        return
+    _handlers_installed = True
+
+    @crewai_event_bus.on(TaskStartedEvent)
+    def on_task_started(source, event):
+        if _active_recorder is not None:
+            _active_recorder._task_started(event.task or source)
+
+    @crewai_event_bus.on(TaskCompletedEvent)
+    def on_task_completed(source, event):
+        if _active_recorder is not None:
+            # task.end_time is naive local time, event timestamps are UTC
+            completed_at = event.timestamp.astimezone().replace(tzinfo=None)
+            _active_recorder._task_completed(event.task or source, completed_at)
+
+
+def _stage_name(task: Any) -> str:
+    return task.name or task.description.strip().splitlines()[0][:40]
+
+
+def _token_snapshot(task: Any) -> Dict[str, int]:
+    agent = getattr(task, "agent", None)
+    process = getattr(agent, "_token_process", None)
+    if process is None:
+        return {}
+    summary = process.get_summary()
+    return {field: getattr(summary, field) for field in TOKEN_FIELDS}
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Linear-interpolated percentile (same as numpy's default)."""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+# ---------- pipeline --------------------------------------------------
+@contextmanager
+def _scratch_workdir():
+    """The crew callbacks write into the cwd; keep benchmark artifacts apart."""
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="aco-bench-") as workdir:
+        os.chdir(workdir)
+        try:
+            yield Path(workdir)
+        finally:
+            os.chdir(previous)
+
+
+def run_pipeline(fixture: Path, recorder: StageRecorder) -> Dict[str, int]:
+    """One report: returns the crew's token usage."""
+    with recorder.stage("total"):
+        with recorder.stage("load_payload"):
+            raw = json.loads(fixture.read_text())
+        with recorder.stage("process_payload"):
+            processed = process_payload(raw)
+        inputs = {"payload": processed, "fixture_name": fixture.stem}
+        with recorder.listening(), recorder.stage("kickoff"):
+            # NO_INITIATIVE payloads take the template path like main.run
+            result = kickoff_template(inputs)
+            if result is None:
+                result = crew_module.AcoReportPocCrew().crew().kickoff(inputs=inputs)
+        with recorder.stage("write_report"):
+            Path(f"final_report_{fixture.stem}.txt").write_text(result.raw)
+    return result.token_usage.model_dump()
+
+
+def add_stream_metrics(total: Dict[str, int], run: Dict[str, int]) -> None:
+    """Fold one report's stream buffer metrics into the benchmark totals."""
+    for key, value in run.items():
+        if key == "stream_buffer_peak_chars":
+            total[key] = max(total.get(key, 0), value)
+        elif key == "open_stream_buffers":
+            total[key] = value
+        else:
+            total[key] = total.get(key, 0) + value
+
+
+def _configure_llm(args: argparse.Namespace) -> Optional[StubLLMServer]:
+    """Point the crew's shared LLM at the stub server or a replayed cassette."""
+    server = None
+    params = dict(
+        model=os.getenv("MODEL"),
+        base_url=os.getenv("AZURE_API_BASE"),
+        api_key=os.getenv("AZURE_API_KEY"),
+        api_version=os.getenv("AZURE_API_VERSION"),
+        temperature=0.0,
+        stream=True if args.stream else None,
+    )
+    if args.cassette:
+        os.environ[CASSETTE_ENV_VAR] = str(args.cassette)
+        os.environ[CASSETTE_MODE_ENV_VAR] = "replay"
+    else:
+        os.environ.pop(CASSETTE_ENV_VAR, None)
+        os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+        server = StubLLMServer(
+            ("127.0.0.1", 0),
+            fixture=args.fixture[0] if args.fixture else DATA_DIR / "test_data1.json",
+            latency=args.stub_latency,
+            seed=args.seed,
+        )
+        server.start_in_background()
+        params.update(
+            base_url=server.base_url,
+            api_key="stub",
+            api_version=params["api_version"] or "2024-06-01",
+        )
+    # crew.py reads the module-level LLM when each agent is built
+    crew_module.llm = get_shared_llm(**params)
+    return server
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float):
+    """Per-stage p50/p95 change against a saved baseline."""
+    comparison, regressions = {}, []
+    for name, stats in results["stages"].items():
+        previous = baseline.get("stages", {}).get(name)
+        if not previous:
+            continue
+        entry = {}
+        for key in ("p50_ms", "p95_ms"):
+            if previous[key] > 0:
+                entry[key.replace("_ms", "_change")] = round(
+                    stats[key] / previous[key] - 1, 4
+                )
+        comparison[name] = entry
+        if entry.get("p50_change", 0) > tolerance:
+            regressions.append(name)
+    return comparison, regressions
+
+
+# ---------- CLI -------------------------------------------------------
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument(
+        "--fixture", type=Path, action="append", help="repeatable; default data/*.json"
+    )
+    parser.add_argument(
+        "--synthetic", action="append", default=[], metavar="SPEC",
+        help="repeatable payload_generator spec, e.g. days=365,granularity=hourly",
+    )
+    parser.add_argument("--stub-latency", default="fixed:0")
+    parser.add_argument("--cassette", type=Path)
+    parser.add_argument(
+        "--stream", action="store_true", help="stream LLM responses (chunk events)"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--save-baseline", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    parser.add_argument(
+        "--event-dispatch", choices=("inline", "background"),
+        help="run event handlers inline or on a background thread "
+        "(default: CREW_EVENT_DISPATCH, else inline)",
+    )
+    parser.add_argument(
+        "--profile", type=Path, metavar="DIR",
+        help="write per-task cProfile/tracemalloc dumps under DIR (skews timings)",
+    )
+    args = parser.parse_args(argv)
+    if not args.fixture and not args.synthetic:
+        args.fixture = sorted(DATA_DIR.glob("*.json"))
+    args.fixture = [p.resolve() for p in args.fixture or []]
+    return args
+
+
+def run(argv: Optional[List[str]] = None) -> None:
+    """Entry point for the ``bench`` script."""
+    args = _parse_args(argv)
+    server = _configure_llm(args)
+    bus = setup_event_bus(args.event_dispatch)
+    if args.profile:
+        ProfilingListener(output_dir=str(args.profile.resolve()))
+    tracing_from_env()
+    streams: Dict[str, int] = {}
+    recorder = StageRecorder()
+    tokens: Dict[str, int] = defaultdict(int)
+
+    try:
+        with _scratch_workdir() as workdir:
+            for index, spec in enumerate(args.synthetic):
+                path = workdir / f"synthetic_{index}.json"
+                with path.open("w", encoding="utf-8") as fp:
+                    write_payload(fp, **parse_spec(spec))
+                args.fixture.append(path)
+            for fixture in args.fixture:
+                for _ in range(args.warmup):
+                    run_pipeline(fixture, StageRecorder())
+            reset_conversion_stats()
+            for fixture in args.fixture:
+                for _ in range(args.runs):
+                    reset_stream_metrics()
+                    for key, value in run_pipeline(fixture, recorder).items():
+                        tokens[key] += value
+                    add_stream_metrics(streams, stream_metrics())
+    finally:
+        if server:
+            server.shutdown()
+            server.server_close()
+
+    n_reports = args.runs * len(args.fixture)
+    results: Dict[str, Any] = {
+        "runs": args.runs,
+        "fixtures": [p.name for p in args.fixture],
+        "synthetic": args.synthetic,
+        "llm": f"cassette:{args.cassette}" if args.cassette else f"stub:{args.stub_latency}",
+        "stages": recorder.summary(),
+        "tokens_per_report": {k: round(v / n_reports, 1) for k, v in tokens.items()},
+        "conversions": get_conversion_stats(),
+        "stream": streams,
+        "event_dispatch": dispatch_metrics(bus),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+    if server:
+        results["stub_requests"] = dict(server.stats)
+
+    regressions: List[str] = []
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        results["baseline"], regressions = compare(results, baseline, args.tolerance)
+        results["regressions"] = regressions
+
+    report = json.dumps(results, indent=2)
+    print(report)
+    if args.output:
+        args.output.write_text(report)
+    if args.save_baseline:
+        args.save_baseline.write_text(report)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run()
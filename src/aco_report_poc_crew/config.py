@@ -1,10 +1,13 @@
 """
-Loads YAML-based agent and task configurations so crew.py can access them as
-Python dictionaries:
+Loads YAML-based agent and task configurations (and the pre-approved
+phrasings of template-rendered reports) as Python dictionaries:
 
-    from .config import agents_config, tasks_config
+    from .config import agents_config, tasks_config, phrasings_config
 """
 
+import json
+from functools import lru_cache
+from importlib.resources import files
 from pathlib import Path
 import yaml
 
@@ -17,4 +20,13 @@ def _load_yaml(rel_path: str) -> dict:
         return yaml.safe_load(f)
 
 agents_config = _load_yaml("agents.yaml")
-tasks_config  = _load_yaml("tasks.yaml")
\ No newline at end of file
+tasks_config  = _load_yaml("tasks.yaml")
+phrasings_config = _load_yaml("phrasings.yaml")
+
+# JSON schemas of the task outputs, shipped as package data
+SCHEMA_DIR = files(__package__) / "schemas"
+
+@lru_cache(maxsize=None)
+def load_schema(name: str) -> dict:
+    """Draft-7 schema by name, e.g. ``load_schema("stories_data")``."""
+    return json.loads((SCHEMA_DIR / f"{name}.schema.json").read_text(encoding="utf-8"))
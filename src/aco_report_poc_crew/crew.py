@@ -10,12 +10,24 @@ from datetime import datetime, timezone
 
 import openai
 from crewai import Agent, Crew, Process, Task, LLM
-from crewai.project import CrewBase, agent, crew, task, tool
+from crewai.project import CrewBase, agent, before_kickoff, crew, task, tool
 from crewai.agents.agent_builder.base_agent import BaseAgent
 
 from .config import agents_config, tasks_config
+from .delta_protocol import NARRATIVE_FIELDS, delta_guardrail
+from .jsonparser import (
+    analyzer_insights,
+    dimension_pages,
+    highlight_entries,
+    process_payload,
+    select_top_highlights,
+)
+from .output_formats import precompute_output_format
 from .tools import TOOLS  # unified list of BaseTool instances
 from .tools import DeltaCalc, BaselineVariance, SignificanceFlag, JsonSchemaCheck, ReferenceMatcher, ComplianceLinter
+from .utilities.events.utils.headless import is_headless
+from .utilities.llm_utils import get_shared_llm
+from .utilities.string_utils import prepare_inputs
 
 # # -------------------- Azure OpenAI client -------------------------------
 # client = openai.AzureOpenAI(
@@ -33,7 +45,19 @@ from .tools import DeltaCalc, BaselineVariance, SignificanceFlag, JsonSchemaChec
 #    raise RuntimeError(f"Failed to connect to Azure OpenAI: {e}")
 
 # # -------------------- ACO Report PoC Crew --------------------------------
-llm = LLM(
+# Headless workers (CREWAI_HEADLESS=1) run with verbose off so no console
+# trees/panels are rendered for every event.
+VERBOSE = not is_headless()
+
+# Fields of each pre-selected highlight the story generator gets to see
+HIGHLIGHT_PROMPT_FIELDS = (
+    "dimension", "metric", "change", "initiative_id", "initiative_name",
+    "impact_note", "explanation",
+)
+
+# Shared instance + keep-alive HTTP client: repeated kickoffs in one process
+# reuse the same LLM and its pooled Azure connections.
+llm = get_shared_llm(
     model=os.getenv("MODEL"),
     base_url=os.getenv("AZURE_API_BASE"),
     api_key=os.getenv("AZURE_API_KEY"),
@@ -50,6 +74,11 @@ class AcoReportPocCrew():
     agents: List[BaseAgent]
     tasks: List[Task]
 
+    # Documents of the current kickoff: the skeletons built in Python and,
+    # keyed by task name, each task's output after its edits were merged
+    documents: Dict[str, Any] = {}
+    last_updated: str = ""
+
     def save_combine_stories_callback(self, output: TaskOutput):
         """Save success stories to cache"""
         # self.cache.put_item_in_cache("final_stories.json", output.raw)
@@ -68,6 +97,67 @@ class AcoReportPocCrew():
         out_file = Path(f"correct_report_test.txt")
         out_file.write_text(output.raw)
 
+    @staticmethod
+    def _processed_payload(inputs: Dict[str, Any]) -> Dict[str, Any]:
+        payload = inputs.get("payload") or {}
+        if "current_metrics" in payload:  # raw fixture (debug helpers)
+            payload = process_payload(payload)
+        return payload
+
+    @before_kickoff
+    def prepare_kickoff(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        The crew's only before_kickoff hook: build the skeletons, then render
+        the inputs for interpolation. The order matters: ``top_highlights``
+        is added by the first step and must be rendered by the second.
+        """
+        return self.prepare_interpolation(self.prepare_skeletons(inputs))
+
+    def prepare_skeletons(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build everything but the narratives in Python: the grouped analyzer
+        insights and the ranked top highlights. The LLM tasks answer with
+        JSON Pointer edits of the narrative strings only. Returns a copy of
+        ``inputs`` with ``top_highlights`` added.
+        """
+        payload = self._processed_payload(inputs)
+        records = select_top_highlights(payload)
+        self.last_updated = inputs.get("last_updated") or datetime.now(
+            timezone.utc
+        ).strftime("%Y-%m-%dT%H:%M:%SZ")
+        self.documents = {
+            "analyzer_skeleton": analyzer_insights(payload),
+            "highlights_skeleton": {"Top Highlights": highlight_entries(records)},
+        }
+        highlights = [
+            {key: record[key] for key in HIGHLIGHT_PROMPT_FIELDS}
+            for record in records
+        ]
+        return {**inputs, "top_highlights": json.dumps(highlights, ensure_ascii=False)}
+
+    def prepare_interpolation(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate the inputs once and render dict/list values to the strings
+        interpolation would produce. crewai then interpolates every task and
+        agent template with plain strings instead of re-walking and
+        re-stringifying the payload for each of them. Returns a new dict so
+        the caller's payload stays a dict.
+        """
+        prepared = prepare_inputs(inputs)
+        return {
+            key: prepared.rendered(key) if isinstance(value, (dict, list)) else value
+            for key, value in prepared.items()
+        }
+
+    def _delta_guardrail(self, name: str, skeleton, schema: str, fields):
+        """Merge task ``name``'s edits into ``skeleton()`` and keep the result."""
+        return delta_guardrail(
+            skeleton=skeleton,
+            schema=schema,
+            fields=fields,
+            on_merged=lambda document: self.documents.__setitem__(name, document),
+        )
+
     @tool
     def delta_calc(self):
         return DeltaCalc()
@@ -98,7 +188,7 @@ class AcoReportPocCrew():
         return Agent(
             config=agents_config["impact_analyzer_agent"],
             tools=TOOLS, #[json_schema_check],
-            verbose=True,
+            verbose=VERBOSE,
             llm=llm,  # use shared LLM instance
         )
 
@@ -106,7 +196,7 @@ class AcoReportPocCrew():
     def story_generator_agent(self) -> Agent:
         return Agent(
             config=agents_config["story_generator_agent"],
-            verbose=True,
+            verbose=VERBOSE,
             llm=llm,  # use shared LLM instance
         )
 
@@ -115,7 +205,7 @@ class AcoReportPocCrew():
         return Agent(
             config=agents_config["report_validator_agent"],
             tools=TOOLS,
-            verbose=True,
+            verbose=VERBOSE,
             llm=llm,  # use shared LLM instance
         )
 
@@ -124,7 +214,7 @@ class AcoReportPocCrew():
         return Agent(
             config=agents_config["report_corrector_agent"],
             tools=TOOLS,  # json_schema_check for self-validation
-            verbose=True,
+            verbose=VERBOSE,
             llm=llm,  # use shared LLM instance
         )
 
@@ -132,13 +222,31 @@ class AcoReportPocCrew():
 
     @task
     def analyze_impact_attribution_task(self) -> Task:
-        return Task(config=self.tasks_config["analyze_impact_attribution_task"])
+        return Task(
+            config=self.tasks_config["analyze_impact_attribution_task"],
+            # numbers and grouping come from process_payload; the LLM's
+            # explanation edits are merged in and the full document passed on
+            guardrail=self._delta_guardrail(
+                "analyze_impact_attribution_task",
+                lambda: self.documents["analyzer_skeleton"],
+                "analyzer_insights",
+                ("explanation",),
+            ),
+        )
 
     @task
     def generate_top_highlights_task(self) -> Task:
         return Task(
             config=self.tasks_config["generate_top_highlights_task"],
-            input_results=[self.analyze_impact_attribution_task],
+            # the selected highlights arrive via {top_highlights}; no need to
+            # send the whole analyzer output as context
+            context=[],
+            guardrail=self._delta_guardrail(
+                "generate_top_highlights_task",
+                lambda: self.documents["highlights_skeleton"],
+                "stories_data",
+                ("summary",),
+            ),
         )
 
     @task
@@ -146,6 +254,14 @@ class AcoReportPocCrew():
         return Task(
             config=self.tasks_config["generate_dimension_pages_task"],
             input_results=[self.analyze_impact_attribution_task],
+            guardrail=self._delta_guardrail(
+                "generate_dimension_pages_task",
+                lambda: dimension_pages(
+                    self.documents["analyze_impact_attribution_task"], self.last_updated
+                ),
+                "stories_data",
+                ("insight_summary",),
+            ),
         )
 
     @task
@@ -157,6 +273,15 @@ class AcoReportPocCrew():
                 self.generate_dimension_pages_task,
             ],
             callback=self.save_combine_stories_callback,
+            guardrail=self._delta_guardrail(
+                "combine_stories_task",
+                lambda: {
+                    **self.documents["generate_top_highlights_task"],
+                    **self.documents["generate_dimension_pages_task"],
+                },
+                "stories_data",
+                ("summary", "insight_summary"),
+            ),
         )    
 
     @task
@@ -179,6 +304,12 @@ class AcoReportPocCrew():
                 self.validate_final_report_task,
             ],
             callback=self.save_correct_stories_callback,
+            guardrail=self._delta_guardrail(
+                "correct_report_with_validation_task",
+                lambda: self.documents["combine_stories_task"],
+                "stories_data",
+                NARRATIVE_FIELDS,
+            ),
         )
 
     # ---------------- CREW ---------------------------------------------
@@ -186,9 +317,14 @@ class AcoReportPocCrew():
     @crew
     def crew(self) -> Crew:
         """Sequential execution with optional correction."""
+        for task in self.tasks:
+            # Structured output: render the schema text once, not per execution
+            model = task.output_json or task.output_pydantic
+            if model is not None:
+                precompute_output_format(model, (task.agent and task.agent.llm) or llm)
         return Crew(
             agents=self.agents,
             tasks=self.tasks,
             process=Process.sequential,
-            verbose=True,
+            verbose=VERBOSE,
         )
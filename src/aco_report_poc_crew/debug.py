@@ -5,25 +5,51 @@ Developer helpers for the ACO Success-Metrics crew.
 Commands
 --------
 run              – Normal execution with fixture JSON (same as main.py).
-train <N> <file> – CrewAI “train” utility; reruns the crew N times and
+train <N> <file> [workers]
+                 – CrewAI “train” utility; reruns the crew N times and
                    stores trajectories in <file>.
 replay <task_id> – Replays a previous run, starting at task_id, so you
                    can inspect intermediate LLM calls step-by-step.
-test  <N> <llm>  – CrewAI “test” utility; executes N runs and evaluates
+test  <N> <llm> [workers]
+                 – CrewAI “test” utility; executes N runs and evaluates
                    them with the given evaluation LLM name.
 
+With ``workers`` > 1, iterations run concurrently in separate worker
+processes (at most ``workers`` at a time), each in its own temporary
+working directory. Their results are merged in iteration order, so the
+training pickle and the evaluation table match a sequential run.
+
 These helpers should **not** be used in production—only for local
 prompt-tuning or debugging sessions.
 """
 
 import json
+import multiprocessing
+import os
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from crewai.utilities.events import crewai_event_bus
+from crewai.utilities.events.crew_events import (
+    CrewTestCompletedEvent,
+    CrewTestFailedEvent,
+    CrewTestStartedEvent,
+)
 from dotenv import load_dotenv
 
 load_dotenv()
 
 from aco_report_poc_crew.crew import AcoReportPocCrew
+from aco_report_poc_crew.event_bus import setup_event_bus
+from aco_report_poc_crew.utilities.constants import TRAINING_DATA_FILE
+from aco_report_poc_crew.utilities.evaluators.crew_evaluator_handler import (
+    CrewEvaluator,
+)
+from aco_report_poc_crew.utilities.evaluators.task_evaluator import TaskEvaluator
+from aco_report_poc_crew.utilities.llm_utils import create_llm
+from aco_report_poc_crew.utilities.training_handler import CrewTrainingHandler
 
 
 # ---------- shared fixture loader ------------------------------------
@@ -41,13 +67,17 @@ def run() -> None:
     print(json.dumps(result, indent=2))
 
 
-def train(n_iterations: int, filename: str) -> None:
+def train(n_iterations: int, filename: str, workers: int = 1) -> None:
     """
     CrewAI's training loop:
         • Executes the crew n_iterations times.
         • Saves each trajectory (inputs, LLM calls, outputs) to <filename>.
     Useful for batch-tuning prompts or measuring latency.
+    With workers > 1 the iterations run in parallel worker processes.
     """
+    if workers > 1:
+        _parallel_train(n_iterations, filename, workers)
+        return
     AcoReportPocCrew().crew().train(
         n_iterations=n_iterations,
         filename=filename,
@@ -63,39 +93,204 @@ def replay(task_id: str) -> None:
     AcoReportPocCrew().crew().replay(task_id=task_id)
 
 
-def test(n_iterations: int, eval_llm: str) -> None:
+def test(n_iterations: int, eval_llm: str, workers: int = 1) -> None:
     """
     CrewAI's testing mode:
         • Runs the crew n_iterations times.
         • Uses <eval_llm> (e.g., 'gpt-4o-mini') to auto-score outputs.
     Handy for regression tests or A/B prompt experiments.
+    With workers > 1 the iterations run in parallel worker processes.
     """
-    AcoReportPocCrew().crew().test(
-        n_iterations=n_iterations,
-        eval_llm=eval_llm,
-        inputs=_load_fixture(),
+    if workers > 1:
+        _parallel_test(n_iterations, eval_llm, workers)
+        return
+    _sequential_test(n_iterations, eval_llm)
+
+
+# ---------- parallel iterations --------------------------------------
+def _worker_pool(workers: int, n_iterations: int) -> ProcessPoolExecutor:
+    """Process pool for iterations; human-feedback prompts are serialized."""
+    context = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(
+        max_workers=min(workers, n_iterations),
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(context.Lock(),),
+    )
+
+
+def _init_worker(prompt_lock) -> None:
+    """
+    Give the worker the terminal back (pool workers get /dev/null as stdin)
+    and let only one worker at a time ask for training feedback.
+    """
+    from crewai.agents.crew_agent_executor import CrewAgentExecutor
+
+    setup_event_bus()
+    try:
+        sys.stdin = open("/dev/tty")
+    except OSError:
+        pass
+
+    ask_human_input = CrewAgentExecutor._ask_human_input
+
+    def _serialized_ask_human_input(self, final_answer: str) -> str:
+        with prompt_lock:
+            return ask_human_input(self, final_answer)
+
+    CrewAgentExecutor._ask_human_input = _serialized_ask_human_input
+
+
+@contextmanager
+def _isolated_workdir(iteration: int):
+    """Run one iteration in a scratch directory (pickles, report callbacks)."""
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix=f"aco-iteration-{iteration}-") as workdir:
+        os.chdir(workdir)
+        try:
+            yield
+        finally:
+            os.chdir(previous)
+
+
+def _train_iteration(iteration: int, inputs: dict) -> dict:
+    """Worker: one training iteration; returns its data keyed by agent role."""
+    with _isolated_workdir(iteration):
+        crew = AcoReportPocCrew().crew()
+        crew._setup_for_training("trained_agents_data.pkl")
+        crew._train_iteration = iteration
+        crew.kickoff(inputs=inputs)
+        training_data = CrewTrainingHandler(TRAINING_DATA_FILE).load()
+    roles = {str(agent.id): agent.role for agent in crew.agents}
+    return {
+        roles[agent_id]: data
+        for agent_id, data in training_data.items()
+        if agent_id in roles
+    }
+
+
+def _test_iteration(iteration: int, inputs: dict, eval_llm: str) -> dict:
+    """Worker: one evaluated run; returns per-task scores, times and agents."""
+    with _isolated_workdir(iteration):
+        crew = AcoReportPocCrew().crew()
+        evaluator = CrewEvaluator(crew, create_llm(eval_llm))
+        evaluator.set_iteration(iteration)
+        crew.kickoff(inputs=inputs)
+        evaluator.wait_for_evaluations()
+    return {
+        "scores": evaluator.tasks_scores[iteration],
+        "execution_times": evaluator.run_execution_times[iteration],
+        "agents": [sorted(task.processed_by_agents) for task in crew.tasks],
+    }
+
+
+def _sequential_test(n_iterations: int, eval_llm: str) -> None:
+    """
+    Crew.test with the vendored CrewEvaluator, whose evaluations run in the
+    background while the next iteration executes.
+    """
+    crew = AcoReportPocCrew().crew()
+    llm = create_llm(eval_llm)
+    if not llm:
+        raise ValueError("Failed to create LLM instance.")
+    inputs = _load_fixture()
+
+    crewai_event_bus.emit(
+        crew,
+        CrewTestStartedEvent(
+            crew_name=crew.name or "crew",
+            n_iterations=n_iterations,
+            eval_llm=llm,
+            inputs=inputs,
+        ),
     )
+    try:
+        test_crew = crew.copy()
+        evaluator = CrewEvaluator(test_crew, llm)
+        for iteration in range(1, n_iterations + 1):
+            evaluator.set_iteration(iteration)
+            test_crew.kickoff(inputs=inputs)
+        evaluator.wait_for_evaluations()
+        evaluator.print_crew_evaluation_result()
+    except Exception as e:
+        crewai_event_bus.emit(
+            crew, CrewTestFailedEvent(error=str(e), crew_name=crew.name or "crew")
+        )
+        raise
+    crewai_event_bus.emit(crew, CrewTestCompletedEvent(crew_name=crew.name or "crew"))
+
+
+def _parallel_train(n_iterations: int, filename: str, workers: int) -> None:
+    train_crew = AcoReportPocCrew().crew().copy()
+    train_crew._setup_for_training(filename)
+    inputs = _load_fixture()
+
+    with _worker_pool(workers, n_iterations) as pool:
+        futures = [
+            pool.submit(_train_iteration, iteration, inputs)
+            for iteration in range(n_iterations)
+        ]
+        results = [future.result() for future in futures]
+
+    # Same layout a sequential run leaves behind: {agent id: {iteration: data}}
+    agent_ids = {agent.role: str(agent.id) for agent in train_crew.agents}
+    training_data: dict = {}
+    for iteration_data in results:
+        for role, data in iteration_data.items():
+            training_data.setdefault(agent_ids[role], {}).update(data)
+    CrewTrainingHandler(TRAINING_DATA_FILE).save(training_data)
+
+    for agent in train_crew.agents:
+        if training_data.get(str(agent.id)):
+            result = TaskEvaluator(agent).evaluate_training_data(
+                training_data=training_data, agent_id=str(agent.id)
+            )
+            CrewTrainingHandler(filename).save_trained_data(
+                agent_id=str(agent.role), trained_data=result.model_dump()
+            )
+
+
+def _parallel_test(n_iterations: int, eval_llm: str, workers: int) -> None:
+    test_crew = AcoReportPocCrew().crew().copy()
+    inputs = _load_fixture()
+
+    with _worker_pool(workers, n_iterations) as pool:
+        futures = {
+            iteration: pool.submit(_test_iteration, iteration, inputs, eval_llm)
+            for iteration in range(1, n_iterations + 1)
+        }
+        results = {iteration: future.result() for iteration, future in futures.items()}
+
+    evaluator = CrewEvaluator(test_crew, create_llm(eval_llm))
+    for iteration in sorted(results):
+        result = results[iteration]
+        evaluator.tasks_scores[iteration] = result["scores"]
+        evaluator.run_execution_times[iteration] = result["execution_times"]
+        for task, agents in zip(test_crew.tasks, result["agents"]):
+            task.processed_by_agents.update(agents)
+    evaluator.print_crew_evaluation_result()
 
 
 # ---------- rudimentary CLI ------------------------------------------
 if __name__ == "__main__":
+    setup_event_bus()
     if len(sys.argv) == 1 or sys.argv[1] == "run":
         run()
 
-    elif sys.argv[1] == "train" and len(sys.argv) == 4:
-        train(int(sys.argv[2]), sys.argv[3])
+    elif sys.argv[1] == "train" and len(sys.argv) in (4, 5):
+        train(int(sys.argv[2]), sys.argv[3], *map(int, sys.argv[4:]))
 
     elif sys.argv[1] == "replay" and len(sys.argv) == 3:
         replay(sys.argv[2])
 
-    elif sys.argv[1] == "test" and len(sys.argv) == 4:
-        test(int(sys.argv[2]), sys.argv[3])
+    elif sys.argv[1] == "test" and len(sys.argv) in (4, 5):
+        test(int(sys.argv[2]), sys.argv[3], *map(int, sys.argv[4:]))
 
     else:
         print(
             "Usage:\n"
             "  python -m aco_report_poc_crew.debug run\n"
-            "  python -m aco_report_poc_crew.debug train <N> <file>\n"
+            "  python -m aco_report_poc_crew.debug train <N> <file> [workers]\n"
             "  python -m aco_report_poc_crew.debug replay <task_id>\n"
-            "  python -m aco_report_poc_crew.debug test <N> <eval_llm>\n"
+            "  python -m aco_report_poc_crew.debug test <N> <eval_llm> [workers]\n"
         )
\ No newline at end of file
@@ -0,0 +1,179 @@
+"""
+Delta-only LLM responses keyed by JSON Pointer (RFC 6901).
+
+The numbers, flags and layout of every document the crew produces are
+built in Python (``process_payload`` and the skeleton helpers in
+``jsonparser``). The LLM tasks only answer with the narrative strings they
+rewrite, as edits against that skeleton:
+
+    {"/INIT_001/Revenue/metrics/revenue/explanation": "<new text>"}
+
+``delta_guardrail`` builds the task guardrail that applies the edits, validates
+the merged document against its schema and hands the full document on as
+the task's output, so downstream tasks and callbacks see the same JSON as
+before. Output tokens then scale with the text that changed, not with the
+size of the document.
+
+A response that is a whole document instead of edits is accepted too: its
+strings at the editable pointers are taken as the edits.
+"""
+
+import json
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from crewai.tasks.task_output import TaskOutput
+
+from .config import load_schema
+from .partial_regen import count_conversion, parse_json_output
+from .tools import JsonSchemaCheck
+
+# String fields an LLM may rewrite; everything else comes from Python
+NARRATIVE_FIELDS = ("explanation", "summary", "insight_summary")
+
+
+# ---------- JSON Pointer ------------------------------------------------
+def escape_token(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def unescape_token(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def pointer(*tokens: Any) -> str:
+    """``pointer("Top Highlights", 0, "summary")`` → ``/Top Highlights/0/summary``."""
+    return "".join(f"/{escape_token(str(token))}" for token in tokens)
+
+
+def resolve(document: Any, json_pointer: str) -> Any:
+    """The value at ``json_pointer``; raises KeyError / IndexError if absent."""
+    value = document
+    for token in json_pointer.split("/")[1:]:
+        token = unescape_token(token)
+        value = value[int(token)] if isinstance(value, list) else value[token]
+    return value
+
+
+def narrative_slots(
+    document: Any, fields: Iterable[str] = NARRATIVE_FIELDS, prefix: str = ""
+) -> Dict[str, str]:
+    """{pointer: text} of every string under one of ``fields``."""
+    fields = tuple(fields)
+    slots: Dict[str, str] = {}
+    if isinstance(document, dict):
+        items = document.items()
+    elif isinstance(document, list):
+        items = enumerate(document)
+    else:
+        return slots
+    for key, value in items:
+        path = f"{prefix}/{escape_token(str(key))}"
+        if key in fields and isinstance(value, str):
+            slots[path] = value
+        else:
+            slots.update(narrative_slots(value, fields, path))
+    return slots
+
+
+# ---------- merge -------------------------------------------------------
+def edits_from_response(
+    response: Dict[str, Any], editable: Dict[str, str]
+) -> Dict[str, Any]:
+    """
+    The edits of a parsed response: the response itself when it is keyed by
+    pointers, else (a full document) its strings at the editable pointers.
+    """
+    if all(key.startswith("/") for key in response):
+        return response
+    edits: Dict[str, Any] = {}
+    for path in editable:
+        try:
+            edits[path] = resolve(response, path)
+        except (KeyError, IndexError, TypeError, ValueError):
+            continue
+    return edits
+
+
+def apply_edits(
+    skeleton: Dict[str, Any],
+    edits: Dict[str, Any],
+    fields: Iterable[str] = NARRATIVE_FIELDS,
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Apply ``{pointer: text}`` edits to a copy of ``skeleton``.
+
+    Only existing strings under ``fields`` are replaced; the pointers of
+    other edits (unknown paths, numbers, flags, non-string values) are
+    returned as rejected and the skeleton's value is kept.
+    """
+    document = json.loads(json.dumps(skeleton))
+    editable = narrative_slots(document, fields)
+    rejected: List[str] = []
+    for path, text in edits.items():
+        if path not in editable or not isinstance(text, str) or not text.strip():
+            rejected.append(path)
+            continue
+        *parent_path, last = path.split("/")
+        parent = resolve(document, "/".join(parent_path))
+        key = int(unescape_token(last)) if isinstance(parent, list) else unescape_token(last)
+        parent[key] = text.strip()
+    return document, rejected
+
+
+def _schema_issues(document: Dict[str, Any], schema: str) -> List[str]:
+    return JsonSchemaCheck()._run(json_to_validate=document, schema=load_schema(schema))
+
+
+# ---------- guardrail ---------------------------------------------------
+def delta_guardrail(
+    skeleton: Callable[[], Dict[str, Any]],
+    schema: str,
+    fields: Iterable[str] = NARRATIVE_FIELDS,
+    on_merged: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Callable[[TaskOutput], Tuple[bool, Any]]:
+    """
+    Task guardrail that merges a delta response into a skeleton.
+
+    On success the task's raw output becomes the merged document. Schema
+    issues the skeleton already has (e.g. the dimension subset sent by a
+    partial regeneration) are not the LLM's to fix and do not fail it;
+    any new issue, or a response without a JSON object, is sent back to
+    the agent for a retry. (crewai inspects the guardrail's source, so this
+    returns a plain function rather than a callable object.)
+
+    Args:
+        skeleton: Returns the deterministic document at guardrail time.
+        schema: Name of the schema (``config.load_schema``) the result must
+            satisfy.
+        fields: Narrative fields the response may rewrite.
+        on_merged: Receives the merged document (e.g. to build the next
+            task's skeleton).
+    """
+    fields = tuple(fields)
+
+    def guardrail(output: TaskOutput) -> Tuple[bool, Any]:
+        response = parse_json_output(output.raw)
+        if response is None:
+            count_conversion("guardrail_retry")
+            return False, (
+                'Return only a JSON object of edits, {"<JSON pointer>": "<new text>"}, '
+                "or {} when nothing needs rewriting."
+            )
+        base = skeleton()
+        edits = edits_from_response(response, narrative_slots(base, fields))
+        document, rejected = apply_edits(base, edits, fields)
+        if rejected:
+            print(
+                f"Delta response: ignored {len(rejected)} edit(s) not matching an "
+                f"editable {'/'.join(fields)} string: {', '.join(rejected[:5])}"
+            )
+        known = set(_schema_issues(base, schema))
+        issues = [i for i in _schema_issues(document, schema) if i not in known]
+        if issues:
+            count_conversion("guardrail_retry")
+            return False, "; ".join(issues)
+        if on_merged:
+            on_merged(document)
+        return True, json.dumps(document, ensure_ascii=False, indent=2)
+
+    return guardrail
@@ -0,0 +1,103 @@
+"""
+Startup setup of crewai's event bus.
+
+crewai, its listeners and this app all emit to crewai's ``crewai_event_bus``
+singleton. ``setup_event_bus()`` upgrades that instance in place to the
+vendored ``CrewAIEventsBus``, so every emit in the process resolves its
+handlers through the per-class dispatch cache instead of an ``isinstance``
+scan over every registered event type, and optionally moves handler
+execution (console rendering, telemetry, tracing) to a background thread.
+
+It also replaces crewai's own console listener with the vendored
+``EventListener``: telemetry handlers are always registered, the rich
+console handlers only when not headless (``CREWAI_HEADLESS=1`` for
+production workers builds no console trees at all). Streamed LLM output
+is kept in bounded per-call buffers in every mode; ``stream_metrics()``
+reports their peak size for the last kickoff.
+
+Usage:
+    from aco_report_poc_crew.event_bus import setup_event_bus
+    setup_event_bus()  # once, before the first kickoff
+
+Environment:
+    CREWAI_HEADLESS        1/true/yes/on: no console listener
+    CREW_EVENT_DISPATCH    inline (default) | background
+    CREW_EVENT_QUEUE_SIZE  pending events before the overflow policy applies (10000)
+    CREW_EVENT_OVERFLOW    block (default) | drop_oldest | drop_by_type
+                           (drop_by_type only discards LLM stream chunks)
+
+Inline stays the default: crewai's handlers are cheap and share the GIL with
+the crew, so on the stub benchmark the background thread adds kickoff
+latency. It only pays off when handlers block on I/O (slow terminals,
+remote trace exporters); compare with ``bench --event-dispatch``.
+"""
+
+import os
+from typing import Dict, Optional
+
+from crewai.utilities.events.llm_events import LLMStreamChunkEvent
+
+from .utilities.events.background_dispatcher import OverflowPolicy
+from .utilities.events.crewai_event_bus import CrewAIEventsBus
+from .utilities.events.event_listener import EventListener
+
+DISPATCH_ENV_VAR = "CREW_EVENT_DISPATCH"
+QUEUE_SIZE_ENV_VAR = "CREW_EVENT_QUEUE_SIZE"
+OVERFLOW_ENV_VAR = "CREW_EVENT_OVERFLOW"
+DISPATCH_MODES = ("inline", "background")
+
+
+def setup_event_bus(
+    dispatch: Optional[str] = None, headless: Optional[bool] = None
+) -> CrewAIEventsBus:
+    """
+    Install the cached dispatch on crewai's bus, pick the dispatch mode and
+    swap crewai's console listener for the vendored one.
+
+    Args:
+        dispatch: ``inline`` or ``background``; defaults to ``CREW_EVENT_DISPATCH``.
+        headless: Skip console rendering; defaults to ``CREWAI_HEADLESS``.
+
+    Returns:
+        CrewAIEventsBus: crewai's bus singleton, upgraded.
+    """
+    bus = CrewAIEventsBus.install()
+    EventListener.replace_crewai_listener(headless)
+    mode = (dispatch or os.getenv(DISPATCH_ENV_VAR) or "inline").strip().lower()
+    if mode not in DISPATCH_MODES:
+        raise ValueError(f"{DISPATCH_ENV_VAR} must be one of {DISPATCH_MODES}, got {mode!r}")
+
+    if mode == "inline":
+        bus.stop_background_dispatch()
+    elif bus.dispatcher is None:
+        bus.start_background_dispatch(
+            max_queue_size=int(os.getenv(QUEUE_SIZE_ENV_VAR, "10000")),
+            overflow_policy=OverflowPolicy(os.getenv(OVERFLOW_ENV_VAR, "block")),
+            droppable_event_types=(LLMStreamChunkEvent,),
+        )
+    return bus
+
+
+def stream_metrics() -> Dict[str, int]:
+    """LLM stream buffer metrics of the last kickoff (empty before setup)."""
+    listener = EventListener._instance
+    return listener.run_metrics if listener is not None else {}
+
+
+def reset_stream_metrics() -> None:
+    listener = EventListener._instance
+    if listener is not None:
+        listener.reset_metrics()
+
+
+def dispatch_metrics(bus: CrewAIEventsBus) -> dict:
+    """Dispatch mode and events dropped by the overflow policy, per event type."""
+    dispatcher = bus.dispatcher
+    if dispatcher is None:
+        return {"mode": "inline", "dropped": {}}
+    return {
+        "mode": "background",
+        "queue_size": dispatcher.max_queue_size,
+        "overflow_policy": dispatcher.overflow_policy.value,
+        "dropped": dict(dispatcher.dropped),
+    }
@@ -50,6 +50,27 @@ METRIC_CODES = [
 ]
 
 
+DIMENSIONS = ["Traffic", "Engagement", "Conversions", "Revenue"]
+
+# Dimension of each KPI when no initiative metadata covers it (NO_INITIATIVE)
+DEFAULT_METRIC_DIMENSIONS = {
+    "unique_visitors": "Traffic",
+    "bounce_rate": "Engagement",
+    "search_conversion_rate": "Engagement",
+    "conversion_rate": "Conversions",
+    "revenue": "Revenue",
+}
+
+
+def metric_dimensions(initiatives: List[Dict[str, Any]]) -> Dict[str, str]:
+    """{metric_code: dimension} from the initiatives' metrics[], defaults first."""
+    mapping = dict(DEFAULT_METRIC_DIMENSIONS)
+    for init in initiatives:
+        for metric in init.get("metrics", []):
+            mapping[metric["metric_code"]] = metric["dimension"]
+    return mapping
+
+
 def _pivot(rows: List[Dict[str, Any]]) -> Dict[str, MetricArray]:
     """Turn list-of-dict rows into {metric: [values…]} for METRIC_CODES."""
     return {
@@ -62,6 +83,27 @@ def _mean(values: MetricArray) -> float:
     return stats.mean(values) if values else 0.0
 
 
+def _group_by_dimension(metrics: Dict[str, Any],
+                        dimension_of: Dict[str, str]) -> Dict[str, Any]:
+    """
+    {metric: rec} → {dimension: {"metrics": {metric: rec}}}, all DIMENSIONS.
+    A metric whose dimension is missing or not one of DIMENSIONS falls back
+    to DEFAULT_METRIC_DIMENSIONS; metrics without any known dimension are
+    left out (with a warning) rather than failing the report.
+    """
+    grouped: Dict[str, Any] = {dim: {"metrics": {}} for dim in DIMENSIONS}
+    for m, rec in metrics.items():
+        dimension = dimension_of.get(m)
+        if dimension not in grouped:
+            dimension = DEFAULT_METRIC_DIMENSIONS.get(m)
+        if dimension is None:
+            print(f"Skipping metric '{m}': unknown dimension "
+                  f"'{dimension_of.get(m)}' (expected one of {', '.join(DIMENSIONS)})")
+            continue
+        grouped[dimension]["metrics"][m] = rec
+    return grouped
+
+
 # --------------------------------------------------------------------------
 # 3)  ――――  top-level processing
 # --------------------------------------------------------------------------
@@ -69,7 +111,9 @@ def _mean(values: MetricArray) -> float:
 def process_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
     """
     Main entry point.
-    Returns the nested report structure described in the prompt.
+    Returns the analyzer_insights structure (one block per initiative, or
+    NO_INITIATIVE, with its KPIs grouped by dimension) plus the
+    ``initiatives`` list the analyzer draws its extra context from.
     """
     # ---------- basic prep ---------- #
     start = datetime.fromisoformat(payload["start_date"])
@@ -104,9 +148,19 @@ def process_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
     # ------------------------------------------------------------------
     if not initiatives:        # -------- NO_INITIATIVE fallback -------- #
         init_id = "NO_INITIATIVE"
+        no_init_metrics = {
+            m: {
+                "current_avg": rec["current_avg"],
+                "change": rec["change"],
+                "initiative_sig": False,
+                "overall_sig": rec["overall_sig"],
+            }
+            for m, rec in overall.items()
+        }
         output[init_id] = {
             "initiative_name": "No Initiative",
-            "overall": {"metrics": _enrich(overall, init_id, True)}
+            **_group_by_dimension(_enrich(no_init_metrics, init_id, True),
+                                  DEFAULT_METRIC_DIMENSIONS),
         }
     else:                      # -------------- per-initiative --------- #
         for init in initiatives:
@@ -142,8 +196,8 @@ def process_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
             if init_metrics:
                 output[init_id] = {
                     "initiative_name": init_name,
-                    "overall": {"metrics":
-                                _enrich(init_metrics, init_id, False)}
+                    **_group_by_dimension(_enrich(init_metrics, init_id, False),
+                                          metric_dimensions([init])),
                 }
 
     # --------------------------------------------------------------
@@ -205,6 +259,157 @@ def _enrich(metrics_dict: Dict[str, Any],
     return metrics_dict
 
 
+def analyzer_insights(processed: Dict[str, Any]) -> Dict[str, Any]:
+    """The analyzer_insights document of a processed payload (a deep copy)."""
+    return json.loads(json.dumps(
+        {k: v for k, v in processed.items() if k != "initiatives"}
+    ))
+
+
+# --------------------------------------------------------------------------
+# 5)  ――――  highlight ranking
+# --------------------------------------------------------------------------
+
+def _change_pct(change: str) -> float:
+    return float(change.rstrip("%"))
+
+
+def select_top_highlights(processed: Dict[str, Any],
+                          limit: int = 3,
+                          minimum: int = 2) -> List[Dict[str, Any]]:
+    """
+    Pick the report's top highlights from the processed payload.
+
+    Ranking: overall_sig first, then |change|, then the initiative's
+    importance_rank (1 = most important). At most one highlight per
+    dimension. Significant KPIs fill up to ``limit`` slots; if fewer than
+    ``minimum`` are significant the largest remaining changes fill in.
+    Each record carries what the summary sentence may draw on.
+    """
+    initiatives = processed.get("initiatives", [])
+    meta = {
+        init["initiative_id"]: {m["metric_code"]: m for m in init.get("metrics", [])}
+        for init in initiatives
+    }
+
+    candidates = []
+    for init_id, block in processed.items():
+        if init_id == "initiatives":
+            continue
+        for dimension in DIMENSIONS:
+            # partial regeneration sends only the changed dimensions
+            for m, rec in block.get(dimension, {"metrics": {}})["metrics"].items():
+                info = meta.get(init_id, {}).get(m, {})
+                candidates.append({
+                    "dimension": dimension,
+                    "metric": m,
+                    "metric_label": info.get("metric_label",
+                                             m.replace("_", " ").title()),
+                    "change": rec["change"],
+                    "current_avg": rec["current_avg"],
+                    "initiative_id": init_id,
+                    "initiative_name": block["initiative_name"],
+                    "overall_sig": rec["overall_sig"],
+                    "initiative_sig": rec["initiative_sig"],
+                    "importance_rank": info.get("importance_rank", 99),
+                    "impact_note": info.get("impact_note", ""),
+                    "explanation": rec.get("explanation", ""),
+                })
+    candidates.sort(key=lambda c: (not c["overall_sig"],
+                                   -abs(_change_pct(c["change"])),
+                                   c["importance_rank"],
+                                   DIMENSIONS.index(c["dimension"]),
+                                   c["metric"]))
+
+    picked: List[Dict[str, Any]] = []
+    dimensions = set()
+    for c in candidates:
+        enough = len(picked) >= (limit if c["overall_sig"] else minimum)
+        if enough or c["dimension"] in dimensions:
+            continue
+        picked.append(c)
+        dimensions.add(c["dimension"])
+    return picked
+
+
+# --------------------------------------------------------------------------
+# 6)  ――――  report skeleton (narratives are rewritten by the story tasks)
+# --------------------------------------------------------------------------
+
+NO_INITIATIVE_SIG_SENTENCE = (
+    "Change may be due to ongoing impact from earlier initiatives or external "
+    "factors. Consider expanding the date window."
+)
+NO_INITIATIVE_FLAT_SENTENCE = (
+    "The change is very small (statistically) and falls within the usual "
+    "range, so it's not meaningful."
+)
+METRIC_SOURCE = "Storefront Events"
+
+
+def highlight_entries(records: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """"Top Highlights" items for select_top_highlights records."""
+    entries = []
+    for rec in records:
+        if rec["initiative_id"] == "NO_INITIATIVE":
+            summary = (NO_INITIATIVE_SIG_SENTENCE if rec["overall_sig"]
+                       else NO_INITIATIVE_FLAT_SENTENCE)
+        else:
+            summary = (f"{rec['metric_label']} moved {rec['change']} "
+                       f"after {rec['initiative_name']}.")
+        entries.append({
+            "dimension": rec["dimension"],
+            "metric": rec["metric"],
+            "change": rec["change"],
+            "summary": summary,
+        })
+    return entries
+
+
+def _attribution(rec: Dict[str, Any]) -> Tuple[bool, float]:
+    return rec.get("initiative_sig", False), abs(_change_pct(rec["change"]))
+
+
+def dimension_pages(insights: Dict[str, Any],
+                    last_updated: str) -> Dict[str, Any]:
+    """
+    stories_data dimension pages from analyzer_insights: each KPI with its
+    explanation, plus a placeholder insight_summary (the fixed sentences
+    for NO_INITIATIVE reports).
+
+    A KPI reported by several initiatives appears once: the record
+    attributed to its initiative (initiative_sig) wins, then the larger
+    |change|, then the earlier initiative.
+    """
+    no_initiative = list(insights) == ["NO_INITIATIVE"]
+    pages: Dict[str, Any] = {}
+    for dim in DIMENSIONS:
+        chosen: Dict[str, Any] = {}
+        significant = False
+        for block in insights.values():
+            for m, rec in block.get(dim, {"metrics": {}})["metrics"].items():
+                significant = significant or rec["overall_sig"]
+                if m not in chosen or _attribution(rec) > _attribution(chosen[m]):
+                    chosen[m] = rec
+        metrics: Dict[str, Any] = {}
+        for m, rec in chosen.items():
+            metrics[m] = {
+                "current_avg": rec["current_avg"],
+                "change": rec["change"],
+                "explanation": rec["explanation"],
+                "last_updated": last_updated,
+                "source": METRIC_SOURCE,
+            }
+        if no_initiative:
+            summary = (NO_INITIATIVE_SIG_SENTENCE if significant
+                       else NO_INITIATIVE_FLAT_SENTENCE)
+        else:
+            changes = ", ".join(f"{m} {rec['change']}" for m, rec in metrics.items())
+            summary = f"{dim} over the selected window: {changes}."
+        pages[dim] = {"insight_summary": summary, "metrics": metrics}
+    return pages
+
+
 # if __name__ == "__main__":
 #     fixture_path = Path(__file__).parent / "data" / "test_data1.json"
 #     if not fixture_path.exists():
@@ -0,0 +1,17 @@
+"""
+Opt-in crew event listeners of this app.
+
+Kept outside the vendored ``utilities.events`` package: importing that
+package pulls in its console listener, while these only touch crewai's
+event bus once one of them is created.
+"""
+
+from .profiling_listener import ProfilingListener, profiling_from_env
+from .trace_listener import TraceListener, tracing_from_env
+
+__all__ = [
+    "ProfilingListener",
+    "TraceListener",
+    "profiling_from_env",
+    "tracing_from_env",
+]
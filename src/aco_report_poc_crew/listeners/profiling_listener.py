@@ -0,0 +1,289 @@
+import cProfile
+import io
+import os
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Hashable, List, Optional
+
+from crewai.utilities.events.base_event_listener import BaseEventListener
+from crewai.utilities.events.crew_events import (
+    CrewKickoffCompletedEvent,
+    CrewKickoffFailedEvent,
+    CrewKickoffStartedEvent,
+)
+from crewai.utilities.events.task_events import (
+    TaskCompletedEvent,
+    TaskFailedEvent,
+    TaskStartedEvent,
+)
+from crewai.utilities.events.tool_usage_events import (
+    ToolUsageErrorEvent,
+    ToolUsageFinishedEvent,
+    ToolUsageStartedEvent,
+)
+
+from ..event_bus import stream_metrics
+from ..utilities.events.utils.headless import env_flag
+
+PROFILE_ENV_VAR = "CREW_PROFILE"
+PROFILE_DIR_ENV_VAR = "CREW_PROFILE_DIR"
+
+
+@dataclass
+class ProfileSpan:
+    """cProfile + tracemalloc capture of one task or tool call."""
+
+    name: str
+    category: str
+    profiler: cProfile.Profile
+    snapshot: Optional[tracemalloc.Snapshot]
+    start: float
+    wall_ms: float = 0.0
+    peak_kib: float = 0.0
+    status: str = "ok"
+    children: List["ProfileSpan"] = field(default_factory=list)
+
+
+class ProfilingListener(BaseEventListener):
+    """
+    Opt-in per-task (and per tool call) cProfile and tracemalloc capture.
+
+    Handlers are only registered once the listener is created, so runs that
+    never create one pay nothing. For each task it writes
+    ``<task>.prof`` (open with ``python -m pstats`` or snakeviz) and
+    ``<task>.alloc.txt`` (top-N allocation growth by line plus the traced
+    peak) into ``crew_profile_<UTC timestamp>/`` under ``output_dir``, and
+    prints a summary table, with the run's LLM stream buffer metrics, when
+    the crew finishes.
+
+    cProfile allows one active profiler per thread, so a tool call pauses
+    its task's profiler and runs its own. The task's ``.prof`` file includes
+    the tool profiles again, so it covers the whole task.
+
+    Usage:
+        ProfilingListener(output_dir=".")
+        AcoReportPocCrew().crew().kickoff(inputs=...)
+
+    Args:
+        output_dir: Directory that receives one profile folder per kickoff.
+        top_n: Allocation sites listed per task / tool call.
+        trace_frames: Frames tracemalloc keeps per allocation.
+    """
+
+    def __init__(self, output_dir: str = ".", top_n: int = 25, trace_frames: int = 1):
+        self.output_dir = Path(output_dir)
+        self.top_n = top_n
+        self.trace_frames = trace_frames
+        self.last_profile_dir: Optional[Path] = None
+        self._lock = threading.Lock()
+        self._reset()
+        super().__init__()
+
+    def _reset(self) -> None:
+        self._open: Dict[Hashable, ProfileSpan] = {}
+        self._thread_stacks: Dict[int, List[ProfileSpan]] = {}
+        self._finished: List[ProfileSpan] = []
+        self._run_dir: Optional[Path] = None
+        self._written = 0
+        self._started_tracemalloc = False
+
+    # ----------- capture -----------
+
+    def _start(self, key: Hashable, name: str, category: str) -> None:
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self.trace_frames)
+                self._started_tracemalloc = True
+            stack = self._thread_stacks.setdefault(threading.get_ident(), [])
+            if stack:
+                stack[-1].profiler.disable()
+                _record_peak(stack[-1])
+            tracemalloc.reset_peak()
+            span = ProfileSpan(
+                name=name,
+                category=category,
+                profiler=cProfile.Profile(),
+                snapshot=tracemalloc.take_snapshot(),
+                start=time.perf_counter(),
+            )
+            stack.append(span)
+            self._open[key] = span
+        span.profiler.enable()
+
+    def _end(self, key: Hashable, status: str = "ok") -> None:
+        with self._lock:
+            span = self._open.pop(key, None)
+            if span is None:
+                return
+            span.profiler.disable()
+            span.wall_ms = (time.perf_counter() - span.start) * 1000
+            _record_peak(span)
+            span.status = status
+            stack = self._thread_stacks.get(threading.get_ident(), [])
+            if span in stack:
+                stack.remove(span)
+            self._write(span)
+            if stack:
+                parent = stack[-1]
+                parent.children.append(span)
+                parent.peak_kib = max(parent.peak_kib, span.peak_kib)
+                parent.profiler.enable()
+            else:
+                self._finished.append(span)
+
+    def _finish_run(self) -> None:
+        with self._lock:
+            for span in self._open.values():
+                span.profiler.disable()
+            spans = self._finished
+            run_dir = self._run_dir
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+            self._reset()
+        self.last_profile_dir = run_dir
+        if spans:
+            print(self.summary(spans, run_dir, stream_metrics()))
+
+    # ----------- export -----------
+
+    def _write(self, span: ProfileSpan) -> None:
+        if self._run_dir is None:
+            timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+            self._run_dir = self.output_dir / f"crew_profile_{timestamp}"
+            self._run_dir.mkdir(parents=True, exist_ok=True)
+        self._written += 1
+        stem = self._run_dir / f"{self._written:02d}_{span.category}_{_slug(span.name)}"
+
+        stats = pstats.Stats(span.profiler)
+        for child in span.children:
+            stats.add(child.profiler)
+        stats.dump_stats(f"{stem}.prof")
+
+        lines = [
+            f"{span.category} {span.name}: {span.wall_ms:.1f} ms, "
+            f"traced peak {span.peak_kib:.1f} KiB, status {span.status}",
+            f"top {self.top_n} allocation growth by line:",
+        ]
+        if span.snapshot is not None:
+            current = tracemalloc.take_snapshot()
+            for diff in current.compare_to(span.snapshot, "lineno")[: self.top_n]:
+                lines.append(f"  {diff}")
+            span.snapshot = None
+        Path(f"{stem}.alloc.txt").write_text("\n".join(lines) + "\n")
+
+    @staticmethod
+    def summary(
+        spans: List[ProfileSpan],
+        run_dir: Optional[Path],
+        stream_metrics: Optional[Dict[str, int]] = None,
+    ) -> str:
+        out = io.StringIO()
+        out.write(f"\nProfiles written to {run_dir}\n")
+        out.write(f"{'task / tool':<48}{'wall ms':>10}{'peak KiB':>11}  hottest (self time)\n")
+        for span in spans:
+            rows = [(span, "")] + [(child, "  ") for child in span.children]
+            for item, indent in rows:
+                out.write(
+                    f"{(indent + item.name)[:47]:<48}{item.wall_ms:>10.1f}"
+                    f"{item.peak_kib:>11.1f}  {_hottest(item)}\n"
+                )
+        if stream_metrics:
+            out.write(
+                "LLM streams: "
+                + ", ".join(f"{key} {value}" for key, value in stream_metrics.items())
+                + "\n"
+            )
+        return out.getvalue()
+
+    # ----------- listeners -----------
+
+    def setup_listeners(self, crewai_event_bus):
+        @crewai_event_bus.on(CrewKickoffStartedEvent)
+        def on_crew_started(source, event: CrewKickoffStartedEvent):
+            with self._lock:
+                self._run_dir = None
+                self._written = 0
+
+        @crewai_event_bus.on(CrewKickoffCompletedEvent)
+        def on_crew_completed(source, event: CrewKickoffCompletedEvent):
+            self._finish_run()
+
+        @crewai_event_bus.on(CrewKickoffFailedEvent)
+        def on_crew_failed(source, event: CrewKickoffFailedEvent):
+            self._finish_run()
+
+        # ----------- TASK -----------
+
+        def task_key(source, event):
+            task = event.task or source
+            return ("task", str(getattr(task, "id", id(task))))
+
+        @crewai_event_bus.on(TaskStartedEvent)
+        def on_task_started(source, event: TaskStartedEvent):
+            task = event.task or source
+            name = getattr(task, "name", None) or str(
+                getattr(task, "description", "Task")
+            )[:60]
+            self._start(task_key(source, event), name, "task")
+
+        @crewai_event_bus.on(TaskCompletedEvent)
+        def on_task_completed(source, event: TaskCompletedEvent):
+            self._end(task_key(source, event))
+
+        @crewai_event_bus.on(TaskFailedEvent)
+        def on_task_failed(source, event: TaskFailedEvent):
+            self._end(task_key(source, event), "failed")
+
+        # ----------- TOOL USAGE -----------
+
+        def tool_key(event):
+            return ("tool", event.agent_key, event.tool_name)
+
+        @crewai_event_bus.on(ToolUsageStartedEvent)
+        def on_tool_started(source, event: ToolUsageStartedEvent):
+            self._start(tool_key(event), event.tool_name, "tool")
+
+        @crewai_event_bus.on(ToolUsageFinishedEvent)
+        def on_tool_finished(source, event: ToolUsageFinishedEvent):
+            self._end(tool_key(event))
+
+        @crewai_event_bus.on(ToolUsageErrorEvent)
+        def on_tool_error(source, event: ToolUsageErrorEvent):
+            self._end(tool_key(event), "failed")
+
+
+def profiling_from_env() -> Optional[ProfilingListener]:
+    """
+    A ``ProfilingListener`` when ``CREW_PROFILE`` is set to a truthy value,
+    writing under ``CREW_PROFILE_DIR`` (default: the working directory).
+    """
+    if not env_flag(PROFILE_ENV_VAR):
+        return None
+    return ProfilingListener(output_dir=os.getenv(PROFILE_DIR_ENV_VAR, "."))
+
+
+def _record_peak(span: ProfileSpan) -> None:
+    """Fold the traced peak since the last reset into ``span``."""
+    span.peak_kib = max(span.peak_kib, tracemalloc.get_traced_memory()[1] / 1024)
+
+
+def _slug(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_")[:60] or "unnamed"
+
+
+def _hottest(span: ProfileSpan) -> str:
+    stats = pstats.Stats(span.profiler)
+    for child in span.children:
+        stats.add(child.profiler)
+    if not stats.stats:
+        return "-"
+    (filename, line, func), _ = max(stats.stats.items(), key=lambda item: item[1][2])
+    if filename == "~":
+        return func
+    return f"{Path(filename).name}:{line}({func})"
@@ -0,0 +1,391 @@
+import itertools
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Literal, Optional
+
+from crewai.utilities.events.base_event_listener import BaseEventListener
+from crewai.utilities.events.base_events import BaseEvent
+
+from crewai.utilities.events.agent_events import (
+    AgentExecutionCompletedEvent,
+    AgentExecutionErrorEvent,
+    AgentExecutionStartedEvent,
+)
+from crewai.utilities.events.crew_events import (
+    CrewKickoffCompletedEvent,
+    CrewKickoffFailedEvent,
+    CrewKickoffStartedEvent,
+)
+from crewai.utilities.events.llm_events import LLMCallCompletedEvent, LLMCallFailedEvent, LLMCallStartedEvent
+from crewai.utilities.events.llm_guardrail_events import LLMGuardrailCompletedEvent, LLMGuardrailStartedEvent
+from crewai.utilities.events.reasoning_events import (
+    AgentReasoningCompletedEvent,
+    AgentReasoningFailedEvent,
+    AgentReasoningStartedEvent,
+)
+from crewai.utilities.events.task_events import TaskCompletedEvent, TaskFailedEvent, TaskStartedEvent
+from crewai.utilities.events.tool_usage_events import (
+    ToolUsageErrorEvent,
+    ToolUsageFinishedEvent,
+    ToolUsageStartedEvent,
+)
+
+from ..utilities.events.utils.headless import env_flag
+
+TraceFormat = Literal["chrome", "jsonl"]
+
+TRACE_ENV_VAR = "CREW_TRACE"
+TRACE_DIR_ENV_VAR = "CREW_TRACE_DIR"
+TRACE_FORMAT_ENV_VAR = "CREW_TRACE_FORMAT"
+
+
+@dataclass
+class Span:
+    """One timed start/completed pair from the event bus."""
+
+    span_id: int
+    parent_id: Optional[int]
+    name: str
+    category: str
+    start_us: int
+    thread_id: int
+    end_us: Optional[int] = None
+    status: str = "ok"
+    args: Dict[str, Any] = field(default_factory=dict)
+
+
+def _micros(timestamp: datetime) -> int:
+    # Naive event timestamps are local time (datetime.now()); astimezone()
+    # reads them as such and keeps aware ones as they are
+    return int(timestamp.astimezone().timestamp() * 1_000_000)
+
+
+class TraceListener(BaseEventListener):
+    """
+    Turns crew/task/agent/LLM/tool/guardrail/reasoning event pairs into
+    timed spans and writes one trace file per crew kickoff.
+
+    ``fmt="chrome"`` writes Chrome trace-event JSON (open it in
+    chrome://tracing or https://ui.perfetto.dev for a flame chart);
+    ``fmt="jsonl"`` appends one span per line with explicit
+    ``span_id``/``parent_id``. Parents are the innermost span still open on
+    the emitting thread when a span starts.
+
+    Usage:
+        TraceListener(output_path="report_trace.json")
+        AcoReportPocCrew().crew().kickoff(inputs=...)
+
+    Args:
+        output_path: Trace file. Defaults to ``crew_trace_<UTC timestamp>``
+            in ``output_dir``, one file per run.
+        output_dir: Directory of the default trace files, resolved when the
+            listener is created (default: the working directory).
+        fmt: ``"chrome"`` or ``"jsonl"``.
+    """
+
+    def __init__(
+        self,
+        output_path: Optional[str] = None,
+        fmt: TraceFormat = "chrome",
+        output_dir: str = ".",
+    ):
+        if fmt not in ("chrome", "jsonl"):
+            raise ValueError(f"Unsupported trace format: {fmt}")
+        self.output_path = output_path
+        self.output_dir = Path(output_dir).resolve()
+        self.fmt = fmt
+        self.last_trace_path: Optional[Path] = None
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._reset()
+        super().__init__()
+
+    def _reset(self) -> None:
+        self._open: Dict[Hashable, List[Span]] = {}
+        self._thread_stacks: Dict[int, List[Span]] = {}
+        self._finished: List[Span] = []
+
+    # ----------- span bookkeeping -----------
+
+    def _start(
+        self, key: Hashable, name: str, category: str, event: BaseEvent, **args: Any
+    ) -> None:
+        thread_id = threading.get_ident()
+        with self._lock:
+            stack = self._thread_stacks.setdefault(thread_id, [])
+            span = Span(
+                span_id=next(self._ids),
+                parent_id=stack[-1].span_id if stack else None,
+                name=name,
+                category=category,
+                start_us=_micros(event.timestamp),
+                thread_id=thread_id,
+                args={k: v for k, v in args.items() if v is not None},
+            )
+            stack.append(span)
+            self._open.setdefault(key, []).append(span)
+
+    def _end(
+        self, key: Hashable, event: BaseEvent, status: str = "ok", **args: Any
+    ) -> None:
+        with self._lock:
+            spans = self._open.get(key)
+            if not spans:
+                return
+            span = spans.pop()
+            if not spans:
+                del self._open[key]
+            self._close(span, _micros(event.timestamp), status, args)
+
+    def _close(
+        self, span: Span, end_us: int, status: str, args: Dict[str, Any]
+    ) -> None:
+        span.end_us = max(end_us, span.start_us)
+        span.status = status
+        span.args.update({k: v for k, v in args.items() if v is not None})
+        stack = self._thread_stacks.get(span.thread_id, [])
+        if span in stack:
+            stack.remove(span)
+        self._finished.append(span)
+
+    def _finish_run(self, event: BaseEvent) -> None:
+        end_us = _micros(event.timestamp)
+        with self._lock:
+            for spans in self._open.values():
+                for span in spans:
+                    self._close(span, end_us, "unfinished", {})
+            spans = sorted(self._finished, key=lambda s: (s.start_us, s.span_id))
+            self._reset()
+        self.last_trace_path = self._write(spans)
+
+    # ----------- export -----------
+
+    def _resolve_path(self) -> Path:
+        if self.output_path:
+            return Path(self.output_path)
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        suffix = "json" if self.fmt == "chrome" else "jsonl"
+        return self.output_dir / f"crew_trace_{timestamp}.{suffix}"
+
+    def _write(self, spans: List[Span]) -> Path:
+        path = self._resolve_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if self.fmt == "chrome":
+            path.write_text(json.dumps(self._chrome_trace(spans), default=str))
+        else:
+            with path.open("a", encoding="utf-8") as f:
+                for span in spans:
+                    f.write(json.dumps(self._jsonl_record(span), default=str))
+                    f.write("\n")
+        return path
+
+    @staticmethod
+    def _chrome_trace(spans: List[Span]) -> Dict[str, Any]:
+        origin = spans[0].start_us if spans else 0
+        pid = os.getpid()
+        return {
+            "displayTimeUnit": "ms",
+            "traceEvents": [
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": span.start_us - origin,
+                    "dur": span.end_us - span.start_us,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": {
+                        "span_id": span.span_id,
+                        "parent_id": span.parent_id,
+                        "status": span.status,
+                        **span.args,
+                    },
+                }
+                for span in spans
+            ],
+        }
+
+    @staticmethod
+    def _jsonl_record(span: Span) -> Dict[str, Any]:
+        start = datetime.fromtimestamp(span.start_us / 1_000_000, tz=timezone.utc)
+        return {
+            "span_id": span.span_id,
+            "parent_id": span.parent_id,
+            "name": span.name,
+            "category": span.category,
+            "start": start.isoformat(),
+            "duration_ms": (span.end_us - span.start_us) / 1000,
+            "status": span.status,
+            "thread_id": span.thread_id,
+            "attributes": span.args,
+        }
+
+    # ----------- listeners -----------
+
+    def setup_listeners(self, crewai_event_bus):
+        def crew_key(source):
+            return ("crew", str(getattr(source, "id", id(source))))
+
+        @crewai_event_bus.on(CrewKickoffStartedEvent)
+        def on_crew_started(source, event: CrewKickoffStartedEvent):
+            self._start(crew_key(source), event.crew_name or "Crew", "crew", event)
+
+        @crewai_event_bus.on(CrewKickoffCompletedEvent)
+        def on_crew_completed(source, event: CrewKickoffCompletedEvent):
+            self._end(crew_key(source), event)
+            self._finish_run(event)
+
+        @crewai_event_bus.on(CrewKickoffFailedEvent)
+        def on_crew_failed(source, event: CrewKickoffFailedEvent):
+            self._end(crew_key(source), event, "failed", error=event.error)
+            self._finish_run(event)
+
+        # ----------- TASK -----------
+
+        def task_key(source, event):
+            task = event.task or source
+            return ("task", str(getattr(task, "id", id(task))))
+
+        @crewai_event_bus.on(TaskStartedEvent)
+        def on_task_started(source, event: TaskStartedEvent):
+            task = event.task or source
+            name = getattr(task, "name", None) or str(
+                getattr(task, "description", "Task")
+            )[:60]
+            self._start(task_key(source, event), name, "task", event)
+
+        @crewai_event_bus.on(TaskCompletedEvent)
+        def on_task_completed(source, event: TaskCompletedEvent):
+            self._end(task_key(source, event), event)
+
+        @crewai_event_bus.on(TaskFailedEvent)
+        def on_task_failed(source, event: TaskFailedEvent):
+            self._end(task_key(source, event), event, "failed", error=event.error)
+
+        # ----------- AGENT -----------
+
+        def agent_key(event):
+            return ("agent", str(event.agent.id), str(getattr(event.task, "id", None)))
+
+        @crewai_event_bus.on(AgentExecutionStartedEvent)
+        def on_agent_started(source, event: AgentExecutionStartedEvent):
+            self._start(agent_key(event), event.agent.role, "agent", event)
+
+        @crewai_event_bus.on(AgentExecutionCompletedEvent)
+        def on_agent_completed(source, event: AgentExecutionCompletedEvent):
+            self._end(agent_key(event), event)
+
+        @crewai_event_bus.on(AgentExecutionErrorEvent)
+        def on_agent_error(source, event: AgentExecutionErrorEvent):
+            self._end(agent_key(event), event, "failed", error=event.error)
+
+        # ----------- LLM -----------
+
+        def llm_key(event):
+            return ("llm", event.agent_id and str(event.agent_id), event.task_id)
+
+        @crewai_event_bus.on(LLMCallStartedEvent)
+        def on_llm_started(source, event: LLMCallStartedEvent):
+            self._start(
+                llm_key(event),
+                "llm_call",
+                "llm",
+                event,
+                model=getattr(source, "model", None),
+                agent_role=event.agent_role,
+            )
+
+        @crewai_event_bus.on(LLMCallCompletedEvent)
+        def on_llm_completed(source, event: LLMCallCompletedEvent):
+            self._end(llm_key(event), event, call_type=event.call_type.value)
+
+        @crewai_event_bus.on(LLMCallFailedEvent)
+        def on_llm_failed(source, event: LLMCallFailedEvent):
+            self._end(llm_key(event), event, "failed", error=event.error)
+
+        # ----------- TOOL USAGE -----------
+
+        def tool_key(event):
+            return ("tool", event.agent_key, event.tool_name)
+
+        @crewai_event_bus.on(ToolUsageStartedEvent)
+        def on_tool_started(source, event: ToolUsageStartedEvent):
+            self._start(
+                tool_key(event),
+                event.tool_name,
+                "tool",
+                event,
+                agent_role=event.agent_role,
+                run_attempts=event.run_attempts,
+            )
+
+        @crewai_event_bus.on(ToolUsageFinishedEvent)
+        def on_tool_finished(source, event: ToolUsageFinishedEvent):
+            self._end(tool_key(event), event, from_cache=event.from_cache)
+
+        @crewai_event_bus.on(ToolUsageErrorEvent)
+        def on_tool_error(source, event: ToolUsageErrorEvent):
+            self._end(tool_key(event), event, "failed", error=str(event.error))
+
+        # ----------- GUARDRAIL -----------
+
+        @crewai_event_bus.on(LLMGuardrailStartedEvent)
+        def on_guardrail_started(source, event: LLMGuardrailStartedEvent):
+            self._start(
+                ("guardrail", event.retry_count),
+                "guardrail",
+                "guardrail",
+                event,
+                retry_count=event.retry_count,
+            )
+
+        @crewai_event_bus.on(LLMGuardrailCompletedEvent)
+        def on_guardrail_completed(source, event: LLMGuardrailCompletedEvent):
+            self._end(
+                ("guardrail", event.retry_count),
+                event,
+                "ok" if event.success else "failed",
+                error=event.error,
+            )
+
+        # ----------- REASONING -----------
+
+        def reasoning_key(event):
+            return ("reasoning", event.agent_role, event.task_id, event.attempt)
+
+        @crewai_event_bus.on(AgentReasoningStartedEvent)
+        def on_reasoning_started(source, event: AgentReasoningStartedEvent):
+            self._start(
+                reasoning_key(event),
+                "reasoning",
+                "reasoning",
+                event,
+                agent_role=event.agent_role,
+                attempt=event.attempt,
+            )
+
+        @crewai_event_bus.on(AgentReasoningCompletedEvent)
+        def on_reasoning_completed(source, event: AgentReasoningCompletedEvent):
+            self._end(reasoning_key(event), event, ready=event.ready)
+
+        @crewai_event_bus.on(AgentReasoningFailedEvent)
+        def on_reasoning_failed(source, event: AgentReasoningFailedEvent):
+            self._end(reasoning_key(event), event, "failed", error=event.error)
+
+
+def tracing_from_env() -> Optional[TraceListener]:
+    """
+    A ``TraceListener`` when ``CREW_TRACE`` is set to a truthy value, writing
+    ``CREW_TRACE_FORMAT`` traces (default: chrome) under ``CREW_TRACE_DIR``
+    (default: the working directory).
+    """
+    if not env_flag(TRACE_ENV_VAR):
+        return None
+    return TraceListener(
+        fmt=os.getenv(TRACE_FORMAT_ENV_VAR, "chrome").strip().lower(),
+        output_dir=os.getenv(TRACE_DIR_ENV_VAR, "."),
+    )
@@ -9,13 +9,18 @@ import json
 from pathlib import Path
 from datetime import datetime, timezone
 from dotenv import load_dotenv
+from .event_bus import setup_event_bus, stream_metrics
 from .jsonparser import process_payload
+from .partial_regen import kickoff_partial
+from .report_cache import kickoff_cached
+from .template_report import kickoff_template
 
 
 # Ensure .env variables (Azure key, endpoint) are available
 load_dotenv()
 
 from aco_report_poc_crew.crew import AcoReportPocCrew
+from aco_report_poc_crew.listeners import profiling_from_env, tracing_from_env
 
 
 def run() -> None:
@@ -29,14 +34,38 @@ def run() -> None:
 
     # print(processed_payload)
 
-    result = AcoReportPocCrew().crew().kickoff(
-        inputs={"payload": processed_payload, "fixture_name": fixture_path.stem}
-    )
+    # Cached per-class dispatch on crewai's event bus
+    setup_event_bus()
+    # CREW_PROFILE=1: per-task cProfile/tracemalloc dumps next to the report
+    profiling_from_env()
+    # CREW_TRACE=1: one chrome/jsonl span trace per kickoff
+    tracing_from_env()
+
+    inputs = {"payload": processed_payload, "fixture_name": fixture_path.stem}
+
+    # No initiatives → rendered from templates, no LLM calls (TEMPLATE_REPORTS=0 disables)
+    result = kickoff_template(inputs)
+    if result is None:
+        # Unchanged payload + prompts + model → stored report (REPORT_CACHE=0 disables);
+        # otherwise only slices changed since the last run go to the LLM (PARTIAL_REGEN=0)
+        crew = AcoReportPocCrew().crew()
+        result = kickoff_cached(
+            crew,
+            inputs=inputs,
+            kickoff=lambda inputs: kickoff_partial(
+                crew,
+                inputs,
+                scope=fixture_path.stem,
+                crew_factory=lambda: AcoReportPocCrew().crew(),
+            ),
+        )
 
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
     out_file = Path(f"final_report_{fixture_path.stem}_{timestamp}.txt")
     out_file.write_text(result.raw)
     print(f"Report saved to {out_file}")
+    # Bounded per-call buffers of streamed LLM output (last kickoff)
+    print("LLM streams:", ", ".join(f"{k} {v}" for k, v in stream_metrics().items()))
 
     # Optional: preview part of the JSON
     print("=== Final Report JSON (truncated) ===")
@@ -0,0 +1,63 @@
+"""
+Output-format text for structured tasks, rendered once per model class.
+
+For a task with ``output_json`` / ``output_pydantic``, crewai walks the
+model on every execution: ``Agent.execute_task`` appends
+``generate_model_description(model)`` to the prompt, and each conversion
+fallback rebuilds ``get_conversion_instructions(model, llm)``. Both depend
+only on the model class (and whether the LLM supports function calling).
+``precompute_output_format`` renders them when crew.py builds the task, and
+crewai's two lookups are routed through that table; models that were never
+precomputed fall through to crewai unchanged.
+
+Usage:
+    task = Task(config=..., output_json=StoriesData)
+    precompute_output_format(task.output_json, llm)
+"""
+
+import threading
+from typing import Any, Dict, Tuple, Type
+
+import crewai.agent as crewai_agent
+import crewai.utilities.converter as crewai_converter
+from pydantic import BaseModel
+
+_generate_model_description = crewai_converter.generate_model_description
+_get_conversion_instructions = crewai_converter.get_conversion_instructions
+
+_descriptions: Dict[Type[BaseModel], str] = {}
+_instructions: Dict[Tuple[Type[BaseModel], bool], str] = {}
+_install_lock = threading.Lock()
+_installed = False
+
+
+def _supports_function_calling(llm: Any) -> bool:
+    return bool(llm and not isinstance(llm, str) and llm.supports_function_calling())
+
+
+def generate_model_description(model: Type[BaseModel]) -> str:
+    description = _descriptions.get(model)
+    if description is None:
+        return _generate_model_description(model)
+    return description
+
+
+def get_conversion_instructions(model: Type[BaseModel], llm: Any) -> str:
+    instructions = _instructions.get((model, _supports_function_calling(llm)))
+    if instructions is None:
+        return _get_conversion_instructions(model, llm)
+    return instructions
+
+
+def precompute_output_format(model: Type[BaseModel], llm: Any) -> None:
+    """Render ``model``'s prompt description and conversion instructions."""
+    global _installed
+    _descriptions[model] = _generate_model_description(model)
+    _instructions[(model, _supports_function_calling(llm))] = (
+        _get_conversion_instructions(model, llm)
+    )
+    with _install_lock:
+        if not _installed:
+            crewai_agent.generate_model_description = generate_model_description
+            crewai_converter.get_conversion_instructions = get_conversion_instructions
+            _installed = True
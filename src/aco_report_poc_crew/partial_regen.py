@@ -0,0 +1,352 @@
+"""
+Partial regeneration of a report from its previous run.
+
+Each run of a report scope (e.g. the fixture or merchant name) stores its
+processed payload, analyzer insights and final report. The next run diffs
+the new processed payload against it per initiative and per dimension,
+sends only the dimensions with a changed (initiative, dimension) slice to
+the crew (every initiative's slice of them, so each page summary still
+covers all initiatives), and merges the new analyzer blocks and dimension
+pages with the stored ones for everything that did not change. Top
+highlights are re-ranked over the full payload after the merge. Token
+usage and latency then follow the size of the change instead of the size
+of the report.
+
+A full run happens when there is no previous state, when the prompts,
+model or LLM endpoint changed, when initiatives were removed or the NO_INITIATIVE /
+initiative layout flipped, or when the merged report fails validation.
+
+Environment:
+    PARTIAL_REGEN   – "0"/"false" always runs the full crew (default: on)
+"""
+
+import json
+import os
+import tempfile
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from crewai.crews.crew_output import CrewOutput
+
+from .config import load_schema
+from .jsonparser import DIMENSIONS, highlight_entries, select_top_highlights
+from .report_cache import PARTIAL_STATE_DIR, ReportCache
+from .tools import JsonSchemaCheck
+from .utilities.converter import iter_json_objects
+
+PARTIAL_REGEN_ENV_VAR = "PARTIAL_REGEN"
+ANALYZER_TASK = "analyze_impact_attribution_task"
+
+Slice = Tuple[str, str]  # (initiative id, dimension)
+
+
+# ---------- slicing / diff ---------------------------------------------
+def slice_payload(processed: Dict[str, Any]) -> Dict[Slice, Dict[str, Any]]:
+    """
+    Split a processed payload into (initiative, dimension) slices.
+
+    A slice holds the metrics of that dimension plus the initiative's name
+    and metric metadata (labels, impact notes), i.e. everything the
+    analyzer's text for that slice depends on.
+    """
+    metadata = {
+        init["initiative_id"]: {m["metric_code"]: m for m in init.get("metrics", [])}
+        for init in processed.get("initiatives", [])
+    }
+    slices: Dict[Slice, Dict[str, Any]] = {}
+    for init_id, block in processed.items():
+        if init_id == "initiatives":
+            continue
+        for dimension in DIMENSIONS:
+            metrics = block[dimension]["metrics"]
+            if not metrics:
+                continue
+            slices[(init_id, dimension)] = {
+                "initiative_name": block["initiative_name"],
+                "metrics": {
+                    code: {**metric, "metadata": metadata.get(init_id, {}).get(code)}
+                    for code, metric in metrics.items()
+                },
+            }
+    return slices
+
+
+def changed_slices(
+    previous: Dict[str, Any], current: Dict[str, Any]
+) -> Optional[Set[Slice]]:
+    """
+    Slices of ``current`` that are new or differ from ``previous``.
+
+    Returns None when the change cannot be expressed as slices (removed
+    slices, or a switch between NO_INITIATIVE and initiative reports).
+    """
+    old, new = slice_payload(previous), slice_payload(current)
+    if set(old) - set(new):
+        return None
+    if ("NO_INITIATIVE" in previous) != ("NO_INITIATIVE" in current):
+        return None
+    return {key for key, value in new.items() if old.get(key) != value}
+
+
+def reduce_payload(processed: Dict[str, Any], changed: Set[Slice]) -> Dict[str, Any]:
+    """
+    The processed payload restricted to the dimensions with a changed
+    slice, with every initiative's metrics for them; dimensions that did
+    not change are left out of each block.
+    """
+    changed_dimensions = {dimension for _, dimension in changed}
+    reduced: Dict[str, Any] = {}
+    for init_id, block in processed.items():
+        if init_id == "initiatives":
+            continue
+        dimensions = {
+            dimension: block[dimension]
+            for dimension in DIMENSIONS
+            if dimension in changed_dimensions and block[dimension]["metrics"]
+        }
+        if dimensions:
+            reduced[init_id] = {"initiative_name": block["initiative_name"], **dimensions}
+    reduced["initiatives"] = [
+        init for init in processed.get("initiatives", [])
+        if init["initiative_id"] in reduced
+    ]
+    return reduced
+
+
+# ---------- merge ------------------------------------------------------
+def merge_analyzer(
+    previous: Dict[str, Any], partial: Dict[str, Any],
+    processed: Dict[str, Any], changed: Set[Slice],
+) -> Dict[str, Any]:
+    """Stored analyzer blocks for unchanged dimensions, new ones for changed."""
+    changed_dimensions = {dimension for _, dimension in changed}
+    merged: Dict[str, Any] = {}
+    for init_id, block in processed.items():
+        if init_id == "initiatives":
+            continue
+        merged[init_id] = {"initiative_name": block["initiative_name"]}
+        for dimension in DIMENSIONS:
+            source = partial if dimension in changed_dimensions else previous
+            merged[init_id][dimension] = (
+                source.get(init_id, {}).get(dimension)
+                or previous.get(init_id, {}).get(dimension)
+                or {"metrics": {}}
+            )
+    return merged
+
+
+def merge_report(
+    previous: Dict[str, Any], partial: Dict[str, Any],
+    reduced: Dict[str, Any], changed: Set[Slice],
+    processed: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Dimension pages: stored pages for untouched dimensions; for changed
+    ones the new page, keeping the stored entries of metrics that were not
+    regenerated. Top highlights are re-ranked over the full ``processed``
+    payload; each keeps the new run's summary for its metric, else the
+    stored one when its change is the same, else the skeleton sentence.
+    """
+    changed_dimensions = {dimension for _, dimension in changed}
+    regenerated: Dict[str, Set[str]] = {}
+    for block_id, block in reduced.items():
+        if block_id != "initiatives":
+            for dimension in DIMENSIONS:
+                if dimension in block:
+                    regenerated.setdefault(dimension, set()).update(block[dimension]["metrics"])
+
+    merged: Dict[str, Any] = {}
+    for dimension in DIMENSIONS:
+        old_page = previous.get(dimension, {"insight_summary": "", "metrics": {}})
+        new_page = partial.get(dimension)
+        if dimension not in changed_dimensions or not new_page:
+            merged[dimension] = old_page
+            continue
+        kept = {
+            code: entry for code, entry in old_page.get("metrics", {}).items()
+            if code not in regenerated.get(dimension, set())
+        }
+        merged[dimension] = {
+            "insight_summary": new_page.get("insight_summary", old_page.get("insight_summary", "")),
+            "metrics": {**kept, **new_page.get("metrics", {})},
+        }
+
+    def by_metric(report: Dict[str, Any]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        return {
+            (h.get("dimension"), h.get("metric")): h
+            for h in report.get("Top Highlights", [])
+        }
+
+    new_highlights, old_highlights = by_metric(partial), by_metric(previous)
+    highlights: List[Dict[str, Any]] = []
+    for entry in highlight_entries(select_top_highlights(processed)):
+        key = (entry["dimension"], entry["metric"])
+        if key in new_highlights:
+            entry["summary"] = new_highlights[key].get("summary", entry["summary"])
+        elif old_highlights.get(key, {}).get("change") == entry["change"]:
+            entry["summary"] = old_highlights[key].get("summary", entry["summary"])
+        highlights.append(entry)
+    return {"Top Highlights": highlights, **merged}
+
+
+# ---------- state -------------------------------------------------------
+class RegenState:
+    """Per-scope state of the previous run, one JSON file per scope."""
+
+    def __init__(self, cache: Optional[ReportCache] = None):
+        self.root = (cache or ReportCache.from_env() or ReportCache()).root / PARTIAL_STATE_DIR
+
+    def _path(self, scope: str) -> Path:
+        safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in scope)
+        return self.root / f"{safe}.json"
+
+    def load(self, scope: str) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(self._path(scope).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def save(self, scope: str, prompts: str, processed, analyzer, report) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        state = {
+            "prompts": prompts,
+            "processed": processed,
+            "analyzer": analyzer,
+            "report": report,
+        }
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp, self._path(scope))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+# ---------- task output parsing -----------------------------------------
+# Process-wide counters for how task outputs were parsed:
+#   direct           – the raw output was a JSON object as-is
+#   partial_json     – a JSON object embedded in prose / code fences
+#   unparsed         – no JSON object found
+#   guardrail_retry  – a delta guardrail sent the output back to the agent
+#                      (extra LLM call)
+_conversion_stats: Counter = Counter()
+_conversion_stats_lock = threading.Lock()
+
+
+def count_conversion(key: str) -> None:
+    with _conversion_stats_lock:
+        _conversion_stats[key] += 1
+
+
+def get_conversion_stats() -> Dict[str, int]:
+    """Snapshot of the parsing counters since start (or last reset)."""
+    with _conversion_stats_lock:
+        return dict(_conversion_stats)
+
+
+def reset_conversion_stats() -> None:
+    with _conversion_stats_lock:
+        _conversion_stats.clear()
+
+
+def parse_json_output(raw: str) -> Optional[Dict[str, Any]]:
+    """First JSON object in a task's raw output (ignores fences / prose)."""
+    try:
+        value = json.loads(raw)
+    except (TypeError, ValueError):
+        value = None
+    if isinstance(value, dict):
+        count_conversion("direct")
+        return value
+    for candidate in iter_json_objects(raw or ""):
+        try:
+            value = json.loads(candidate)
+        except ValueError:
+            continue
+        if isinstance(value, dict):
+            count_conversion("partial_json")
+            return value
+    count_conversion("unparsed")
+    return None
+
+
+def _analyzer_output(output: CrewOutput) -> Optional[Dict[str, Any]]:
+    for task_output in output.tasks_output:
+        if task_output.name == ANALYZER_TASK:
+            return parse_json_output(task_output.raw)
+    return parse_json_output(output.tasks_output[0].raw) if output.tasks_output else None
+
+
+def _schema_issues(data: Dict[str, Any], schema: str) -> List[str]:
+    return JsonSchemaCheck()._run(json_to_validate=data, schema=load_schema(schema))
+
+
+# ---------- entry point --------------------------------------------------
+def kickoff_partial(
+    crew: Any,
+    inputs: Dict[str, Any],
+    scope: str,
+    state: Optional[RegenState] = None,
+    crew_factory: Optional[Any] = None,
+    model: Optional[str] = None,
+) -> CrewOutput:
+    """
+    ``crew.kickoff(inputs)``, regenerating only what changed since the last
+    run of ``scope``.
+
+    ``crew_factory`` builds a fresh crew for the full-run fallback after a
+    partial run (a crew is not kicked off twice); defaults to ``crew.copy``.
+    """
+    state = state or RegenState()
+    processed = inputs["payload"]
+    enabled = os.getenv(PARTIAL_REGEN_ENV_VAR, "1").strip().lower() not in {
+        "0", "false", "no", "off",
+    }
+    # Prompts, model or endpoint changed → nothing stored can be reused
+    prompts = ReportCache.key({}, model or os.getenv("MODEL"))
+    previous = state.load(scope) if enabled else None
+    if previous and previous.get("prompts") != prompts:
+        previous = None
+    changed = changed_slices(previous["processed"], processed) if previous else None
+
+    if changed is not None and not changed:
+        print(f"Partial regeneration: no changes for '{scope}', reusing report")
+        return CrewOutput(
+            raw=json.dumps(previous["report"], indent=2),
+            json_dict=previous["report"],
+            tasks_output=[],
+        )
+
+    if changed:
+        reduced = reduce_payload(processed, changed)
+        print(
+            f"Partial regeneration: {len(changed)} changed slice(s) for '{scope}': "
+            + ", ".join(f"{i}/{d}" for i, d in sorted(changed))
+        )
+        output = crew.kickoff(inputs={**inputs, "payload": reduced})
+        partial_analyzer = _analyzer_output(output) or {}
+        partial_report = parse_json_output(output.raw) or {}
+        analyzer = merge_analyzer(previous["analyzer"], partial_analyzer, processed, changed)
+        report = merge_report(previous["report"], partial_report, reduced, changed, processed)
+        issues = _schema_issues(report, "stories_data")
+        if not issues:
+            state.save(scope, prompts, processed, analyzer, report)
+            return CrewOutput(
+                raw=json.dumps(report, indent=2),
+                json_dict=report,
+                tasks_output=output.tasks_output,
+                token_usage=output.token_usage,
+            )
+        print(f"Partial regeneration: merged report invalid ({issues[0]}), running in full")
+        crew = crew_factory() if crew_factory else crew.copy()
+
+    output = crew.kickoff(inputs=inputs)
+    analyzer = _analyzer_output(output)
+    report = parse_json_output(output.raw)
+    if enabled and analyzer is not None and report is not None:
+        state.save(scope, prompts, processed, analyzer, report)
+    return output
@@ -0,0 +1,286 @@
+#!/usr/bin/env python
+"""
+Synthetic ``process_payload`` inputs for scale testing.
+
+Generates payloads shaped like ``data/test_data1.json`` with configurable
+window length, granularity, number of initiatives, launch distribution,
+injected per-metric effects and missing rows. Rows are produced lazily and
+written as they are generated, so multi-million-row payloads never have to
+fit in memory before they reach the file.
+
+Usage:
+    python -m aco_report_poc_crew.payload_generator [--days 60]
+        [--granularity daily|hourly] [--initiatives 1]
+        [--launch uniform|even|early|late|clustered]
+        [--effect revenue=0.15 ...] [--missing-rate 0.0] [--seed 0]
+        [-o payload.json]
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+from .jsonparser import METRIC_CODES
+
+GRANULARITIES = {"daily": timedelta(days=1), "hourly": timedelta(hours=1)}
+LAUNCH_DISTRIBUTIONS = ("uniform", "even", "early", "late", "clustered")
+
+# Daily level, relative noise and rounding of each KPI (close to the fixtures)
+METRIC_PROFILES = {
+    "bounce_rate": {"level": 55.0, "noise": 0.05, "digits": 1, "additive": False},
+    "conversion_rate": {"level": 3.5, "noise": 0.08, "digits": 1, "additive": False},
+    "revenue": {"level": 15000.0, "noise": 0.10, "digits": 2, "additive": True},
+    "search_conversion_rate": {"level": 3.0, "noise": 0.08, "digits": 1, "additive": False},
+    "unique_visitors": {"level": 1800.0, "noise": 0.08, "digits": 0, "additive": True},
+}
+
+# Initiative metric metadata, as in the fixtures' initiatives[].metrics
+METRIC_METADATA = {
+    "unique_visitors": ("Unique Visitors", "Traffic", "increase", 1),
+    "search_conversion_rate": ("Search Conversion Rate", "Engagement", "increase", 1),
+    "bounce_rate": ("Bounce Rate", "Engagement", "decrease", 2),
+    "conversion_rate": ("Conversion Rate", "Conversions", "increase", 1),
+    "revenue": ("Revenue", "Revenue", "increase", 1),
+}
+INITIATIVE_TYPES = ("System", "Marketing", "Merchandising", "Pricing")
+
+
+# ---------- initiatives -----------------------------------------------
+def launch_times(
+    n: int, start: datetime, end: datetime, step: timedelta,
+    distribution: str, rng: random.Random,
+) -> List[datetime]:
+    """
+    Launch timestamps inside the current window, aligned to ``step``.
+
+    Launches never fall on the first or last slot, so every initiative has
+    pre- and post-launch rows for ``process_payload`` to compare.
+    """
+    if distribution not in LAUNCH_DISTRIBUTIONS:
+        raise ValueError(f"Unknown launch distribution '{distribution}'")
+    slots = int((end - start) / step)
+    if slots < 2:
+        raise ValueError("The current window needs at least 3 slots for launches")
+
+    if distribution == "even":
+        positions = [(i + 1) / (n + 1) for i in range(n)]
+    elif distribution == "clustered":
+        center = rng.uniform(0.2, 0.8)
+        positions = [min(max(rng.gauss(center, 0.03), 0.0), 1.0) for _ in range(n)]
+    else:
+        low, high = {"uniform": (0, 1), "early": (0, 1 / 3), "late": (2 / 3, 1)}[
+            distribution
+        ]
+        positions = [rng.uniform(low, high) for _ in range(n)]
+
+    return sorted(
+        start + step * min(max(round(p * slots), 1), slots - 1) for p in positions
+    )
+
+
+def build_initiatives(launches: List[datetime], rng: random.Random) -> List[Dict[str, Any]]:
+    initiatives = []
+    for index, launch in enumerate(launches, start=1):
+        initiative_type = rng.choice(INITIATIVE_TYPES)
+        name = f"{initiative_type} Initiative {index}"
+        initiatives.append(
+            {
+                "initiative_id": f"INIT_{index:03d}",
+                "initiative_name": name,
+                "initiative_type": initiative_type,
+                "launch_timestamp": launch.isoformat(),
+                "metrics": [
+                    {
+                        "metric_code": code,
+                        "metric_label": label,
+                        "dimension": dimension,
+                        "expected_direction": direction,
+                        "impact_note": f"{label} expected to {direction} after {name}.",
+                        "importance_rank": rank,
+                    }
+                    for code, (label, dimension, direction, rank) in METRIC_METADATA.items()
+                ],
+            }
+        )
+    return initiatives
+
+
+# ---------- rows ------------------------------------------------------
+def iter_rows(
+    start: datetime, end: datetime, step: timedelta, *,
+    launches: List[datetime], effects: Dict[str, float],
+    missing_rate: float, rng: random.Random,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Metric rows for ``[start, end]``, one per ``step``.
+
+    Levels follow a weekly cycle (and a diurnal one for hourly rows); each
+    launched initiative multiplies a metric by ``1 + effects[metric]`` from
+    its launch on. Rows are dropped with probability ``missing_rate``.
+    """
+    hourly = step < timedelta(days=1)
+    slots_per_day = timedelta(days=1) / step
+    current = start
+    while current <= end:
+        if missing_rate and rng.random() < missing_rate:
+            current += step
+            continue
+        weekly = 1.0 + 0.08 * math.sin(2 * math.pi * current.weekday() / 7)
+        diurnal = 1.0 + 0.6 * math.sin(2 * math.pi * (current.hour - 9) / 24) if hourly else 1.0
+        launched = sum(1 for launch in launches if launch <= current)
+
+        row: Dict[str, Any] = {
+            "date": current.isoformat() if hourly else current.date().isoformat()
+        }
+        for code in METRIC_CODES:
+            profile = METRIC_PROFILES[code]
+            value = profile["level"] * weekly
+            if profile["additive"]:
+                value = value * diurnal / slots_per_day
+            value *= (1.0 + effects.get(code, 0.0)) ** launched
+            value *= max(rng.gauss(1.0, profile["noise"]), 0.0)
+            row[code] = int(round(value)) if profile["digits"] == 0 else round(value, profile["digits"])
+        yield row
+        current += step
+
+
+def _windows(days: int, reference_days: Optional[int], end_date: str, step: timedelta):
+    end = datetime.combine(date.fromisoformat(end_date), datetime.min.time())
+    end += timedelta(days=1) - step  # last slot of end_date
+    start = end - timedelta(days=days) + step
+    reference_end = start - step
+    reference_start = reference_end - timedelta(days=reference_days or days) + step
+    return start, end, reference_start, reference_end
+
+
+def payload_parts(
+    days: int = 60,
+    granularity: str = "daily",
+    initiatives: int = 1,
+    launch: str = "uniform",
+    effects: Optional[Dict[str, float]] = None,
+    missing_rate: float = 0.0,
+    reference_days: Optional[int] = None,
+    end_date: str = "2025-07-30",
+    seed: int = 0,
+):
+    """
+    Header fields, lazy reference/current row iterators and initiatives of
+    one synthetic payload.
+    """
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Unknown granularity '{granularity}'")
+    step = GRANULARITIES[granularity]
+    rng = random.Random(seed)
+    start, end, reference_start, reference_end = _windows(
+        days, reference_days, end_date, step
+    )
+    launches = launch_times(initiatives, start, end, step, launch, rng) if initiatives else []
+    header = {
+        "start_date": start.date().isoformat(),
+        "end_date": end.date().isoformat(),
+    }
+    row_args = dict(
+        effects=effects or {}, missing_rate=missing_rate, rng=random.Random(seed + 1)
+    )
+    reference = iter_rows(reference_start, reference_end, step, launches=[], **row_args)
+    current = iter_rows(start, end, step, launches=launches, **row_args)
+    return header, reference, current, build_initiatives(launches, rng)
+
+
+def generate_payload(**options: Any) -> Dict[str, Any]:
+    """The whole payload as a dict (small and medium sizes)."""
+    header, reference, current, initiatives = payload_parts(**options)
+    return {
+        **header,
+        "reference_metrics": list(reference),
+        "current_metrics": list(current),
+        "initiatives": initiatives,
+    }
+
+
+def write_payload(fp: TextIO, **options: Any) -> int:
+    """
+    Stream a payload as JSON to ``fp``, one row per line; returns the
+    number of rows written. Accepts the options of ``payload_parts``.
+    """
+    header, reference, current, initiatives = payload_parts(**options)
+    fp.write("{\n")
+    for key, value in header.items():
+        fp.write(f"  {json.dumps(key)}: {json.dumps(value)},\n")
+    n_rows = 0
+    for key, rows in (("reference_metrics", reference), ("current_metrics", current)):
+        fp.write(f'  "{key}": [')
+        separator = "\n    "
+        for row in rows:
+            fp.write(separator + json.dumps(row))
+            separator = ",\n    "
+            n_rows += 1
+        fp.write("\n  ],\n")
+    fp.write(f'  "initiatives": {json.dumps(initiatives)}\n}}\n')
+    return n_rows
+
+
+def parse_spec(spec: str) -> Dict[str, Any]:
+    """
+    Options from a compact ``key=value,...`` spec, e.g.
+    ``days=365,granularity=hourly,initiatives=3,effect.revenue=0.2``.
+    """
+    options: Dict[str, Any] = {}
+    for item in filter(None, spec.split(",")):
+        key, _, value = item.partition("=")
+        if key.startswith("effect."):
+            options.setdefault("effects", {})[key[len("effect."):]] = float(value)
+        elif key in ("days", "initiatives", "reference_days", "seed"):
+            options[key] = int(value)
+        elif key == "missing_rate":
+            options[key] = float(value)
+        else:
+            options[key] = value
+    return options
+
+
+# ---------- CLI -------------------------------------------------------
+def run(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", type=int, default=60)
+    parser.add_argument("--reference-days", type=int)
+    parser.add_argument("--granularity", choices=sorted(GRANULARITIES), default="daily")
+    parser.add_argument("--initiatives", type=int, default=1)
+    parser.add_argument("--launch", choices=LAUNCH_DISTRIBUTIONS, default="uniform")
+    parser.add_argument(
+        "--effect", action="append", default=[], metavar="METRIC=LIFT",
+        help="relative lift per launched initiative, e.g. revenue=0.15",
+    )
+    parser.add_argument("--missing-rate", type=float, default=0.0)
+    parser.add_argument("--end-date", default="2025-07-30")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="file to write (default: stdout)")
+    args = parser.parse_args(argv)
+
+    effects = {}
+    for item in args.effect:
+        metric, _, lift = item.partition("=")
+        if metric not in METRIC_CODES:
+            parser.error(f"unknown metric '{metric}'")
+        effects[metric] = float(lift)
+
+    options = dict(
+        days=args.days, granularity=args.granularity, initiatives=args.initiatives,
+        launch=args.launch, effects=effects, missing_rate=args.missing_rate,
+        reference_days=args.reference_days, end_date=args.end_date, seed=args.seed,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            n_rows = write_payload(fp, **options)
+        print(f"Wrote {n_rows} rows to {args.output}", file=sys.stderr)
+    else:
+        write_payload(sys.stdout, **options)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,291 @@
+#!/usr/bin/env python
+"""
+Content-addressed cache of finished reports.
+
+A report is keyed by a hash of the processed payload, every file that
+shapes the report (``KEY_SOURCES``: the task/agent prompts, phrasings,
+schemas and the modules building the skeletons and fixed sentences), the
+model id and the LLM endpoint (``BASE_URL`` / ``AZURE_API_BASE`` ...), so
+any change to the data, the prompts or report code, the model or the
+server answering it (e.g. the stub server of a bench run) produces a new
+key. A hit
+returns the stored final report and task outputs without calling the LLM
+(and re-runs the task callbacks so the usual artifacts are written).
+Entries are evicted least-recently-used first once the cache exceeds its
+size budget.
+
+Environment:
+    REPORT_CACHE          – "0"/"false" disables the cache (default: on)
+    REPORT_CACHE_DIR      – cache directory (default: .report_cache)
+    REPORT_CACHE_MAX_MB   – size budget in MiB (default: 256)
+
+Usage:
+    python -m aco_report_poc_crew.report_cache stats
+    python -m aco_report_poc_crew.report_cache invalidate [<key> ... | --all]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from crewai.crews.crew_output import CrewOutput
+from crewai.tasks.task_output import TaskOutput
+from crewai.types.usage_metrics import UsageMetrics
+
+CACHE_ENV_VAR = "REPORT_CACHE"
+CACHE_DIR_ENV_VAR = "REPORT_CACHE_DIR"
+CACHE_MAX_MB_ENV_VAR = "REPORT_CACHE_MAX_MB"
+DEFAULT_CACHE_DIR = ".report_cache"
+DEFAULT_MAX_MB = 256
+# Per-scope state of partial_regen, cleared together with the entries
+PARTIAL_STATE_DIR = "partial"
+# Bump when the stored entry layout changes
+CACHE_FORMAT_VERSION = 1
+
+PACKAGE_DIR = Path(__file__).parent
+# Files whose contents shape a finished report, relative to the package
+KEY_SOURCES = (
+    "config/tasks.yaml",
+    "config/agents.yaml",
+    "config/phrasings.yaml",
+    "schemas/*.json",
+    "crew.py",
+    "jsonparser.py",
+    "delta_protocol.py",
+    "template_report.py",
+)
+TASK_OUTPUT_FIELDS = {
+    "description", "name", "expected_output", "summary", "raw", "json_dict",
+    "agent", "output_format",
+}
+
+
+def llm_endpoint() -> str:
+    """The LLM endpoint from the environment, resolved as in ``create_llm``."""
+    return (
+        os.getenv("BASE_URL")
+        or os.getenv("OPENAI_API_BASE")
+        or os.getenv("OPENAI_BASE_URL")
+        or os.getenv("API_BASE")
+        or os.getenv("AZURE_API_BASE")
+        or ""
+    )
+
+
+def key_source_files() -> List[Path]:
+    """The files of ``KEY_SOURCES``, globs expanded in a stable order."""
+    files: List[Path] = []
+    for pattern in KEY_SOURCES:
+        matches = sorted(PACKAGE_DIR.glob(pattern))
+        if not matches:
+            raise FileNotFoundError(f"Report cache key source missing: {pattern}")
+        files += matches
+    return files
+
+
+class ReportCache:
+    """
+    Directory of ``<key>.json`` entries with size-bounded LRU eviction.
+
+    Recency is the entry file's mtime, refreshed on every hit, so the
+    cache needs no separate index and survives concurrent writers (entries
+    are written to a temp file and renamed into place).
+
+    Attributes:
+        root (Path): Cache directory.
+        max_bytes (int): Size budget; exceeded entries are evicted on put.
+    """
+
+    def __init__(self, root: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_MB << 20):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def from_env(cls) -> Optional["ReportCache"]:
+        """The cache configured by the environment, or None if disabled."""
+        if os.getenv(CACHE_ENV_VAR, "1").strip().lower() in {"0", "false", "no", "off"}:
+            return None
+        return cls(
+            root=os.getenv(CACHE_DIR_ENV_VAR, DEFAULT_CACHE_DIR),
+            max_bytes=int(float(os.getenv(CACHE_MAX_MB_ENV_VAR, DEFAULT_MAX_MB)) * (1 << 20)),
+        )
+
+    @staticmethod
+    def key(
+        processed_payload: Dict[str, Any],
+        model: Optional[str],
+        endpoint: Optional[str] = None,
+    ) -> str:
+        """Cache key; ``endpoint`` defaults to the configured LLM endpoint."""
+        endpoint = endpoint if endpoint is not None else llm_endpoint()
+        digest = hashlib.sha256()
+        digest.update(f"v{CACHE_FORMAT_VERSION}\0{model}\0{endpoint}\0".encode("utf-8"))
+        for path in key_source_files():
+            digest.update(path.relative_to(PACKAGE_DIR).as_posix().encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+            digest.update(b"\0")
+        digest.update(
+            json.dumps(processed_payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        )
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)  # mark as recently used
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def put(self, key: str, output: CrewOutput, model: Optional[str] = None) -> Path:
+        entry = {
+            "key": key,
+            "model": model,
+            "created": time.time(),
+            "raw": output.raw,
+            "json_dict": output.json_dict,
+            "tasks_output": [
+                task_output.model_dump(include=TASK_OUTPUT_FIELDS)
+                for task_output in output.tasks_output
+            ],
+            "token_usage": (
+                output.token_usage.model_dump()
+                if isinstance(output.token_usage, UsageMetrics)
+                else dict(output.token_usage or {})
+            ),
+        }
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        path = self._path(key)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, default=str)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self.evict()
+        return path
+
+    def _entries(self) -> List[Tuple[Path, os.stat_result]]:
+        if not self.root.is_dir():
+            return []
+        return [(path, path.stat()) for path in self.root.glob("*.json")]
+
+    def evict(self) -> int:
+        """Drop least-recently-used entries until the budget is met."""
+        entries = sorted(self._entries(), key=lambda item: item[1].st_mtime)
+        total = sum(stat.st_size for _, stat in entries)
+        removed = 0
+        for path, stat in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+            removed += 1
+        return removed
+
+    def invalidate(self, keys: Optional[List[str]] = None) -> int:
+        """
+        Remove the given entries, or every entry (and the partial
+        regeneration state) when ``keys`` is None.
+        """
+        if keys is not None:
+            paths = [self._path(key) for key in keys]
+        else:
+            paths = [path for path, _ in self._entries()]
+            paths += list((self.root / PARTIAL_STATE_DIR).glob("*.json"))
+        removed = 0
+        for path in paths:
+            if path.exists():
+                path.unlink()
+                removed += 1
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        entries = self._entries()
+        return {
+            "root": str(self.root.resolve()),
+            "entries": len(entries),
+            "bytes": sum(stat.st_size for _, stat in entries),
+            "max_bytes": self.max_bytes,
+        }
+
+
+def crew_output_from_entry(entry: Dict[str, Any]) -> CrewOutput:
+    """Rebuild the ``CrewOutput`` of a cached run (token usage is zero)."""
+    return CrewOutput(
+        raw=entry["raw"],
+        json_dict=entry.get("json_dict"),
+        tasks_output=[TaskOutput(**task_output) for task_output in entry["tasks_output"]],
+        token_usage=UsageMetrics(),
+    )
+
+
+def kickoff_cached(
+    crew: Any,
+    inputs: Dict[str, Any],
+    model: Optional[str] = None,
+    cache: Optional[ReportCache] = None,
+    kickoff: Optional[Callable[[Dict[str, Any]], CrewOutput]] = None,
+) -> CrewOutput:
+    """
+    ``crew.kickoff(inputs)`` through the report cache.
+
+    On a hit the task callbacks are replayed with the stored outputs so the
+    run leaves the same artifacts behind; on a miss the result of
+    ``kickoff(inputs)`` (default: ``crew.kickoff``) is stored.
+    """
+    kickoff = kickoff or (lambda inputs: crew.kickoff(inputs=inputs))
+    model = model or os.getenv("MODEL")
+    cache = cache if cache is not None else ReportCache.from_env()
+    if cache is None:
+        return kickoff(inputs)
+
+    key = cache.key(inputs["payload"], model)
+    entry = cache.get(key)
+    if entry is not None:
+        output = crew_output_from_entry(entry)
+        for task, task_output in zip(crew.tasks, output.tasks_output):
+            if task.callback:
+                task.callback(task_output)
+        print(f"Report cache hit ({key[:12]})")
+        return output
+
+    output = kickoff(inputs)
+    cache.put(key, output, model)
+    return output
+
+
+# ---------- CLI --------------------------------------------------------
+def run(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("stats", help="entry count and size")
+    invalidate = commands.add_parser("invalidate", help="remove cached reports")
+    invalidate.add_argument("keys", nargs="*")
+    invalidate.add_argument("--all", action="store_true")
+    args = parser.parse_args(argv)
+
+    cache = ReportCache.from_env() or ReportCache()
+    if args.command == "stats":
+        print(json.dumps(cache.stats(), indent=2))
+    else:
+        if not args.keys and not args.all:
+            parser.error("pass cache keys or --all")
+        removed = cache.invalidate(None if args.all else args.keys)
+        print(f"Removed {removed} cached report(s) from {cache.root}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,361 @@
+#!/usr/bin/env python
+"""
+Local OpenAI/Azure-compatible chat-completions stub for load testing.
+
+Serves canned answers for every task in ``config/tasks.yaml`` (delta edits
+built from a fixture through ``process_payload``), so ``AcoReportPocCrew``
+can be driven at high concurrency without network access or quota.
+
+Usage:
+    python -m aco_report_poc_crew.stub_llm_server [--port 8011]
+        [--fixture data/test_data1.json] [--latency normal:800,150]
+        [--error-rate 0.05] [--max-rpm 600] [--seed 0]
+
+Then point the crew at it:
+    AZURE_API_BASE=http://127.0.0.1:8011 AZURE_API_KEY=stub \
+    AZURE_API_VERSION=2024-06-01 MODEL=azure/gpt-4.1-mini \
+    python -m aco_report_poc_crew.main
+
+Latency specs (milliseconds): ``fixed:<ms>``, ``uniform:<lo>,<hi>``,
+``normal:<mean>,<stdev>``, ``lognormal:<median>,<sigma>``.
+``GET /stats`` returns request, 429 and per-task counters.
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from .config import tasks_config
+from .delta_protocol import narrative_slots, pointer
+from .jsonparser import (
+    DIMENSIONS,
+    analyzer_insights,
+    dimension_pages,
+    highlight_entries,
+    process_payload,
+    select_top_highlights,
+)
+
+DATA_DIR = Path(__file__).parent / "data"
+
+EVALUATION_FINGERPRINT = "Evaluation Score from 1 to 10"
+FINGERPRINT_LENGTH = 120
+
+
+# ---------- canned task outputs ---------------------------------------
+def canned_outputs(processed: Dict[str, Any], last_updated: str) -> Dict[str, Any]:
+    """
+    Each crew task's answer, keyed by task name: JSON Pointer edits of the
+    narratives (merging them yields schema-valid documents), the
+    validation report, and no edits for the combine / correct steps.
+    """
+    analyzer = analyzer_insights(processed)
+    highlights = {"Top Highlights": highlight_entries(select_top_highlights(processed))}
+    pages = dimension_pages(analyzer, last_updated)
+    return {
+        "analyze_impact_attribution_task": _explanation_edits(analyzer),
+        "generate_top_highlights_task": narrative_slots(highlights, ("summary",)),
+        "generate_dimension_pages_task": narrative_slots(pages, ("insight_summary",)),
+        "combine_stories_task": {},
+        "validate_final_report_task": {"approved": True, "issues": []},
+        "correct_report_with_validation_task": {},
+    }
+
+
+def _explanation_edits(analyzer: Dict[str, Any]) -> Dict[str, str]:
+    """The analyzer's answer: every explanation with its placeholders filled."""
+    edits = {}
+    for init_id, block in analyzer.items():
+        for dimension in DIMENSIONS:
+            for code, metric in block[dimension]["metrics"].items():
+                edits[pointer(init_id, dimension, "metrics", code, "explanation")] = (
+                    metric["explanation"]
+                    .replace("[metric_codes]", code)
+                    .replace("[initiative_delta]", metric["change"])
+                    .replace("[initiative_name]", block["initiative_name"])
+                )
+    return edits
+
+
+# ---------- latency / rate limiting ------------------------------------
+def parse_latency(spec: str, rng: random.Random) -> Callable[[], float]:
+    """Return a sampler of latencies in seconds for a ``kind:params`` spec."""
+    kind, _, raw = spec.partition(":")
+    params = [float(p) for p in raw.split(",") if p]
+    if kind == "fixed":
+        return lambda: params[0] / 1000
+    if kind == "uniform":
+        return lambda: rng.uniform(params[0], params[1]) / 1000
+    if kind == "normal":
+        return lambda: max(rng.gauss(params[0], params[1]), 0.0) / 1000
+    if kind == "lognormal":
+        return lambda: rng.lognormvariate(math.log(params[0]), params[1]) / 1000
+    raise ValueError(f"Unknown latency spec '{spec}'")
+
+
+class _RateWindow:
+    """Sliding one-minute request window for ``max_rpm``."""
+
+    def __init__(self, max_rpm: Optional[int]):
+        self.max_rpm = max_rpm
+        self._stamps: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def admit(self) -> bool:
+        if not self.max_rpm:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            while self._stamps and now - self._stamps[0] > 60:
+                self._stamps.popleft()
+            if len(self._stamps) >= self.max_rpm:
+                return False
+            self._stamps.append(now)
+            return True
+
+
+# ---------- server -----------------------------------------------------
+class StubLLMServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server answering ``*/chat/completions`` requests.
+
+    Attributes:
+        outputs (dict): Canned JSON answer per task name.
+        stats (Counter): ``requests``, ``rate_limited``, ``streamed`` and
+            ``task:<name>`` counters.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address=("127.0.0.1", 8011),
+        fixture: Path = DATA_DIR / "test_data1.json",
+        latency: str = "fixed:0",
+        error_rate: float = 0.0,
+        max_rpm: Optional[int] = None,
+        stream_chunk_chars: int = 64,
+        seed: int = 0,
+    ):
+        super().__init__(address, _Handler)
+        raw = json.loads(Path(fixture).read_text())
+        self.outputs = canned_outputs(
+            process_payload(raw), f"{raw['end_date']}T00:00:00Z"
+        )
+        self.fingerprints = {
+            _normalize(config["expected_output"])[:FINGERPRINT_LENGTH]: name
+            for name, config in tasks_config.items()
+        }
+        self.rng = random.Random(seed)
+        self.sample_latency = parse_latency(latency, self.rng)
+        self.error_rate = error_rate
+        self.rate_window = _RateWindow(max_rpm)
+        self.stream_chunk_chars = stream_chunk_chars
+        self.stats: Counter = Counter()
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start_in_background(self) -> threading.Thread:
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+    def answer(self, messages: List[Dict[str, Any]]) -> str:
+        """Pick the canned answer for a conversation."""
+        text = _normalize(" ".join(str(m.get("content") or "") for m in messages))
+        # Evaluation prompts quote the evaluated task's description
+        if EVALUATION_FINGERPRINT in text:
+            self.count("task:evaluation")
+            return _final_answer({"quality": 8.0})
+        for fingerprint, name in self.fingerprints.items():
+            if fingerprint in text:
+                self.count(f"task:{name}")
+                return _final_answer(self.outputs[name])
+        # Converter calls: echo the JSON found in the last user message
+        last = str(messages[-1].get("content") or "") if messages else ""
+        self.count("task:other")
+        match = re.search(r"\{.*\}", last, re.DOTALL)
+        return match.group(0) if match else _final_answer({})
+
+    def count(self, key: str, n: int = 1) -> None:
+        with self.lock:
+            self.stats[key] += n
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body go out as separate writes; without TCP_NODELAY every
+    # keep-alive response waits ~40 ms on the client's delayed ACK
+    disable_nagle_algorithm = True
+    server: StubLLMServer
+
+    def log_message(self, format, *args):  # keep load tests quiet
+        pass
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/stats":
+            with self.server.lock:
+                self._send_json(200, dict(self.server.stats))
+        else:
+            self._send_json(404, {"error": {"message": "not found"}})
+
+    def do_POST(self):
+        if "/chat/completions" not in self.path:
+            self._send_json(404, {"error": {"message": "not found"}})
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        server = self.server
+        server.count("requests")
+
+        with server.lock:
+            rejected = server.rng.random() < server.error_rate
+        if rejected or not server.rate_window.admit():
+            server.count("rate_limited")
+            self._send_json(
+                429,
+                {"error": {"code": "429", "message": "Rate limit exceeded (stub)"}},
+                headers={"Retry-After": "1"},
+            )
+            return
+
+        with server.lock:
+            delay = server.sample_latency()
+        time.sleep(delay)
+
+        messages = request.get("messages", [])
+        content = server.answer(messages)
+        usage = {
+            "prompt_tokens": sum(len(str(m.get("content") or "")) for m in messages) // 4,
+            "completion_tokens": len(content) // 4,
+        }
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+        model = request.get("model", "stub")
+
+        if request.get("stream"):
+            server.count("streamed")
+            self._stream(model, content, usage)
+        else:
+            self._send_json(
+                200,
+                {
+                    "id": f"chatcmpl-{uuid.uuid4().hex}",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": content},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": usage,
+                },
+            )
+
+    def _stream(self, model: str, content: str, usage: Dict[str, int]) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        chunk_id = f"chatcmpl-{uuid.uuid4().hex}"
+        size = self.server.stream_chunk_chars
+        pieces = [content[i : i + size] for i in range(0, len(content), size)] or [""]
+        for index, piece in enumerate(pieces):
+            delta = {"content": piece}
+            if index == 0:
+                delta["role"] = "assistant"
+            self._write_event(_chunk(chunk_id, model, delta, None))
+        final = _chunk(chunk_id, model, {}, "stop")
+        final["usage"] = usage
+        self._write_event(final)
+        self._write_chunk(b"data: [DONE]\n\n")
+        self._write_chunk(b"")
+
+    def _write_event(self, payload: Dict[str, Any]) -> None:
+        self._write_chunk(f"data: {json.dumps(payload)}\n\n".encode("utf-8"))
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def _send_json(self, status: int, body: Dict[str, Any], headers=None) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def _chunk(chunk_id: str, model: str, delta: Dict[str, Any], finish_reason):
+    return {
+        "id": chunk_id,
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+
+
+def _final_answer(output: Any) -> str:
+    return "Thought: I now know the final answer\nFinal Answer: " + json.dumps(
+        output, indent=2
+    )
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+# ---------- CLI --------------------------------------------------------
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8011)
+    parser.add_argument("--fixture", type=Path, default=DATA_DIR / "test_data1.json")
+    parser.add_argument("--latency", default="fixed:0")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="429 probability")
+    parser.add_argument("--max-rpm", type=int, default=None)
+    parser.add_argument("--stream-chunk-chars", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    server = StubLLMServer(
+        (args.host, args.port),
+        fixture=args.fixture,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        max_rpm=args.max_rpm,
+        stream_chunk_chars=args.stream_chunk_chars,
+        seed=args.seed,
+    )
+    print(f"Stub LLM server listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Template-only rendering of NO_INITIATIVE reports.
+
+When a payload has no initiatives, every narrative of the report is one of
+the fixed sentences ``tasks.yaml`` prescribes for NO_INITIATIVE, so the
+crew adds latency and cost but no content. This builds ``stories_data``
+straight from the processed payload: the skeleton from ``jsonparser``
+(top highlights, dimension pages) with each narrative taken from the
+pre-approved phrasings in ``config/phrasings.yaml``. The phrasing of a
+slot is picked by a hash of the payload and the slot's JSON Pointer, so a
+payload always renders the same report while neighbouring slots vary.
+
+The result is checked against ``stories_data.schema.json`` and the
+compliance linter; anything that does not pass goes through the crew.
+
+Environment:
+    TEMPLATE_REPORTS   – "0"/"false" always runs the crew (default: on)
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from crewai.crews.crew_output import CrewOutput
+from crewai.types.usage_metrics import UsageMetrics
+
+from .config import load_schema, phrasings_config
+from .delta_protocol import apply_edits, narrative_slots, pointer
+from .jsonparser import (
+    DIMENSIONS,
+    analyzer_insights,
+    dimension_pages,
+    highlight_entries,
+    select_top_highlights,
+)
+from .tools import ComplianceLinter, JsonSchemaCheck
+
+TEMPLATE_ENV_VAR = "TEMPLATE_REPORTS"
+
+
+def is_template_eligible(processed: Dict[str, Any]) -> bool:
+    """True for payloads without initiatives (a lone NO_INITIATIVE block)."""
+    return list(analyzer_insights(processed)) == ["NO_INITIATIVE"]
+
+
+def pick_phrasing(pool: List[str], slot: str, seed: str) -> str:
+    """Deterministic choice from ``pool`` for one narrative slot."""
+    digest = hashlib.sha256(f"{seed}\0{slot}".encode("utf-8")).digest()
+    return pool[int.from_bytes(digest[:4], "big") % len(pool)]
+
+
+def render_no_initiative_report(
+    processed: Dict[str, Any], last_updated: Optional[str] = None
+) -> Dict[str, Any]:
+    """stories_data for a NO_INITIATIVE payload, narratives from templates."""
+    phrasings = phrasings_config["no_initiative"]
+    last_updated = last_updated or datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    seed = hashlib.sha256(
+        json.dumps(processed, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+
+    def phrase(kind: str, significant: bool, slot: str, **fields: Any) -> str:
+        pool = phrasings[kind]["significant" if significant else "flat"]
+        return pick_phrasing(pool, slot, seed).format(**fields)
+
+    insights = analyzer_insights(processed)
+    records = select_top_highlights(processed)
+    report = {
+        "Top Highlights": highlight_entries(records),
+        **dimension_pages(insights, last_updated),
+    }
+
+    edits: Dict[str, str] = {}
+    for index, rec in enumerate(records):
+        slot = pointer("Top Highlights", index, "summary")
+        edits[slot] = phrase(
+            "highlight", rec["overall_sig"], slot,
+            metric_label=rec["metric_label"], change=rec["change"],
+        )
+    for dimension in DIMENSIONS:
+        metrics = insights["NO_INITIATIVE"][dimension]["metrics"]
+        slot = pointer(dimension, "insight_summary")
+        edits[slot] = phrase(
+            "insight_summary", any(m["overall_sig"] for m in metrics.values()), slot,
+            dimension=dimension,
+        )
+        for code, metric in metrics.items():
+            slot = pointer(dimension, "metrics", code, "explanation")
+            edits[slot] = phrase(
+                "explanation", metric["overall_sig"], slot,
+                metric_label=code.replace("_", " ").title(), change=metric["change"],
+            )
+    report, _ = apply_edits(report, edits)
+    return report
+
+
+def report_issues(report: Dict[str, Any]) -> List[str]:
+    """Schema and compliance issues of a rendered report (empty when valid)."""
+    issues = JsonSchemaCheck()._run(
+        json_to_validate=report, schema=load_schema("stories_data")
+    )
+    return issues + ComplianceLinter()._run(sentences=list(narrative_slots(report).values()))
+
+
+# ---------- entry point --------------------------------------------------
+def kickoff_template(inputs: Dict[str, Any]) -> Optional[CrewOutput]:
+    """
+    The template-rendered report for a NO_INITIATIVE payload, or None when
+    the crew has to run (initiatives present, disabled, or not valid).
+    """
+    if os.getenv(TEMPLATE_ENV_VAR, "1").strip().lower() in {"0", "false", "no", "off"}:
+        return None
+    processed = inputs["payload"]
+    if not is_template_eligible(processed):
+        return None
+    report = render_no_initiative_report(processed, inputs.get("last_updated"))
+    issues = report_issues(report)
+    if issues:
+        print(f"Template report invalid ({issues[0]}), running the crew")
+        return None
+    return CrewOutput(
+        raw=json.dumps(report, indent=2),
+        json_dict=report,
+        tasks_output=[],
+        token_usage=UsageMetrics(),
+    )
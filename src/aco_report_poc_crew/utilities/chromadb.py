@@ -1,8 +1,9 @@
+import os
 import re
+import threading
 import portalocker
 from chromadb import PersistentClient
-from hashlib import md5
-from typing import Optional
+from typing import Dict, Optional
 
 
 MIN_COLLECTION_LENGTH = 3
@@ -13,6 +14,13 @@ DEFAULT_COLLECTION = "default_collection"
 INVALID_CHARS_PATTERN = re.compile(r"[^a-zA-Z0-9_-]")
 IPV4_PATTERN = re.compile(r"^(\d{1,3}\.){3}\d{1,3}$")
 
+LOCK_FILE_NAME = ".chromadb.lock"
+
+# Process-level client pool, keyed by absolute storage path
+_clients: Dict[str, PersistentClient] = {}
+_clients_lock = threading.Lock()
+_clients_pid = os.getpid()
+
 
 def is_ipv4_pattern(name: str) -> bool:
     """
@@ -68,12 +76,34 @@ def sanitize_collection_name(name: Optional[str], max_collection_length: int = M
 
 def create_persistent_client(path: str, **kwargs):
     """
-    Creates a persistent client for ChromaDB with a lock file to prevent
-    concurrent creations. Works for both multi-threads and multi-processes
-    environments.
+    Returns the persistent ChromaDB client for ``path``, creating it on first
+    use.
+
+    Clients are cached per process and reused across crews and kickoffs, so
+    ``kwargs`` only apply when the client is first created. Creation takes a
+    lock file inside the storage directory to prevent concurrent creations.
+    Works for both multi-threads and multi-processes environments; a forked
+    child starts with an empty pool.
     """
-    lockfile = f"chromadb-{md5(path.encode(), usedforsecurity=False).hexdigest()}.lock"
-    with portalocker.Lock(lockfile):
-        client = PersistentClient(path=path, **kwargs)
+    global _clients_pid
+
+    key = os.path.abspath(path)
+    with _clients_lock:
+        if _clients_pid != os.getpid():
+            _clients.clear()
+            _clients_pid = os.getpid()
+
+        client = _clients.get(key)
+        if client is None:
+            os.makedirs(key, exist_ok=True)
+            with portalocker.Lock(os.path.join(key, LOCK_FILE_NAME)):
+                client = PersistentClient(path=path, **kwargs)
+            _clients[key] = client
 
     return client
+
+
+def clear_persistent_clients() -> None:
+    """Drop every cached client, e.g. after deleting a storage directory."""
+    with _clients_lock:
+        _clients.clear()
@@ -1,6 +1,15 @@
 import json
-import re
-from typing import Any, Optional, Type, Union, get_args, get_origin
+from typing import (
+    Any,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from pydantic import BaseModel, ValidationError
 
@@ -161,10 +170,9 @@ def handle_partial_json(
     agent: Any,
     converter_cls: Optional[Type[Converter]] = None,
 ) -> Union[dict, BaseModel, str]:
-    match = re.search(r"({.*})", result, re.DOTALL)
-    if match:
+    for candidate in iter_json_objects(result):
         try:
-            exported_result = model.model_validate_json(match.group(0))
+            exported_result = model.model_validate_json(candidate)
             if is_json_output:
                 return exported_result.model_dump()
             return exported_result
@@ -177,12 +185,59 @@ def handle_partial_json(
                 content=f"Unexpected error during partial JSON handling: {type(e).__name__}: {e}. Attempting alternative conversion method.",
                 color="red",
             )
+            break
 
     return convert_with_instructions(
         result, model, is_json_output, agent, converter_cls
     )
 
 
+def iter_json_objects(text: str) -> Iterator[str]:
+    """
+    Yield the brace-balanced ``{...}`` spans of ``text``: each top-level
+    object, followed by the objects nested in it, in order of appearance.
+
+    Replaces the greedy ``{.*}`` match, which spans from the first ``{`` to
+    the last ``}`` and so swallows any prose (or a second object) in between.
+    The scan keeps a stack of open braces and tracks string literals and
+    escapes inside an object, so braces in JSON strings do not affect
+    nesting. Nested objects are yielded too, so a wrapper that fails
+    validation still offers its contents. If a ``{`` is never closed (a
+    stray brace in prose), everything after it was read with its string
+    state (a lone ``"`` there swallows the rest of the text), so the scan
+    restarts with fresh state just after that brace; each unclosed brace
+    costs one rescan.
+    """
+    position = 0
+    while True:
+        open_braces: List[int] = []
+        spans: List[Tuple[int, int]] = []
+        in_string = False
+        escaped = False
+        for index in range(position, len(text)):
+            char = text[index]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = bool(open_braces)
+            elif char == "{":
+                open_braces.append(index)
+            elif char == "}" and open_braces:
+                spans.append((open_braces.pop(), index + 1))
+                if not open_braces:
+                    for start, end in sorted(spans):
+                        yield text[start:end]
+                    spans = []
+        if not open_braces:
+            return
+        position = open_braces[0] + 1
+
+
 def convert_with_instructions(
     result: str,
     model: Type[BaseModel],
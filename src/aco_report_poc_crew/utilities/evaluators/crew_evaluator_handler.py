@@ -1,4 +1,7 @@
+import threading
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, Field, InstanceOf
 from rich.box import HEAVY_EDGE
@@ -26,17 +29,28 @@ class CrewEvaluator:
     Attributes:
         crew (Crew): The crew of agents to evaluate.
         eval_llm (BaseLLM): Language model instance to use for evaluations
+        max_workers (int): Number of evaluations that may run concurrently.
         tasks_scores (defaultdict): A dictionary to store the scores of the agents for each task.
         iteration (int): The current iteration of the evaluation.
-    """
 
-    tasks_scores: defaultdict = defaultdict(list)
-    run_execution_times: defaultdict = defaultdict(list)
-    iteration: int = 0
+    Evaluations run on a thread pool while the crew moves on to its next
+    task; ``wait_for_evaluations`` (called by ``print_crew_evaluation_result``)
+    joins them and fills ``tasks_scores``/``run_execution_times`` in task
+    order.
+    """
 
-    def __init__(self, crew, eval_llm: InstanceOf[BaseLLM]):
+    def __init__(self, crew, eval_llm: InstanceOf[BaseLLM], max_workers: int = 4):
         self.crew = crew
         self.llm = eval_llm
+        self.max_workers = max_workers
+        self.tasks_scores: defaultdict = defaultdict(list)
+        self.run_execution_times: defaultdict = defaultdict(list)
+        self.iteration: int = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
+        # (iteration, task index) -> (quality, execution duration)
+        self._results: Dict[Tuple[int, int], Tuple[float, float]] = {}
+        self._lock = threading.Lock()
         self._setup_for_evaluating()
 
     def _setup_for_evaluating(self) -> None:
@@ -96,6 +110,8 @@ class CrewEvaluator:
         │ Execution Time (s) │ 42    │ 79    │ 52    │ 57         │                              │
         └────────────────────┴───────┴───────┴───────┴────────────┴──────────────────────────────┘
         """
+        self.wait_for_evaluations()
+
         task_averages = [
             sum(scores) / len(scores) for scores in zip(*self.tasks_scores.values())
         ]
@@ -159,11 +175,15 @@ class CrewEvaluator:
         console.print(table)
 
     def evaluate(self, task_output: TaskOutput):
-        """Evaluates the performance of the agents in the crew based on the tasks they have performed."""
+        """
+        Queues an evaluation of the agents' performance on the task that
+        produced ``task_output`` and returns immediately.
+        """
         current_task = None
-        for task in self.crew.tasks:
+        task_index = -1
+        for index, task in enumerate(self.crew.tasks):
             if task.description == task_output.description:
-                current_task = task
+                current_task, task_index = task, index
                 break
 
         if not current_task or not task_output:
@@ -171,9 +191,65 @@ class CrewEvaluator:
                 "Task to evaluate and task output are required for evaluation"
             )
 
+        # Snapshot per-run state now; the task object is reused by later runs
+        future = self._get_executor().submit(
+            self._run_evaluation,
+            current_task,
+            task_index,
+            task_output.raw,
+            self.iteration,
+            current_task.execution_duration,
+        )
+        with self._lock:
+            self._pending.append(future)
+
+    def wait_for_evaluations(self) -> None:
+        """
+        Blocks until every queued evaluation has finished, then records the
+        scores and execution times of the completed runs.
+
+        Raises:
+            Exception: The first error raised by a queued evaluation.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        try:
+            for future in pending:
+                future.result()
+        finally:
+            with self._lock:
+                self._collect_results()
+            if self._executor is not None and not self._pending:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="crew-eval"
+                )
+            return self._executor
+
+    def _collect_results(self) -> None:
+        """Move finished results into the per-run lists, in task order."""
+        for key in sorted(self._results):
+            iteration, _ = key
+            quality, execution_duration = self._results.pop(key)
+            self.tasks_scores[iteration].append(quality)
+            self.run_execution_times[iteration].append(execution_duration)
+
+    def _run_evaluation(
+        self,
+        task_to_evaluate: Task,
+        task_index: int,
+        task_output: str,
+        iteration: int,
+        execution_duration: float,
+    ) -> None:
         evaluator_agent = self._evaluator_agent()
         evaluation_task = self._evaluation_task(
-            evaluator_agent, current_task, task_output.raw
+            evaluator_agent, task_to_evaluate, task_output
         )
 
         evaluation_result = evaluation_task.execute_sync()
@@ -183,15 +259,16 @@ class CrewEvaluator:
                 self.crew,
                 CrewTestResultEvent(
                     quality=evaluation_result.pydantic.quality,
-                    execution_duration=current_task.execution_duration,
+                    execution_duration=execution_duration,
                     model=self.llm.model,
                     crew_name=self.crew.name,
                     crew=self.crew,
                 ),
             )
-            self.tasks_scores[self.iteration].append(evaluation_result.pydantic.quality)
-            self.run_execution_times[self.iteration].append(
-                current_task.execution_duration
-            )
+            with self._lock:
+                self._results[(iteration, task_index)] = (
+                    evaluation_result.pydantic.quality,
+                    execution_duration,
+                )
         else:
             raise ValueError("Evaluation result is not in the expected format")
@@ -37,6 +37,7 @@ from .flow_events import (
     MethodExecutionFailedEvent,
 )
 from .crewai_event_bus import CrewAIEventsBus, crewai_event_bus
+from .background_dispatcher import OverflowPolicy
 from .tool_usage_events import (
     ToolUsageFinishedEvent,
     ToolUsageErrorEvent,
@@ -67,13 +68,14 @@ from .memory_events import (
 
 # events
 from .event_listener import EventListener
-from .third_party.agentops_listener import agentops_listener
+from .third_party.agentops_listener import AgentOpsListener
 
 __all__ = [
     "EventListener",
-    "agentops_listener",
+    "AgentOpsListener",
     "CrewAIEventsBus",
     "crewai_event_bus",
+    "OverflowPolicy",
     "AgentExecutionStartedEvent",
     "AgentExecutionCompletedEvent",
     "AgentExecutionErrorEvent",
@@ -105,7 +107,7 @@ __all__ = [
     "MemoryRetrievalStartedEvent",
     "MemoryRetrievalCompletedEvent",
     "EventListener",
-    "agentops_listener",
+    "AgentOpsListener",
     "CrewKickoffStartedEvent",
     "CrewKickoffCompletedEvent",
     "CrewKickoffFailedEvent",
@@ -0,0 +1,142 @@
+"""Bounded queue + worker thread that runs event handlers off the emitting thread."""
+
+import threading
+from collections import Counter, deque
+from enum import Enum
+from typing import Any, Callable, Deque, Iterable, Optional, Tuple, Type
+
+from crewai.utilities.events.base_events import BaseEvent
+
+
+class OverflowPolicy(str, Enum):
+    """What to do when the dispatch queue is full."""
+
+    BLOCK = "block"  # emitter waits for room (no event is ever lost)
+    DROP_OLDEST = "drop_oldest"  # discard the oldest queued event
+    DROP_BY_TYPE = "drop_by_type"  # discard droppable events first, else block
+
+
+class BackgroundDispatcher:
+    """
+    Runs event deliveries on a single daemon thread, in FIFO order.
+
+    Each queued item is a ``(deliver, event)`` pair; ``deliver`` is a
+    zero-argument callable prepared by the bus that runs the handlers
+    resolved at emit time, so registration changes after an emit do not
+    affect an event already in flight.
+
+    Attributes:
+        max_queue_size (int): Maximum number of pending deliveries.
+        overflow_policy (OverflowPolicy): Behaviour when the queue is full.
+        droppable_event_types (tuple): Event classes that may be discarded
+            under ``OverflowPolicy.DROP_BY_TYPE``.
+        dropped (Counter): Number of dropped events per event ``type``.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 10_000,
+        overflow_policy: OverflowPolicy | str = OverflowPolicy.BLOCK,
+        droppable_event_types: Iterable[Type[BaseEvent]] = (),
+    ):
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = OverflowPolicy(overflow_policy)
+        self.droppable_event_types: Tuple[Type[BaseEvent], ...] = tuple(
+            droppable_event_types
+        )
+        self.dropped: Counter = Counter()
+
+        self._queue: Deque[Tuple[Callable[[], None], BaseEvent]] = deque()
+        self._cond = threading.Condition()
+        self._unfinished = 0
+        self._running = True
+        self._worker = threading.Thread(
+            target=self._run, name="crewai-event-dispatch", daemon=True
+        )
+        self._worker.start()
+
+    @property
+    def is_worker_thread(self) -> bool:
+        return threading.current_thread() is self._worker
+
+    def submit(self, deliver: Callable[[], None], event: BaseEvent) -> None:
+        """Queue a delivery, applying the overflow policy if the queue is full."""
+        with self._cond:
+            while len(self._queue) >= self.max_queue_size:
+                if not self._make_room(event):
+                    return
+            self._queue.append((deliver, event))
+            self._unfinished += 1
+            self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every queued delivery has run.
+
+        Returns:
+            bool: False if ``timeout`` expired before the queue drained.
+        """
+        if self.is_worker_thread:
+            return True
+        with self._cond:
+            return self._cond.wait_for(lambda: self._unfinished == 0, timeout)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Drain the queue, then stop the worker thread."""
+        self.flush(timeout)
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if not self.is_worker_thread:
+            self._worker.join(timeout)
+
+    def _make_room(self, event: BaseEvent) -> bool:
+        """
+        Free one slot (or wait for one) according to the overflow policy.
+
+        Returns:
+            bool: False if ``event`` itself was dropped instead.
+        """
+        if self.overflow_policy is OverflowPolicy.DROP_OLDEST:
+            _, oldest = self._queue.popleft()
+            self._discard(oldest)
+            return True
+
+        if self.overflow_policy is OverflowPolicy.DROP_BY_TYPE:
+            for index, (_, queued) in enumerate(self._queue):
+                if isinstance(queued, self.droppable_event_types):
+                    del self._queue[index]
+                    self._discard(queued)
+                    return True
+            if isinstance(event, self.droppable_event_types):
+                self.dropped[event.type] += 1
+                return False
+
+        self._cond.wait()
+        return True
+
+    def _discard(self, event: BaseEvent) -> None:
+        self.dropped[event.type] += 1
+        self._unfinished -= 1
+        self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or not self._running)
+                if not self._queue:
+                    return
+                deliver, _ = self._queue.popleft()
+                # Wake producers blocked on a full queue
+                self._cond.notify_all()
+            try:
+                deliver()
+            except Exception as e:
+                print(f"[EventBus Error] Background delivery failed: {e}")
+            finally:
+                with self._cond:
+                    self._unfinished -= 1
+                    self._cond.notify_all()
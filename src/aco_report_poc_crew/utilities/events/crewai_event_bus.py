@@ -1,19 +1,47 @@
 import threading
 from contextlib import contextmanager
-from typing import Any, Callable, Dict, List, Type, TypeVar, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 
 from blinker import Signal
 
 from crewai.utilities.events.base_events import BaseEvent
+from crewai.utilities.events.crew_events import (
+    CrewKickoffCompletedEvent,
+    CrewKickoffFailedEvent,
+)
+from crewai.utilities.events.crewai_event_bus import (
+    CrewAIEventsBus as _BaseEventsBus,
+    crewai_event_bus as _crewai_event_bus,
+)
 from crewai.utilities.events.event_types import EventTypes
 
+from .background_dispatcher import BackgroundDispatcher, OverflowPolicy
+
 EventT = TypeVar("EventT", bound=BaseEvent)
 
+# (registered event type, handler) pairs resolved for one concrete event class
+_Dispatch = Tuple[Tuple[Type[BaseEvent], Callable], ...]
+
 
-class CrewAIEventsBus:
+class CrewAIEventsBus(_BaseEventsBus):
     """
     A singleton event bus that uses blinker signals for event handling.
     Allows both internal (Flow/Crew) and external event handling.
+
+    Subclass of crewai's bus with a per-class dispatch cache. crewai and its
+    listeners hold references to crewai's singleton, so ``install()`` upgrades
+    that instance in place rather than creating a second bus.
     """
 
     _instance = None
@@ -23,14 +51,46 @@ class CrewAIEventsBus:
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:  # prevent race condition
-                    cls._instance = super(CrewAIEventsBus, cls).__new__(cls)
+                    cls._instance = object.__new__(cls)
                     cls._instance._initialize()
         return cls._instance
 
+    @classmethod
+    def install(
+        cls, bus: Optional[_BaseEventsBus] = None
+    ) -> "CrewAIEventsBus":
+        """
+        Upgrade crewai's bus singleton to this class, keeping its handlers.
+
+        Handlers already registered (crewai's EventListener, user listeners)
+        stay in place; only emit/registration switch to the cached dispatch.
+        Calling it again is a no-op.
+
+        Args:
+            bus: The instance to upgrade, defaults to crewai's ``crewai_event_bus``.
+
+        Returns:
+            CrewAIEventsBus: The upgraded instance.
+        """
+        bus = bus if bus is not None else _crewai_event_bus
+        with cls._lock:
+            if not isinstance(bus, cls):
+                bus.__class__ = cls
+                bus._dispatch_cache = {}
+                bus._handlers_lock = threading.RLock()
+                bus._dispatcher = None
+            cls._instance = bus
+        return cast(CrewAIEventsBus, bus)
+
     def _initialize(self) -> None:
         """Initialize the event bus internal state"""
         self._signal = Signal("crewai_event_bus")
         self._handlers: Dict[Type[BaseEvent], List[Callable]] = {}
+        # Concrete event class -> resolved handlers. Rebuilt lazily after any
+        # registration change so ``emit`` costs a single dict lookup.
+        self._dispatch_cache: Dict[Type[BaseEvent], _Dispatch] = {}
+        self._handlers_lock = threading.RLock()
+        self._dispatcher: Optional[BackgroundDispatcher] = None
 
     def on(
         self, event_type: Type[EventT]
@@ -50,11 +110,7 @@ class CrewAIEventsBus:
         def decorator(
             handler: Callable[[Any, EventT], None],
         ) -> Callable[[Any, EventT], None]:
-            if event_type not in self._handlers:
-                self._handlers[event_type] = []
-            self._handlers[event_type].append(
-                cast(Callable[[Any, EventT], None], handler)
-            )
+            self.register_handler(event_type, handler)
             return handler
 
         return decorator
@@ -67,27 +123,136 @@ class CrewAIEventsBus:
             source: The object emitting the event
             event: The event instance to emit
         """
-        for event_type, handlers in self._handlers.items():
-            if isinstance(event, event_type):
-                for handler in handlers:
-                    try:
-                        handler(source, event)
-                    except Exception as e:
-                        print(
-                            f"[EventBus Error] Handler '{handler.__name__}' failed for event '{event_type.__name__}': {e}"
-                        )
+        dispatch = self._dispatch_cache.get(type(event))
+        if dispatch is None:
+            dispatch = self._resolve_dispatch(type(event))
+
+        dispatcher = self._dispatcher
+        if dispatcher is None or dispatcher.is_worker_thread:
+            # Inline delivery; events emitted by handlers running on the
+            # background worker are delivered inline too, so a full queue
+            # can never deadlock the worker on itself.
+            self._deliver(source, event, dispatch)
+            return
+
+        dispatcher.submit(lambda: self._deliver(source, event, dispatch), event)
+        if isinstance(event, (CrewKickoffCompletedEvent, CrewKickoffFailedEvent)):
+            # Observers must have caught up before kickoff() returns
+            dispatcher.flush()
+
+    def _deliver(self, source: Any, event: BaseEvent, dispatch: _Dispatch) -> None:
+        for event_type, handler in dispatch:
+            try:
+                handler(source, event)
+            except Exception as e:
+                print(
+                    f"[EventBus Error] Handler '{handler.__name__}' failed for event '{event_type.__name__}': {e}"
+                )
 
         self._signal.send(source, event=event)
 
+    def start_background_dispatch(
+        self,
+        max_queue_size: int = 10_000,
+        overflow_policy: OverflowPolicy | str = OverflowPolicy.BLOCK,
+        droppable_event_types: Iterable[Type[BaseEvent]] = (),
+    ) -> BackgroundDispatcher:
+        """
+        Opt in to running handlers on a background thread.
+
+        ``emit`` then only enqueues the event; console rendering, telemetry
+        and other observers no longer add latency to the caller. Events are
+        delivered in emit order and the queue is flushed whenever a
+        ``CrewKickoffCompletedEvent`` (or ``CrewKickoffFailedEvent``) is emitted.
+
+        Args:
+            max_queue_size: Maximum number of pending events.
+            overflow_policy: ``block``, ``drop_oldest`` or ``drop_by_type``.
+            droppable_event_types: Event classes that ``drop_by_type`` may
+                discard, e.g. ``LLMStreamChunkEvent``.
+
+        Returns:
+            BackgroundDispatcher: The active dispatcher (exposes ``dropped``).
+        """
+        self.stop_background_dispatch()
+        self._dispatcher = BackgroundDispatcher(
+            max_queue_size=max_queue_size,
+            overflow_policy=overflow_policy,
+            droppable_event_types=droppable_event_types,
+        )
+        return self._dispatcher
+
+    def stop_background_dispatch(self, timeout: Optional[float] = None) -> None:
+        """Drain pending events and return to inline dispatch."""
+        dispatcher, self._dispatcher = self._dispatcher, None
+        if dispatcher is not None:
+            dispatcher.stop(timeout)
+
+    @property
+    def dispatcher(self) -> Optional[BackgroundDispatcher]:
+        """The active background dispatcher, ``None`` while dispatch is inline."""
+        return self._dispatcher
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued events are delivered (no-op when inline)."""
+        if self._dispatcher is None:
+            return True
+        return self._dispatcher.flush(timeout)
+
+    def _resolve_dispatch(self, event_class: Type[BaseEvent]) -> _Dispatch:
+        """
+        Build and cache the handlers for a concrete event class.
+
+        Handlers registered for any class in ``event_class.__mro__`` apply,
+        in registration order, which matches the previous per-emit
+        ``isinstance`` scan.
+        """
+        with self._handlers_lock:
+            mro = set(event_class.__mro__)
+            dispatch: _Dispatch = tuple(
+                (event_type, handler)
+                for event_type, handlers in self._handlers.items()
+                if event_type in mro
+                for handler in handlers
+            )
+            self._dispatch_cache[event_class] = dispatch
+            return dispatch
+
+    def _invalidate_dispatch_cache(self) -> None:
+        with self._handlers_lock:
+            self._dispatch_cache = {}
+
     def register_handler(
         self, event_type: Type[EventTypes], handler: Callable[[Any, EventTypes], None]
     ) -> None:
         """Register an event handler for a specific event type"""
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
-        self._handlers[event_type].append(
-            cast(Callable[[Any, EventTypes], None], handler)
-        )
+        with self._handlers_lock:
+            if event_type not in self._handlers:
+                self._handlers[event_type] = []
+            self._handlers[event_type].append(
+                cast(Callable[[Any, EventTypes], None], handler)
+            )
+            self._invalidate_dispatch_cache()
+
+    def remove_handlers(self, predicate: Callable[[Callable], bool]) -> int:
+        """
+        Unregister every handler for which ``predicate(handler)`` is true.
+
+        Returns:
+            int: Number of handlers removed.
+        """
+        removed = 0
+        with self._handlers_lock:
+            for event_type in list(self._handlers):
+                handlers = self._handlers[event_type]
+                kept = [handler for handler in handlers if not predicate(handler)]
+                removed += len(handlers) - len(kept)
+                if kept:
+                    self._handlers[event_type] = kept
+                else:
+                    del self._handlers[event_type]
+            self._invalidate_dispatch_cache()
+        return removed
 
     @contextmanager
     def scoped_handlers(self):
@@ -103,13 +268,17 @@ class CrewAIEventsBus:
                 # Do stuff...
             # Handlers are cleared after the context
         """
-        previous_handlers = self._handlers.copy()
-        self._handlers.clear()
+        with self._handlers_lock:
+            previous_handlers = self._handlers.copy()
+            self._handlers.clear()
+            self._invalidate_dispatch_cache()
         try:
             yield
         finally:
-            self._handlers = previous_handlers
+            with self._handlers_lock:
+                self._handlers = previous_handlers
+                self._invalidate_dispatch_cache()
 
 
-# Global instance
-crewai_event_bus = CrewAIEventsBus()
+# Global instance: crewai's own singleton, upgraded by ``CrewAIEventsBus.install()``
+crewai_event_bus = _crewai_event_bus
@@ -1,5 +1,4 @@
-from io import StringIO
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from pydantic import Field, PrivateAttr
 from crewai.llm import LLM
@@ -8,6 +7,7 @@ from crewai.telemetry.telemetry import Telemetry
 from crewai.utilities import Logger
 from crewai.utilities.constants import EMITTER_COLOR
 from crewai.utilities.events.base_event_listener import BaseEventListener
+from crewai.utilities.events.crewai_event_bus import crewai_event_bus
 from crewai.utilities.events.knowledge_events import (
     KnowledgeQueryCompletedEvent,
     KnowledgeQueryFailedEvent,
@@ -27,8 +27,7 @@ from crewai.utilities.events.llm_guardrail_events import (
     LLMGuardrailCompletedEvent,
 )
 from crewai.utilities.events.utils.console_formatter import ConsoleFormatter
-
-from .agent_events import (
+from crewai.utilities.events.agent_events import (
     AgentExecutionCompletedEvent,
     AgentExecutionStartedEvent,
     AgentLogsStartedEvent,
@@ -37,7 +36,7 @@ from .agent_events import (
     LiteAgentExecutionErrorEvent,
     LiteAgentExecutionStartedEvent,
 )
-from .crew_events import (
+from crewai.utilities.events.crew_events import (
     CrewKickoffCompletedEvent,
     CrewKickoffFailedEvent,
     CrewKickoffStartedEvent,
@@ -49,7 +48,7 @@ from .crew_events import (
     CrewTrainFailedEvent,
     CrewTrainStartedEvent,
 )
-from .flow_events import (
+from crewai.utilities.events.flow_events import (
     FlowCreatedEvent,
     FlowFinishedEvent,
     FlowStartedEvent,
@@ -57,19 +56,37 @@ from .flow_events import (
     MethodExecutionFinishedEvent,
     MethodExecutionStartedEvent,
 )
-from .task_events import TaskCompletedEvent, TaskFailedEvent, TaskStartedEvent
-from .tool_usage_events import (
+from crewai.utilities.events.task_events import (
+    TaskCompletedEvent,
+    TaskFailedEvent,
+    TaskStartedEvent,
+)
+from crewai.utilities.events.tool_usage_events import (
     ToolUsageErrorEvent,
     ToolUsageFinishedEvent,
     ToolUsageStartedEvent,
 )
-from .reasoning_events import (
+from crewai.utilities.events.reasoning_events import (
     AgentReasoningStartedEvent,
     AgentReasoningCompletedEvent,
     AgentReasoningFailedEvent,
 )
 
+from .crewai_event_bus import CrewAIEventsBus
 from .listeners.memory_listener import MemoryListener
+from .utils.headless import HeadlessFormatter, is_headless
+from .utils.stream_buffer import StreamBufferRegistry, stream_key
+
+# Streamed text of a failed call shown in its failure message
+FAILED_TAIL_CHARS = 200
+
+# Modules whose handlers make up crewai's own console/telemetry listener
+CREWAI_LISTENER_MODULES = frozenset(
+    {
+        "crewai.utilities.events.event_listener",
+        "crewai.utilities.events.listeners.memory_listener",
+    }
+)
 
 
 class EventListener(BaseEventListener):
@@ -77,42 +94,217 @@ class EventListener(BaseEventListener):
     _telemetry: Telemetry = PrivateAttr(default_factory=lambda: Telemetry())
     logger = Logger(verbose=True, default_color=EMITTER_COLOR)
     execution_spans: Dict[Task, Any] = Field(default_factory=dict)
-    next_chunk = 0
-    text_stream = StringIO()
     knowledge_retrieval_in_progress = False
     knowledge_query_in_progress = False
 
-    def __new__(cls):
+    def __new__(
+        cls, headless: Optional[bool] = None, formatter: Optional[ConsoleFormatter] = None
+    ):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._initialized = False
         return cls._instance
 
-    def __init__(self):
+    def __init__(
+        self, headless: Optional[bool] = None, formatter: Optional[ConsoleFormatter] = None
+    ):
+        """
+        Args:
+            headless: Skip the rich console listeners entirely. Defaults to the
+                ``CREWAI_HEADLESS`` environment variable.
+            formatter: Console formatter to render with when not headless.
+        """
         if not hasattr(self, "_initialized") or not self._initialized:
+            self.headless = is_headless() if headless is None else headless
+            self._console_listeners_registered = False
+            self._console_formatter = formatter or ConsoleFormatter(verbose=True)
+            self.formatter = (
+                HeadlessFormatter() if self.headless else self._console_formatter
+            )
             super().__init__()
             self._telemetry = Telemetry()
             self._telemetry.set_tracer()
             self.execution_spans = {}
+            # Per-call streaming buffers, in place of crewai's class-level
+            # StringIO that every crew in the process appended to and that
+            # was never truncated.
+            self.stream_buffers = StreamBufferRegistry()
             self._initialized = True
-            self.formatter = ConsoleFormatter(verbose=True)
 
-            MemoryListener(formatter=self.formatter)
+            self._memory_listener = (
+                None if self.headless else MemoryListener(formatter=self.formatter)
+            )
+
+    @classmethod
+    def replace_crewai_listener(cls, headless: Optional[bool] = None) -> "EventListener":
+        """
+        Take over from crewai's own EventListener and MemoryListener.
+
+        crewai registers its console + telemetry listener on import. Its
+        handlers are removed from the bus and this listener is registered in
+        their place: telemetry always, console rendering only when not
+        headless. The console reuses crewai's formatter, so ``Crew.verbose``
+        and the agents' pause/resume of live updates keep applying.
+
+        Args:
+            headless: Defaults to the ``CREWAI_HEADLESS`` environment variable.
+
+        Returns:
+            EventListener: The active listener.
+        """
+        from crewai.utilities.events.event_listener import (
+            event_listener as crewai_listener,
+        )
+
+        bus = CrewAIEventsBus.install()
+        bus.remove_handlers(
+            lambda handler: getattr(handler, "__module__", None)
+            in CREWAI_LISTENER_MODULES
+        )
+        listener = cls(headless=headless, formatter=crewai_listener.formatter)
+        if headless is not None:
+            listener.set_headless(headless)
+        return listener
+
+    @property
+    def run_metrics(self) -> Dict[str, int]:
+        """LLM stream buffer metrics since the last crew kickoff started."""
+        return self.stream_buffers.metrics()
+
+    def reset_metrics(self) -> None:
+        self.stream_buffers.reset_metrics()
+
+    def setup_listeners(self, crewai_event_bus):
+        self._setup_telemetry_listeners(crewai_event_bus)
+        self._setup_stream_listeners(crewai_event_bus)
+        if not self.headless:
+            self._setup_console_listeners(crewai_event_bus)
+
+    def set_headless(self, headless: bool = True) -> None:
+        """
+        Switch console rendering off (or back on) at runtime.
+
+        Listeners that are already registered stay registered but talk to a
+        ``HeadlessFormatter``, so no rich objects are built. Prefer setting
+        ``CREWAI_HEADLESS=1`` before ``setup_event_bus()``, which never
+        registers them.
+        """
+        if headless == self.headless:
+            return
+        self.headless = headless
+        if headless:
+            self.formatter = HeadlessFormatter()
+        else:
+            self.formatter = self._console_formatter
+            if not self._console_listeners_registered:
+                self._setup_console_listeners(crewai_event_bus)
+        if self._memory_listener is not None:
+            self._memory_listener.formatter = self.formatter
+        elif not headless:
+            self._memory_listener = MemoryListener(formatter=self.formatter)
+
+    # ----------- TELEMETRY (registered in every mode) -----------
+
+    def _setup_telemetry_listeners(self, crewai_event_bus):
+        @crewai_event_bus.on(CrewKickoffStartedEvent)
+        def on_crew_started_telemetry(source, event: CrewKickoffStartedEvent):
+            self._telemetry.crew_execution_span(source, event.inputs)
+
+        @crewai_event_bus.on(CrewKickoffCompletedEvent)
+        def on_crew_completed_telemetry(source, event: CrewKickoffCompletedEvent):
+            self._telemetry.end_crew(source, event.output.raw)
+
+        @crewai_event_bus.on(CrewTestResultEvent)
+        def on_crew_test_result(source, event: CrewTestResultEvent):
+            self._telemetry.individual_test_result_span(
+                source.crew,
+                event.quality,
+                int(event.execution_duration),
+                event.model,
+            )
+
+        @crewai_event_bus.on(TaskStartedEvent)
+        def on_task_started_telemetry(source, event: TaskStartedEvent):
+            span = self._telemetry.task_started(crew=source.agent.crew, task=source)
+            self.execution_spans[source] = span
+
+        @crewai_event_bus.on(TaskCompletedEvent)
+        def on_task_completed_telemetry(source, event: TaskCompletedEvent):
+            span = self.execution_spans.get(source)
+            if span:
+                self._telemetry.task_ended(span, source, source.agent.crew)
+            self.execution_spans[source] = None
+
+        @crewai_event_bus.on(TaskFailedEvent)
+        def on_task_failed_telemetry(source, event: TaskFailedEvent):
+            span = self.execution_spans.get(source)
+            if span:
+                if source.agent and source.agent.crew:
+                    self._telemetry.task_ended(span, source, source.agent.crew)
+                self.execution_spans[source] = None
+
+        @crewai_event_bus.on(FlowCreatedEvent)
+        def on_flow_created_telemetry(source, event: FlowCreatedEvent):
+            self._telemetry.flow_creation_span(event.flow_name)
+
+        @crewai_event_bus.on(FlowStartedEvent)
+        def on_flow_started_telemetry(source, event: FlowStartedEvent):
+            self._telemetry.flow_execution_span(
+                event.flow_name, list(source._methods.keys())
+            )
+
+        @crewai_event_bus.on(CrewTestStartedEvent)
+        def on_crew_test_started_telemetry(source, event: CrewTestStartedEvent):
+            cloned_crew = source.copy()
+            self._telemetry.test_execution_span(
+                cloned_crew,
+                event.n_iterations,
+                event.inputs,
+                event.eval_llm or "",
+            )
+
+    # ----------- LLM STREAM BUFFERS (registered in every mode) -----------
+
+    def _setup_stream_listeners(self, crewai_event_bus):
+        @crewai_event_bus.on(CrewKickoffStartedEvent)
+        def on_crew_started_streams(source, event: CrewKickoffStartedEvent):
+            self.reset_metrics()
+
+        @crewai_event_bus.on(LLMCallStartedEvent)
+        def on_llm_call_started_stream(source, event: LLMCallStartedEvent):
+            self.stream_buffers.open(stream_key(event))
+
+        @crewai_event_bus.on(LLMStreamChunkEvent)
+        def on_llm_stream_chunk_buffer(source, event: LLMStreamChunkEvent):
+            self.stream_buffers.open(stream_key(event)).write(event.chunk)
+
+        @crewai_event_bus.on(LLMCallCompletedEvent)
+        def on_llm_call_completed_stream(source, event: LLMCallCompletedEvent):
+            self.stream_buffers.release(stream_key(event))
+
+        @crewai_event_bus.on(LLMCallFailedEvent)
+        def on_llm_call_failed_stream(source, event: LLMCallFailedEvent):
+            # The streamed text of a failed call is otherwise lost
+            buffer = self.stream_buffers.release(stream_key(event))
+            streamed = buffer.getvalue() if buffer is not None else ""
+            if streamed:
+                print(
+                    f"LLM call failed after streaming {buffer.size + buffer.dropped_chars} "
+                    f"chars ({event.error}); last output: ...{streamed[-FAILED_TAIL_CHARS:]}"
+                )
 
     # ----------- CREW EVENTS -----------
 
-    def setup_listeners(self, crewai_event_bus):
+    def _setup_console_listeners(self, crewai_event_bus):
+        self._console_listeners_registered = True
+
         @crewai_event_bus.on(CrewKickoffStartedEvent)
         def on_crew_started(source, event: CrewKickoffStartedEvent):
             self.formatter.create_crew_tree(event.crew_name or "Crew", source.id)
-            self._telemetry.crew_execution_span(source, event.inputs)
 
         @crewai_event_bus.on(CrewKickoffCompletedEvent)
         def on_crew_completed(source, event: CrewKickoffCompletedEvent):
-            # Handle telemetry
             final_string_output = event.output.raw
-            self._telemetry.end_crew(source, final_string_output)
-
             self.formatter.update_crew_tree(
                 self.formatter.current_crew_tree,
                 event.crew_name or "Crew",
@@ -146,33 +338,16 @@ class EventListener(BaseEventListener):
         def on_crew_train_failed(source, event: CrewTrainFailedEvent):
             self.formatter.handle_crew_train_failed(event.crew_name or "Crew")
 
-        @crewai_event_bus.on(CrewTestResultEvent)
-        def on_crew_test_result(source, event: CrewTestResultEvent):
-            self._telemetry.individual_test_result_span(
-                source.crew,
-                event.quality,
-                int(event.execution_duration),
-                event.model,
-            )
-
         # ----------- TASK EVENTS -----------
 
         @crewai_event_bus.on(TaskStartedEvent)
         def on_task_started(source, event: TaskStartedEvent):
-            span = self._telemetry.task_started(crew=source.agent.crew, task=source)
-            self.execution_spans[source] = span
             self.formatter.create_task_branch(
                 self.formatter.current_crew_tree, source.id
             )
 
         @crewai_event_bus.on(TaskCompletedEvent)
         def on_task_completed(source, event: TaskCompletedEvent):
-            # Handle telemetry
-            span = self.execution_spans.get(source)
-            if span:
-                self._telemetry.task_ended(span, source, source.agent.crew)
-            self.execution_spans[source] = None
-
             self.formatter.update_task_status(
                 self.formatter.current_crew_tree,
                 source.id,
@@ -182,12 +357,6 @@ class EventListener(BaseEventListener):
 
         @crewai_event_bus.on(TaskFailedEvent)
         def on_task_failed(source, event: TaskFailedEvent):
-            span = self.execution_spans.get(source)
-            if span:
-                if source.agent and source.agent.crew:
-                    self._telemetry.task_ended(span, source, source.agent.crew)
-                self.execution_spans[source] = None
-
             self.formatter.update_task_status(
                 self.formatter.current_crew_tree,
                 source.id,
@@ -247,14 +416,10 @@ class EventListener(BaseEventListener):
 
         @crewai_event_bus.on(FlowCreatedEvent)
         def on_flow_created(source, event: FlowCreatedEvent):
-            self._telemetry.flow_creation_span(event.flow_name)
             self.formatter.create_flow_tree(event.flow_name, str(source.flow_id))
 
         @crewai_event_bus.on(FlowStartedEvent)
         def on_flow_started(source, event: FlowStartedEvent):
-            self._telemetry.flow_execution_span(
-                event.flow_name, list(source._methods.keys())
-            )
             self.formatter.start_flow(event.flow_name, str(source.flow_id))
 
         @crewai_event_bus.on(FlowFinishedEvent)
@@ -365,14 +530,7 @@ class EventListener(BaseEventListener):
 
         @crewai_event_bus.on(LLMStreamChunkEvent)
         def on_llm_stream_chunk(source, event: LLMStreamChunkEvent):
-            self.text_stream.write(event.chunk)
-
-            self.text_stream.seek(self.next_chunk)
-
-            # Read from the in-memory stream
-            content = self.text_stream.read()
-            print(content, end="", flush=True)
-            self.next_chunk = self.text_stream.tell()
+            print(event.chunk, end="", flush=True)
 
         # ----------- LLM GUARDRAIL EVENTS -----------
 
@@ -393,14 +551,6 @@ class EventListener(BaseEventListener):
 
         @crewai_event_bus.on(CrewTestStartedEvent)
         def on_crew_test_started(source, event: CrewTestStartedEvent):
-            cloned_crew = source.copy()
-            self._telemetry.test_execution_span(
-                cloned_crew,
-                event.n_iterations,
-                event.inputs,
-                event.eval_llm or "",
-            )
-
             self.formatter.handle_crew_test_started(
                 event.crew_name or "Crew", source.id, event.n_iterations
             )
@@ -512,6 +662,3 @@ class EventListener(BaseEventListener):
                 event.formatted_answer,
                 event.verbose,
             )
-
-
-event_listener = EventListener()
@@ -1 +1 @@
-from .agentops_listener import agentops_listener
+from .agentops_listener import AgentOpsListener
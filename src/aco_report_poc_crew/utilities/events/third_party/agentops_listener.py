@@ -62,6 +62,3 @@ class AgentOpsListener(BaseEventListener):
                 self.session.create_agent(
                     name="Task Evaluator", agent_id=str(source.original_agent.id)
                 )
-
-
-agentops_listener = AgentOpsListener()
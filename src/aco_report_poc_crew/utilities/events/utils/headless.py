@@ -0,0 +1,39 @@
+"""Headless (no console rendering) mode for production workers."""
+
+import os
+from typing import Any
+
+HEADLESS_ENV_VAR = "CREWAI_HEADLESS"
+TRUTHY_VALUES = frozenset({"1", "true", "yes", "on"})
+
+
+def env_flag(name: str) -> bool:
+    """True when environment variable ``name`` is set to 1/true/yes/on."""
+    return os.environ.get(name, "").strip().lower() in TRUTHY_VALUES
+
+
+def is_headless() -> bool:
+    """True when ``CREWAI_HEADLESS`` is set to 1/true/yes/on."""
+    return env_flag(HEADLESS_ENV_VAR)
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    return None
+
+
+class HeadlessFormatter:
+    """
+    Stand-in for ``ConsoleFormatter`` that builds no rich objects.
+
+    Every ``current_*`` branch reads as ``None`` and every other method is a
+    no-op, so listeners written against ``ConsoleFormatter`` keep working.
+    """
+
+    verbose: bool = False
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("current_"):
+            return None
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return _noop
@@ -0,0 +1,116 @@
+"""Bounded per-call buffers for streamed LLM output."""
+
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Hashable, Optional
+
+DEFAULT_MAX_STREAM_CHARS = 64_000
+
+
+class BoundedTextBuffer:
+    """
+    Ring buffer of text chunks capped at ``max_chars``.
+
+    When a write pushes the total past the cap the oldest chunks (or the
+    head of the oldest chunk) are discarded, so memory stays bounded no
+    matter how long the stream runs.
+    """
+
+    def __init__(self, max_chars: int = DEFAULT_MAX_STREAM_CHARS):
+        if max_chars < 1:
+            raise ValueError("max_chars must be at least 1")
+        self.max_chars = max_chars
+        self._chunks: Deque[str] = deque()
+        self.size = 0
+        self.peak_size = 0
+        self.dropped_chars = 0
+
+    def write(self, chunk: str) -> None:
+        if not chunk:
+            return
+        if len(chunk) > self.max_chars:
+            self.dropped_chars += len(chunk) - self.max_chars
+            chunk = chunk[-self.max_chars :]
+        self._chunks.append(chunk)
+        self.size += len(chunk)
+        while self.size > self.max_chars:
+            overflow = self.size - self.max_chars
+            oldest = self._chunks[0]
+            if len(oldest) <= overflow:
+                self._chunks.popleft()
+                self.size -= len(oldest)
+                self.dropped_chars += len(oldest)
+            else:
+                self._chunks[0] = oldest[overflow:]
+                self.size -= overflow
+                self.dropped_chars += overflow
+        self.peak_size = max(self.peak_size, self.size)
+
+    def getvalue(self) -> str:
+        return "".join(self._chunks)
+
+
+def stream_key(event: Any) -> Hashable:
+    """
+    Buffer key of the LLM call an LLM event belongs to.
+
+    ``(agent_id, task_id)`` when the call runs for an agent or task. Calls
+    without either (planner, converter, evaluator LLMs) fall back to the
+    event's ``source_fingerprint`` and then to the emitting thread: an LLM
+    call emits its started, chunk and completed events synchronously on the
+    thread that makes it, so that identifies the call in flight.
+    """
+    if event.agent_id or event.task_id:
+        return ("call", event.agent_id, event.task_id)
+    if event.source_fingerprint:
+        return ("source", event.source_fingerprint)
+    return ("thread", threading.get_ident())
+
+
+class StreamBufferRegistry:
+    """
+    One ``BoundedTextBuffer`` per in-flight LLM call.
+
+    Buffers are keyed by ``stream_key`` of the LLM events and are released
+    on call completion/failure; the largest size any buffer reached is kept
+    in ``peak_size`` for run metrics.
+    """
+
+    def __init__(self, max_chars: int = DEFAULT_MAX_STREAM_CHARS):
+        self.max_chars = max_chars
+        self._buffers: Dict[Hashable, BoundedTextBuffer] = {}
+        self.reset_metrics()
+
+    def reset_metrics(self) -> None:
+        self.peak_size = 0
+        self.dropped_chars = 0
+        self.streamed_calls = 0
+
+    def open(self, key: Hashable) -> BoundedTextBuffer:
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            buffer = self._buffers[key] = BoundedTextBuffer(self.max_chars)
+        return buffer
+
+    def release(self, key: Hashable) -> Optional[BoundedTextBuffer]:
+        buffer = self._buffers.pop(key, None)
+        if buffer is not None and buffer.peak_size:
+            self.streamed_calls += 1
+            self.peak_size = max(self.peak_size, buffer.peak_size)
+            self.dropped_chars += buffer.dropped_chars
+        return buffer
+
+    @property
+    def open_buffers(self) -> int:
+        return len(self._buffers)
+
+    def metrics(self) -> Dict[str, int]:
+        peak = max(
+            [self.peak_size] + [b.peak_size for b in self._buffers.values()]
+        )
+        return {
+            "stream_buffer_peak_chars": peak,
+            "stream_buffer_dropped_chars": self.dropped_chars,
+            "streamed_llm_calls": self.streamed_calls,
+            "open_stream_buffers": self.open_buffers,
+        }
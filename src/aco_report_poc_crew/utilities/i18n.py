@@ -1,11 +1,31 @@
 import json
 import os
+from functools import lru_cache
 from typing import Dict, Optional, Union
 
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 """Internationalization support for CrewAI prompts and messages."""
 
+
+@lru_cache(maxsize=None)
+def _load_prompt_table(path: str) -> Dict[str, Dict[str, str]]:
+    """
+    Parse a prompt file once per process.
+
+    Every agent, tool usage and parser builds its own ``I18N``; they all share
+    the table returned here, so treat it as read-only. Failed loads are not
+    cached and are retried on the next construction.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f) or {}
+
+
+def _default_prompt_file() -> str:
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    return os.path.join(dir_path, "../translations/en.json")
+
+
 class I18N(BaseModel):
     """Handles loading and retrieving internationalized prompts."""
     _prompts: Dict[str, Dict[str, str]] = PrivateAttr()
@@ -17,24 +37,14 @@ class I18N(BaseModel):
     @model_validator(mode="after")
     def load_prompts(self) -> "I18N":
         """Load prompts from a JSON file."""
+        prompts_path = self.prompt_file or _default_prompt_file()
         try:
-            if self.prompt_file:
-                with open(self.prompt_file, "r", encoding="utf-8") as f:
-                    self._prompts = json.load(f)
-            else:
-                dir_path = os.path.dirname(os.path.realpath(__file__))
-                prompts_path = os.path.join(dir_path, "../translations/en.json")
-
-                with open(prompts_path, "r", encoding="utf-8") as f:
-                    self._prompts = json.load(f)
+            self._prompts = _load_prompt_table(os.path.realpath(prompts_path))
         except FileNotFoundError:
             raise Exception(f"Prompt file '{self.prompt_file}' not found.")
         except json.JSONDecodeError:
             raise Exception("Error decoding JSON from the prompts file.")
 
-        if not self._prompts:
-            self._prompts = {}
-
         return self
 
     def slice(self, slice: str) -> str:
@@ -0,0 +1,300 @@
+"""Record/replay of LLM calls, so crews can run offline and deterministically."""
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from enum import Enum
+from typing import Any, Deque, Dict, List, Optional, Union
+
+import litellm
+import portalocker
+from crewai.llm import LLM
+from crewai.utilities.events import crewai_event_bus
+from crewai.utilities.events.llm_events import (
+    LLMCallStartedEvent,
+    LLMCallType,
+)
+
+CASSETTE_ENV_VAR = "LLM_CASSETTE"
+CASSETTE_MODE_ENV_VAR = "LLM_CASSETTE_MODE"
+CASSETTE_LATENCY_ENV_VAR = "LLM_CASSETTE_LATENCY_MS"
+CASSETTE_JITTER_ENV_VAR = "LLM_CASSETTE_JITTER_MS"
+CASSETTE_SEED_ENV_VAR = "LLM_CASSETTE_SEED"
+
+
+class CassetteMode(str, Enum):
+    RECORD = "record"  # call the real LLM and append each exchange
+    REPLAY = "replay"  # serve recorded responses, never touch the network
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when nothing recorded is left to serve."""
+
+
+class Cassette:
+    """
+    A JSONL file of LLM exchanges, one ``{"key", "model", "messages",
+    "response", "usage"}`` object per line.
+
+    Replay looks exchanges up by a hash of (model, messages, tools). Identical
+    requests are served in recording order. A request that was never recorded
+    gets the next unserved exchange of the same model (counted in ``misses``),
+    so small prompt drifts do not break a sequential replay.
+
+    Attributes:
+        path (str): Cassette file.
+        mode (CassetteMode): Record or replay.
+        latency_ms (float): Mean synthetic latency per replayed call.
+        jitter_ms (float): Standard deviation of the synthetic latency.
+        hits (int): Replayed calls that matched a recorded request.
+        misses (int): Replayed calls served by recording order instead.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: Union[CassetteMode, str] = CassetteMode.REPLAY,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        seed: int = 0,
+    ):
+        self.path = path
+        self.mode = CassetteMode(mode)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.hits = 0
+        self.misses = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._by_key: Dict[str, Deque[int]] = defaultdict(deque)
+        self._by_model: Dict[str, List[int]] = defaultdict(list)
+        self._exchanges: List[Dict[str, Any]] = []
+        self._served: set[int] = set()
+
+        if self.mode is CassetteMode.REPLAY:
+            self._load()
+
+    @staticmethod
+    def request_key(model: str, messages: Any, tools: Optional[List[dict]]) -> str:
+        request = {"model": model, "messages": messages, "tools": tools}
+        encoded = json.dumps(request, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def record(
+        self,
+        model: str,
+        messages: Any,
+        tools: Optional[List[dict]],
+        response: Any,
+        usage: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """Append one exchange; safe across threads and worker processes."""
+        exchange = {
+            "key": self.request_key(model, messages, tools),
+            "model": model,
+            "messages": messages,
+            "response": response if _is_json(response) else str(response),
+            "usage": usage or {},
+        }
+        line = json.dumps(exchange, default=str) + "\n"
+        with self._lock, portalocker.Lock(self.path, mode="a", encoding="utf-8") as f:
+            f.write(line)
+
+    def play(
+        self, model: str, messages: Any, tools: Optional[List[dict]]
+    ) -> Dict[str, Any]:
+        """Return the recorded exchange for this request."""
+        key = self.request_key(model, messages, tools)
+        with self._lock:
+            queue = self._by_key.get(key)
+            if queue:
+                # Extra identical calls beyond the recording repeat the last one
+                index = queue.popleft() if len(queue) > 1 else queue[0]
+                self.hits += 1
+            else:
+                index = self._next_unserved(model)
+                self.misses += 1
+            self._served.add(index)
+            return self._exchanges[index]
+
+    def delay(self) -> None:
+        """Sleep for one synthetic latency sample (deterministic per seed)."""
+        if self.latency_ms <= 0 and self.jitter_ms <= 0:
+            return
+        with self._lock:
+            sample = self._rng.gauss(self.latency_ms, self.jitter_ms)
+        time.sleep(max(sample, 0.0) / 1000)
+
+    def _next_unserved(self, model: str) -> int:
+        candidates = self._by_model.get(model) or []
+        for index in candidates:
+            if index not in self._served:
+                return index
+        raise CassetteMissError(
+            f"No recorded exchange left for model '{model}' in {self.path}"
+        )
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(f"Cassette '{self.path}' not found.")
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                exchange = json.loads(line)
+                index = len(self._exchanges)
+                self._exchanges.append(exchange)
+                self._by_key[exchange["key"]].append(index)
+                self._by_model[exchange["model"]].append(index)
+
+
+class CassetteLLM(LLM):
+    """
+    ``LLM`` that records its calls to, or replays them from, a ``Cassette``.
+
+    In replay mode no request leaves the process: the recorded response is
+    returned after the cassette's synthetic latency, the usual LLM call
+    events are emitted, and recorded token usage is added to the caller's
+    token counter so usage metrics match the recorded run.
+    """
+
+    def __init__(self, cassette: Cassette, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> Union[str, Any]:
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+
+        if self.cassette.mode is CassetteMode.RECORD:
+            before = _usage_snapshot(callbacks)
+            response = super().call(
+                messages,
+                tools=tools,
+                callbacks=callbacks,
+                available_functions=available_functions,
+                from_task=from_task,
+                from_agent=from_agent,
+            )
+            usage = _usage_delta(before, _usage_snapshot(callbacks))
+            if not any(usage.values()):
+                # litellm reports usage to callbacks asynchronously
+                usage = _estimate_usage(self.model, messages, response)
+            self.cassette.record(self.model, messages, tools, response, usage)
+            return response
+
+        crewai_event_bus.emit(
+            self,
+            event=LLMCallStartedEvent(
+                messages=messages,
+                tools=tools,
+                callbacks=callbacks,
+                available_functions=available_functions,
+                from_task=from_task,
+                from_agent=from_agent,
+            ),
+        )
+        exchange = self.cassette.play(self.model, messages, tools)
+        self.cassette.delay()
+        _apply_usage(callbacks, exchange.get("usage") or {})
+        response = exchange["response"]
+        self._handle_emit_call_events(
+            response, LLMCallType.LLM_CALL, from_task, from_agent, messages
+        )
+        return response
+
+
+_active_cassettes: Dict[str, Cassette] = {}
+_active_lock = threading.Lock()
+
+
+def active_cassette() -> Optional[Cassette]:
+    """
+    The process-wide cassette configured through the environment, if any.
+
+    ``LLM_CASSETTE`` names the file, ``LLM_CASSETTE_MODE`` is ``record`` or
+    ``replay`` (default), and ``LLM_CASSETTE_LATENCY_MS`` /
+    ``LLM_CASSETTE_JITTER_MS`` / ``LLM_CASSETTE_SEED`` shape the synthetic
+    latency of replayed calls.
+    """
+    path = os.environ.get(CASSETTE_ENV_VAR)
+    if not path:
+        return None
+    with _active_lock:
+        cassette = _active_cassettes.get(path)
+        if cassette is None:
+            cassette = Cassette(
+                path,
+                mode=os.environ.get(CASSETTE_MODE_ENV_VAR, CassetteMode.REPLAY),
+                latency_ms=float(os.environ.get(CASSETTE_LATENCY_ENV_VAR, 0)),
+                jitter_ms=float(os.environ.get(CASSETTE_JITTER_ENV_VAR, 0)),
+                seed=int(os.environ.get(CASSETTE_SEED_ENV_VAR, 0)),
+            )
+            _active_cassettes[path] = cassette
+            if cassette.mode is CassetteMode.REPLAY:
+                # Fully offline: telemetry checks this on every operation
+                os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+        return cassette
+
+
+def _is_json(value: Any) -> bool:
+    try:
+        json.dumps(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _token_processes(callbacks: Optional[List[Any]]) -> List[Any]:
+    return [
+        callback.token_cost_process
+        for callback in callbacks or []
+        if getattr(callback, "token_cost_process", None) is not None
+    ]
+
+
+def _usage_snapshot(callbacks: Optional[List[Any]]) -> Dict[str, int]:
+    processes = _token_processes(callbacks)
+    if not processes:
+        return {}
+    summary = processes[0].get_summary()
+    return {
+        "prompt_tokens": summary.prompt_tokens,
+        "completion_tokens": summary.completion_tokens,
+        "cached_prompt_tokens": summary.cached_prompt_tokens,
+    }
+
+
+def _usage_delta(before: Dict[str, int], after: Dict[str, int]) -> Dict[str, int]:
+    return {key: after[key] - before.get(key, 0) for key in after}
+
+
+def _estimate_usage(model: str, messages: Any, response: Any) -> Dict[str, int]:
+    try:
+        return {
+            "prompt_tokens": litellm.token_counter(model=model, messages=messages),
+            "completion_tokens": litellm.token_counter(model=model, text=str(response)),
+            "cached_prompt_tokens": 0,
+        }
+    except Exception:
+        return {}
+
+
+def _apply_usage(callbacks: Optional[List[Any]], usage: Dict[str, int]) -> None:
+    for process in _token_processes(callbacks):
+        process.sum_successful_requests(1)
+        process.sum_prompt_tokens(usage.get("prompt_tokens", 0))
+        process.sum_completion_tokens(usage.get("completion_tokens", 0))
+        process.sum_cached_prompt_tokens(usage.get("cached_prompt_tokens", 0))
@@ -1,9 +1,145 @@
+import json
 import os
-from typing import Any, Dict, List, Optional, Union
+import threading
+from collections import Counter
+from typing import Any, Dict, Hashable, List, Optional, Union
 
+import httpx
+import litellm
 from crewai.cli.constants import DEFAULT_LLM_MODEL, ENV_VARS, LITELLM_PARAMS
 from crewai.llm import LLM, BaseLLM
 
+from .llm_cassette import CassetteLLM, active_cassette
+
+# Shared LLM instances keyed by their normalized constructor parameters.
+# Agents built from the same model name/settings get the same object, as the
+# crew's own agents already do with the module-level LLM in crew.py.
+_llm_registry: Dict[Hashable, LLM] = {}
+_registry_lock = threading.Lock()
+_pool_stats: Counter = Counter()
+
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 120.0
+
+
+class _KeepAliveTransport(httpx.HTTPTransport):
+    """HTTP transport that counts requests, new connections and TLS handshakes."""
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        _pool_stats["http_requests"] += 1
+        request.extensions = {**request.extensions, "trace": _trace_connection}
+        return super().handle_request(request)
+
+
+def _trace_connection(event_name: str, info: Dict[str, Any]) -> None:
+    if event_name == "connection.connect_tcp.complete":
+        _pool_stats["http_new_connections"] += 1
+    elif event_name == "connection.start_tls.complete":
+        _pool_stats["http_tls_handshakes"] += 1
+
+
+def enable_keep_alive(
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+) -> httpx.Client:
+    """
+    Install a process-wide keep-alive HTTP client for litellm calls.
+
+    litellm's Azure/OpenAI handlers pass ``litellm.client_session`` to the
+    SDK clients they build, so every call reuses pooled connections instead of
+    paying a TCP + TLS handshake. A client installed elsewhere is left alone.
+    """
+    with _registry_lock:
+        if litellm.client_session is None:
+            limits = httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=keepalive_expiry,
+            )
+            litellm.client_session = httpx.Client(
+                transport=_KeepAliveTransport(limits=limits), limits=limits
+            )
+        return litellm.client_session
+
+
+def get_shared_llm(**params: Any) -> LLM:
+    """
+    Return the shared ``LLM`` for these constructor parameters, creating it
+    on first use.
+
+    Parameters set to None are ignored, so ``get_shared_llm(model="gpt-4o")``
+    and an environment-built LLM with the same effective settings share an
+    instance. Instances are shared by reference; callers must not mutate them.
+
+    When ``LLM_CASSETTE`` is set the instance is a ``CassetteLLM`` that
+    records to, or replays from, that cassette (see ``llm_cassette``).
+    """
+    params = {key: value for key, value in params.items() if value is not None}
+    cassette = active_cassette()
+    key = (_registry_key(params), cassette.path if cassette else None)
+    enable_keep_alive()
+    with _registry_lock:
+        shared = _llm_registry.get(key)
+        if shared is not None:
+            _pool_stats["llm_hits"] += 1
+            return shared
+    if cassette is not None:
+        created = CassetteLLM(cassette=cassette, **params)
+    else:
+        created = LLM(**params)
+    with _registry_lock:
+        # Another thread may have won the race; keep the first instance
+        shared = _llm_registry.setdefault(key, created)
+        _pool_stats["llm_misses" if shared is created else "llm_hits"] += 1
+    return shared
+
+
+def get_llm_pool_stats() -> Dict[str, int]:
+    """
+    Registry and connection reuse counters for this process.
+
+    ``http_reused_connections`` counts requests served on an already open
+    connection.
+    """
+    with _registry_lock:
+        stats = {
+            "llm_instances": len(_llm_registry),
+            "llm_hits": _pool_stats["llm_hits"],
+            "llm_misses": _pool_stats["llm_misses"],
+            "http_requests": _pool_stats["http_requests"],
+            "http_new_connections": _pool_stats["http_new_connections"],
+            "http_tls_handshakes": _pool_stats["http_tls_handshakes"],
+        }
+    stats["http_reused_connections"] = max(
+        stats["http_requests"] - stats["http_new_connections"], 0
+    )
+    return stats
+
+
+def clear_llm_registry() -> None:
+    """Forget shared LLM instances and reset the pool counters."""
+    with _registry_lock:
+        _llm_registry.clear()
+        _pool_stats.clear()
+
+
+def _registry_key(params: Dict[str, Any]) -> Hashable:
+    return tuple(sorted((key, _freeze(value)) for key, value in params.items()))
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple)) and not value:
+        return ()
+    try:
+        return json.dumps(value, sort_keys=True)
+    except (TypeError, ValueError):
+        # Callbacks and other objects: only the very same object matches
+        if isinstance(value, (list, tuple)):
+            return tuple(_freeze(item) for item in value)
+        return ("id", id(value))
+
 
 def create_llm(
     llm_value: Union[str, LLM, Any, None] = None,
@@ -11,6 +147,10 @@ def create_llm(
     """
     Creates or returns an LLM instance based on the given llm_value.
 
+    LLMs built from a model name, an unknown object or the environment come
+    from a process-wide registry, so equal settings share one instance (and
+    one keep-alive HTTP client) across agents, planners and evaluators.
+
     Args:
         llm_value (str | BaseLLM | Any | None):
             - str: The model name (e.g., "gpt-4").
@@ -29,8 +169,7 @@ def create_llm(
     # 2) If llm_value is a string (model name)
     if isinstance(llm_value, str):
         try:
-            created_llm = LLM(model=llm_value)
-            return created_llm
+            return get_shared_llm(model=llm_value)
         except Exception as e:
             print(f"Failed to instantiate LLM with model='{llm_value}': {e}")
             return None
@@ -56,7 +195,7 @@ def create_llm(
         base_url: Optional[str] = getattr(llm_value, "base_url", None)
         api_base: Optional[str] = getattr(llm_value, "api_base", None)
 
-        created_llm = LLM(
+        return get_shared_llm(
             model=model,
             temperature=temperature,
             max_tokens=max_tokens,
@@ -66,7 +205,6 @@ def create_llm(
             base_url=base_url,
             api_base=api_base,
         )
-        return created_llm
     except Exception as e:
         print(f"Error instantiating LLM from unknown object type: {e}")
         return None
@@ -171,13 +309,9 @@ def _llm_via_environment_or_fallback() -> Optional[LLM]:
                         f"Expected env_var to be a dictionary, but got {type(env_var)}"
                     )
 
-    # Remove None values
-    llm_params = {k: v for k, v in llm_params.items() if v is not None}
-
-    # Try creating the LLM
+    # Try creating (or reusing) the LLM; None values are dropped by the registry
     try:
-        new_llm = LLM(**llm_params)
-        return new_llm
+        return get_shared_llm(**llm_params)
     except Exception as e:
         print(
             f"Error instantiating LLM from environment/fallback: {type(e).__name__}: {e}"
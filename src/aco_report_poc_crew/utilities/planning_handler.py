@@ -6,6 +6,8 @@ from pydantic import BaseModel, Field
 from crewai.agent import Agent
 from crewai.task import Task
 
+from .llm_utils import create_llm
+
 """Handles planning and coordination of crew tasks."""
 logger = logging.getLogger(__name__)
 
@@ -59,7 +61,7 @@ class CrewPlanner:
                 "available to each agent so that they can perform the tasks in an exemplary manner"
             ),
             backstory="Planner agent for crew planning",
-            llm=self.planning_agent_llm,
+            llm=create_llm(self.planning_agent_llm) or self.planning_agent_llm,
         )
 
     def _create_planner_task(self, planning_agent: Agent, tasks_summary: str) -> Task:
@@ -1,7 +1,7 @@
 import json
 import uuid
 from datetime import date, datetime
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Tuple, Union
 
 from pydantic import BaseModel
 
@@ -11,64 +11,171 @@ Serializable = Union[
 ]
 
 
+_NATIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+_CONTAINER_TYPES = (dict, list, tuple, set)
+_CYCLE_MARKER = "<circular reference>"
+_EXIT = object()  # stack marker: leaving a container, drop it from the path
+
+# (value, depth, exclude, parent container, slot in parent)
+_Frame = Tuple[Any, int, Any, Any, Any]
+
+
 def to_serializable(
     obj: Any,
     exclude: set[str] | None = None,
     max_depth: int = 5,
+    max_str_len: int | None = None,
     _current_depth: int = 0,
 ) -> Serializable:
     """Converts a Python object into a JSON-compatible representation.
 
     Supports primitives, datetime objects, collections, dictionaries, and
-    Pydantic models. Recursion depth is limited to prevent infinite nesting.
+    Pydantic models. Nesting depth is limited to prevent infinite nesting.
     Non-convertible objects default to their string representations.
 
+    The walk is iterative, so deep structures cannot exhaust the Python
+    stack. Containers that only hold JSON-native scalars are copied in one
+    step, and a container that (directly or indirectly) contains itself is
+    replaced by ``"<circular reference>"`` instead of being expanded until
+    ``max_depth``.
+
     Args:
         obj (Any): Object to transform.
         exclude (set[str], optional): Set of keys to exclude from the result.
-        max_depth (int, optional): Maximum recursion depth. Defaults to 5.
+        max_depth (int, optional): Maximum nesting depth. Defaults to 5.
+        max_str_len (int, optional): Truncate longer strings (including
+            ``repr`` fallbacks) to this many characters. Defaults to None
+            (no limit).
 
     Returns:
         Serializable: A JSON-compatible structure.
     """
-    if _current_depth >= max_depth:
-        return repr(obj)
-
-    if exclude is None:
-        exclude = set()
-
-    if isinstance(obj, (str, int, float, bool, type(None))):
-        return obj
-    elif isinstance(obj, uuid.UUID):
-        return str(obj)
-    elif isinstance(obj, (date, datetime)):
-        return obj.isoformat()
-    elif isinstance(obj, (list, tuple, set)):
-        return [
-            to_serializable(
-                item, max_depth=max_depth, _current_depth=_current_depth + 1
-            )
-            for item in obj
-        ]
-    elif isinstance(obj, dict):
-        return {
-            _to_serializable_key(key): to_serializable(
-                obj=value,
-                exclude=exclude,
-                max_depth=max_depth,
-                _current_depth=_current_depth + 1,
-            )
-            for key, value in obj.items()
-            if key not in exclude
-        }
-    elif isinstance(obj, BaseModel):
-        return to_serializable(
-            obj=obj.model_dump(exclude=exclude),
-            max_depth=max_depth,
-            _current_depth=_current_depth + 1,
-        )
+    root: List[Serializable] = [None]
+    # Ids of the containers on the current path, for cycle detection
+    path: set[int] = set()
+    stack: List[_Frame] = [(obj, _current_depth, exclude, root, 0)]
+
+    while stack:
+        item, depth, excl, parent, slot = stack.pop()
+        item_type = type(item)
+
+        if item is _EXIT:
+            path.discard(slot)
+        elif depth >= max_depth:
+            parent[slot] = _truncate(repr(item), max_str_len)
+        elif item_type in _NATIVE_TYPES:
+            parent[slot] = _truncate_native(item, max_str_len)
+        elif item_type in _CONTAINER_TYPES or isinstance(item, _CONTAINER_TYPES):
+            if id(item) in path:
+                parent[slot] = _CYCLE_MARKER
+            else:
+                _expand(
+                    item, depth, excl, parent, slot, max_depth, max_str_len, path, stack
+                )
+        elif isinstance(item, str):
+            parent[slot] = _truncate(item, max_str_len)
+        elif isinstance(item, (int, float, bool)):
+            parent[slot] = item
+        elif isinstance(item, uuid.UUID):
+            parent[slot] = str(item)
+        elif isinstance(item, (date, datetime)):
+            parent[slot] = item.isoformat()
+        elif isinstance(item, BaseModel):
+            # Serialize the dump one level down, as a plain dict
+            stack.append((item.model_dump(exclude=excl), depth + 1, None, parent, slot))
+        else:
+            parent[slot] = _truncate(repr(item), max_str_len)
+
+    return root[0]
+
+
+def _expand(
+    item: Any,
+    depth: int,
+    exclude: set[str] | None,
+    parent: Any,
+    slot: Any,
+    max_depth: int,
+    max_str_len: int | None,
+    path: set[int],
+    stack: List[_Frame],
+) -> None:
+    """Place a container's result in ``parent[slot]`` and queue its nested values."""
+    is_dict = isinstance(item, dict)
+    child_depth = depth + 1
+    inline = child_depth < max_depth
+    if inline:
+        native = _native_copy(item, is_dict, exclude, max_str_len)
+        if native is not None:
+            parent[slot] = native
+            return
+
+    path.add(id(item))
+    stack.append((_EXIT, depth, None, None, id(item)))
+    # Native scalars are filled in directly; only the rest is deferred
+    pending: List[_Frame] = []
+    if is_dict:
+        result: Dict[str, Serializable] = {}
+        parent[slot] = result
+        # Non-string keys may collide once stringified; defer every value
+        # then so the last duplicate still wins, as with a dict literal
+        inline = inline and all(type(key) is str for key in item)
+        for key, value in item.items():
+            if exclude is not None and key in exclude:
+                continue
+            if inline:
+                if type(value) in _NATIVE_TYPES:
+                    result[key] = _truncate_native(value, max_str_len)
+                    continue
+            else:
+                key = _to_serializable_key(key)
+            # Placeholder keeps the input key order
+            result[key] = None
+            pending.append((value, child_depth, exclude, result, key))
     else:
-        return repr(obj)
+        result_list: List[Serializable] = []
+        parent[slot] = result_list
+        for index, value in enumerate(item):
+            if inline and type(value) in _NATIVE_TYPES:
+                result_list.append(_truncate_native(value, max_str_len))
+            else:
+                result_list.append(None)
+                pending.append((value, child_depth, None, result_list, index))
+    pending.reverse()
+    stack.extend(pending)
+
+
+def _native_copy(
+    item: Any, is_dict: bool, exclude: set[str] | None, max_str_len: int | None
+) -> Union[List[Serializable], Dict[str, Serializable], None]:
+    """Shallow copy of a container of JSON-native scalars, or None if it has others."""
+    values = item.values() if is_dict else item
+    for value in values:
+        value_type = type(value)
+        if value_type not in _NATIVE_TYPES:
+            return None
+        if max_str_len is not None and value_type is str and len(value) > max_str_len:
+            return None
+    if not is_dict:
+        return list(item)
+    for key in item:
+        if type(key) is not str:
+            return None
+    if exclude:
+        return {key: value for key, value in item.items() if key not in exclude}
+    return dict(item)
+
+
+def _truncate_native(value: SerializablePrimitive, max_str_len: int | None):
+    if type(value) is str:
+        return _truncate(value, max_str_len)
+    return value
+
+
+def _truncate(value: str, max_str_len: int | None) -> str:
+    if max_str_len is None or len(value) <= max_str_len:
+        return value
+    return f"{value[:max_str_len]}...[truncated {len(value) - max_str_len} chars]"
 
 
 def _to_serializable_key(key: Any) -> str:
@@ -1,10 +1,72 @@
 import re
 from typing import Any, Dict, List, Optional, Union
 
+# Matches {variable_name} where variable_name starts with a letter/underscore
+# and contains only letters, numbers, underscores and hyphens
+_VARIABLE_PATTERN = re.compile(r"\{([A-Za-z_][A-Za-z0-9_\-]*)\}")
+
+InputValue = Union[str, int, float, Dict[str, Any], List[Any]]
+
+
+def _validate_type(value: Any) -> None:
+    """Recursively check that a value only contains supported types."""
+    if value is None:
+        return
+    if isinstance(value, (str, int, float, bool)):
+        return
+    if isinstance(value, (dict, list)):
+        for item in value.values() if isinstance(value, dict) else value:
+            _validate_type(item)
+        return
+    raise ValueError(
+        f"Unsupported type {type(value).__name__} in inputs. "
+        "Only str, int, float, bool, dict, and list are allowed."
+    )
+
+
+def _validate_inputs(inputs: Dict[str, Any]) -> None:
+    for key, value in inputs.items():
+        try:
+            _validate_type(value)
+        except ValueError as e:
+            raise ValueError(f"Invalid value for key '{key}': {str(e)}") from e
+
+
+class InterpolationInputs(dict):
+    """
+    Inputs validated once and stringified at most once per key.
+
+    A kickoff interpolates the same inputs into every task description,
+    expected output and agent role/goal/backstory. Wrapping them once with
+    ``prepare_inputs`` lets ``interpolate_only`` skip re-validating the whole
+    (possibly large) payload and calling ``str()`` on it for every template.
+    Treat the mapping as read-only after preparing it.
+    """
+
+    def __init__(self, inputs: Dict[str, InputValue]):
+        super().__init__(inputs)
+        _validate_inputs(self)
+        self._rendered: Dict[str, str] = {}
+
+    def rendered(self, key: str) -> str:
+        value = self._rendered.get(key)
+        if value is None:
+            value = self._rendered[key] = str(self[key])
+        return value
+
+
+def prepare_inputs(
+    inputs: Union[Dict[str, InputValue], InterpolationInputs],
+) -> InterpolationInputs:
+    """Validate inputs once for a kickoff; returns them as ``InterpolationInputs``."""
+    if isinstance(inputs, InterpolationInputs):
+        return inputs
+    return InterpolationInputs(inputs)
+
 
 def interpolate_only(
     input_string: Optional[str],
-    inputs: Dict[str, Union[str, int, float, Dict[str, Any], List[Any]]],
+    inputs: Union[Dict[str, InputValue], InterpolationInputs],
 ) -> str:
     """Interpolate placeholders (e.g., {key}) in a string while leaving JSON untouched.
     Only interpolates placeholders that follow the pattern {variable_name} where
@@ -16,6 +78,8 @@ def interpolate_only(
         inputs: Dictionary mapping template variables to their values.
                Supported value types are strings, integers, floats, and dicts/lists
                containing only these types and other nested dicts/lists.
+               Pass ``prepare_inputs(inputs)`` when interpolating many templates
+               with the same inputs so validation and ``str()`` happen once.
 
     Returns:
         The interpolated string with all template variables replaced with their values.
@@ -24,28 +88,8 @@ def interpolate_only(
     Raises:
         ValueError: If a value contains unsupported types or a template variable is missing
     """
-
-    # Validation function for recursive type checking
-    def validate_type(value: Any) -> None:
-        if value is None:
-            return
-        if isinstance(value, (str, int, float, bool)):
-            return
-        if isinstance(value, (dict, list)):
-            for item in value.values() if isinstance(value, dict) else value:
-                validate_type(item)
-            return
-        raise ValueError(
-            f"Unsupported type {type(value).__name__} in inputs. "
-            "Only str, int, float, bool, dict, and list are allowed."
-        )
-
-    # Validate all input values
-    for key, value in inputs.items():
-        try:
-            validate_type(value)
-        except ValueError as e:
-            raise ValueError(f"Invalid value for key '{key}': {str(e)}") from e
+    if not isinstance(inputs, InterpolationInputs):
+        _validate_inputs(inputs)
 
     if input_string is None or not input_string:
         return ""
@@ -56,13 +100,8 @@ def interpolate_only(
             "Inputs dictionary cannot be empty when interpolating variables"
         )
 
-    # The regex pattern to find valid variable placeholders
-    # Matches {variable_name} where variable_name starts with a letter/underscore
-    # and contains only letters, numbers, and underscores
-    pattern = r"\{([A-Za-z_][A-Za-z0-9_\-]*)\}"
-
     # Find all matching variables in the input string
-    variables = re.findall(pattern, input_string)
+    variables = _VARIABLE_PATTERN.findall(input_string)
     result = input_string
 
     # Check if all variables exist in inputs
@@ -74,9 +113,11 @@ def interpolate_only(
 
     # Replace each variable with its value
     for var in variables:
-        if var in inputs:
-            placeholder = "{" + var + "}"
+        placeholder = "{" + var + "}"
+        if isinstance(inputs, InterpolationInputs):
+            value = inputs.rendered(var)
+        else:
             value = str(inputs[var])
-            result = result.replace(placeholder, value)
+        result = result.replace(placeholder, value)
 
     return result
@@ -0,0 +1,6 @@
+import os
+
+# crew.py builds the shared LLM at import time; no call is ever made in tests
+os.environ.setdefault("MODEL", "azure/gpt-4.1-mini")
+os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
@@ -0,0 +1,30 @@
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from aco_report_poc_crew.crew import AcoReportPocCrew
+from aco_report_poc_crew.jsonparser import process_payload
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "src" / "aco_report_poc_crew" / "data"
+
+
+@pytest.fixture(scope="module")
+def inputs():
+    payload = json.loads((DATA_DIR / "test_data1.json").read_text())
+    return {"payload": process_payload(payload), "fixture_name": "test_data1"}
+
+
+def test_prepare_kickoff_leaves_the_callers_inputs_untouched(inputs):
+    before = copy.deepcopy(inputs)
+    AcoReportPocCrew().prepare_kickoff(inputs)
+    assert inputs == before
+
+
+def test_prepare_kickoff_renders_dicts_after_adding_highlights(inputs):
+    crew = AcoReportPocCrew()
+    prepared = crew.prepare_kickoff(inputs)
+    assert prepared["payload"] == str(inputs["payload"])
+    assert isinstance(json.loads(prepared["top_highlights"]), list)
+    assert set(crew.documents) == {"analyzer_skeleton", "highlights_skeleton"}
@@ -0,0 +1,124 @@
+import json
+from pathlib import Path
+
+import pytest
+from crewai.tasks.task_output import TaskOutput
+
+from aco_report_poc_crew.delta_protocol import (
+    apply_edits,
+    delta_guardrail,
+    edits_from_response,
+    narrative_slots,
+    pointer,
+    resolve,
+)
+from aco_report_poc_crew.jsonparser import analyzer_insights, process_payload
+from aco_report_poc_crew.partial_regen import get_conversion_stats, reset_conversion_stats
+
+DATA_DIR = Path(__file__).parents[1] / "src" / "aco_report_poc_crew" / "data"
+EXPLANATION = pointer("INIT_001", "Revenue", "metrics", "revenue", "explanation")
+
+SKELETON = {
+    "Top Highlights": [{"metric": "revenue", "change": "+5.00%", "summary": "old"}],
+    "a/b": {"summary": "slash", "count": 3},
+}
+
+
+@pytest.fixture
+def analyzer_skeleton():
+    payload = json.loads((DATA_DIR / "test_data1.json").read_text())
+    return analyzer_insights(process_payload(payload))
+
+
+def _output(raw):
+    return TaskOutput(description="d", agent="a", raw=raw)
+
+
+# ---------- JSON Pointer ----------
+
+def test_pointer_round_trips_escaped_tokens():
+    path = pointer("a/b", "summary")
+    assert path == "/a~1b/summary"
+    assert resolve(SKELETON, path) == "slash"
+    assert resolve(SKELETON, pointer("Top Highlights", 0, "summary")) == "old"
+
+
+def test_narrative_slots_lists_only_narrative_strings():
+    assert narrative_slots(SKELETON) == {
+        "/Top Highlights/0/summary": "old",
+        "/a~1b/summary": "slash",
+    }
+
+
+# ---------- apply_edits ----------
+
+def test_apply_edits_replaces_narratives_on_a_copy():
+    document, rejected = apply_edits(SKELETON, {
+        "/Top Highlights/0/summary": "  Revenue rose 5%.  ",
+        "/a~1b/summary": "escaped",
+    })
+    assert rejected == []
+    assert document["Top Highlights"][0]["summary"] == "Revenue rose 5%."
+    assert document["a/b"]["summary"] == "escaped"
+    assert SKELETON["Top Highlights"][0]["summary"] == "old"
+
+
+def test_apply_edits_rejects_everything_but_existing_narrative_strings():
+    edits = {
+        "/Top Highlights/0/change": "+50.00%",   # not a narrative field
+        "/a~1b/count": "4",                      # number
+        "/Top Highlights/1/summary": "new",      # unknown path
+        "/a~1b/summary": {"text": "x"},          # not a string
+        "/Top Highlights/0/summary": "   ",      # blank
+    }
+    document, rejected = apply_edits(SKELETON, edits)
+    assert rejected == list(edits)
+    assert document == SKELETON
+
+
+def test_apply_edits_restricts_to_given_fields():
+    document, rejected = apply_edits(
+        SKELETON, {"/a~1b/summary": "x"}, fields=("insight_summary",))
+    assert rejected == ["/a~1b/summary"]
+    assert document["a/b"]["summary"] == "slash"
+
+
+def test_edits_from_full_document_take_editable_strings():
+    editable = narrative_slots(SKELETON)
+    full = json.loads(json.dumps(SKELETON))
+    full["Top Highlights"][0]["summary"] = "rewritten"
+    del full["a/b"]
+    assert edits_from_response(full, editable) == {"/Top Highlights/0/summary": "rewritten"}
+    edits = {"/a~1b/summary": "x"}
+    assert edits_from_response(edits, editable) is edits
+
+
+# ---------- delta_guardrail ----------
+
+def test_guardrail_merges_edits_and_hands_on_the_document(analyzer_skeleton):
+    merged = []
+    guardrail = delta_guardrail(lambda: analyzer_skeleton, "analyzer_insights",
+                                ("explanation",), on_merged=merged.append)
+    ok, raw = guardrail(_output(f'Here you go: {{"{EXPLANATION}": "Revenue grew."}}'))
+    assert ok
+    document = json.loads(raw)
+    assert resolve(document, EXPLANATION) == "Revenue grew."
+    assert merged == [document]
+    assert resolve(analyzer_skeleton, EXPLANATION) != "Revenue grew."
+
+
+def test_guardrail_empty_edits_keep_the_skeleton(analyzer_skeleton):
+    guardrail = delta_guardrail(lambda: analyzer_skeleton, "analyzer_insights")
+    ok, raw = guardrail(_output("{}"))
+    assert ok
+    assert json.loads(raw) == analyzer_skeleton
+
+
+def test_guardrail_retries_without_json_and_counts_it(analyzer_skeleton):
+    reset_conversion_stats()
+    guardrail = delta_guardrail(lambda: analyzer_skeleton, "analyzer_insights")
+    ok, feedback = guardrail(_output("I could not find anything to change."))
+    assert not ok
+    assert "JSON object of edits" in feedback
+    assert get_conversion_stats()["guardrail_retry"] == 1
+    reset_conversion_stats()
@@ -0,0 +1,43 @@
+import pytest
+
+from aco_report_poc_crew.partial_regen import (
+    get_conversion_stats,
+    parse_json_output,
+    reset_conversion_stats,
+)
+from aco_report_poc_crew.utilities.converter import iter_json_objects
+
+
+@pytest.fixture(autouse=True)
+def _clean_stats():
+    reset_conversion_stats()
+    yield
+    reset_conversion_stats()
+
+
+def test_iter_json_objects_skips_prose_between_objects():
+    text = 'first {"a": 1} then prose } and {"b": {"c": "}"}}'
+    assert list(iter_json_objects(text)) == ['{"a": 1}', '{"b": {"c": "}"}}', '{"c": "}"}']
+
+
+def test_iter_json_objects_ignores_braces_in_strings():
+    assert list(iter_json_objects('{"text": "a { b"}')) == ['{"text": "a { b"}']
+
+
+def test_stray_quote_in_unclosed_brace_does_not_hide_later_objects():
+    # The prose brace never closes and its lone quote would otherwise keep
+    # the scanner in string mode for the rest of the input
+    text = 'Note {the "quoted part. Result: {"a": 1} and {"b": "x"}'
+    assert list(iter_json_objects(text)) == ['{"a": 1}', '{"b": "x"}']
+
+
+def test_nested_unclosed_braces_each_rescan_once():
+    assert list(iter_json_objects('{ {" { {"ok": true}')) == ['{"ok": true}']
+
+
+def test_parse_json_output_counts_how_output_was_parsed():
+    assert parse_json_output('{"a": 1}') == {"a": 1}
+    assert parse_json_output('```json\n{"b": 2}\n```') == {"b": 2}
+    assert parse_json_output("no json here") is None
+    assert parse_json_output("[1, 2]") is None
+    assert get_conversion_stats() == {"direct": 1, "partial_json": 1, "unparsed": 2}
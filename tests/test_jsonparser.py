@@ -0,0 +1,117 @@
+from aco_report_poc_crew.jsonparser import (
+    NO_INITIATIVE_FLAT_SENTENCE,
+    NO_INITIATIVE_SIG_SENTENCE,
+    dimension_pages,
+    select_top_highlights,
+)
+
+
+def _rec(change, initiative_sig=False, overall_sig=False, explanation=""):
+    return {
+        "current_avg": 1.0,
+        "change": change,
+        "initiative_sig": initiative_sig,
+        "overall_sig": overall_sig,
+        "explanation": explanation,
+    }
+
+
+def _block(name, **dimensions):
+    return {"initiative_name": name,
+            **{dim: {"metrics": metrics} for dim, metrics in dimensions.items()}}
+
+
+# ---------- dimension_pages ----------
+
+def test_dimension_pages_keeps_the_attributed_record_of_a_shared_metric():
+    insights = {
+        "INIT_A": _block("A", Conversions={
+            "conversion_rate": _rec("+9.00%", explanation="not tied to A")}),
+        "INIT_B": _block("B", Conversions={
+            "conversion_rate": _rec("+4.00%", initiative_sig=True,
+                                    explanation="impact from B")}),
+        "INIT_C": _block("C", Conversions={
+            "conversion_rate": _rec("+1.00%", explanation="not tied to C")}),
+    }
+    metric = dimension_pages(insights, "2025-01-01")["Conversions"]["metrics"]["conversion_rate"]
+    assert metric["change"] == "+4.00%"
+    assert metric["explanation"] == "impact from B"
+
+
+def test_dimension_pages_breaks_attribution_ties_by_change_then_order():
+    insights = {
+        "INIT_A": _block("A", Revenue={"revenue": _rec("+2.00%", explanation="A")}),
+        "INIT_B": _block("B", Revenue={"revenue": _rec("-5.00%", explanation="B")}),
+        "INIT_C": _block("C", Revenue={"revenue": _rec("+5.00%", explanation="C")}),
+    }
+    pages = dimension_pages(insights, "2025-01-01")
+    assert pages["Revenue"]["metrics"]["revenue"]["explanation"] == "B"
+    assert pages["Revenue"]["insight_summary"] == (
+        "Revenue over the selected window: revenue -5.00%.")
+
+
+def test_dimension_pages_no_initiative_summary_sentences():
+    insights = {"NO_INITIATIVE": _block(
+        "No Initiative",
+        Traffic={"unique_visitors": _rec("+30.00%", overall_sig=True)},
+        Revenue={"revenue": _rec("+0.10%")},
+    )}
+    pages = dimension_pages(insights, "2025-01-01")
+    assert pages["Traffic"]["insight_summary"] == NO_INITIATIVE_SIG_SENTENCE
+    assert pages["Revenue"]["insight_summary"] == NO_INITIATIVE_FLAT_SENTENCE
+    assert pages["Engagement"]["metrics"] == {}
+
+
+# ---------- select_top_highlights ----------
+
+def _processed():
+    return {
+        "INIT_A": _block(
+            "A",
+            Traffic={"unique_visitors": _rec("+40.00%", overall_sig=True)},
+            Engagement={"bounce_rate": _rec("-3.00%"),
+                        "search_conversion_rate": _rec("+12.00%", overall_sig=True)},
+            Revenue={"revenue": _rec("+1.00%")},
+        ),
+        "INIT_B": _block(
+            "B",
+            Traffic={"unique_visitors": _rec("+60.00%", overall_sig=True)},
+            Conversions={"conversion_rate": _rec("+8.00%", overall_sig=True)},
+        ),
+        "initiatives": [
+            {"initiative_id": "INIT_A", "metrics": [
+                {"metric_code": "search_conversion_rate",
+                 "metric_label": "Search CR", "importance_rank": 1}]},
+            {"initiative_id": "INIT_B", "metrics": []},
+        ],
+    }
+
+
+def test_select_top_highlights_ranks_significant_changes_one_per_dimension():
+    picked = select_top_highlights(_processed())
+    assert [(p["initiative_id"], p["metric"]) for p in picked] == [
+        ("INIT_B", "unique_visitors"),
+        ("INIT_A", "search_conversion_rate"),
+        ("INIT_B", "conversion_rate"),
+    ]
+    assert picked[1]["metric_label"] == "Search CR"
+    assert picked[1]["importance_rank"] == 1
+    assert picked[2]["metric_label"] == "Conversion Rate"
+
+
+def test_select_top_highlights_fills_up_to_minimum_with_largest_changes():
+    processed = {
+        "NO_INITIATIVE": _block(
+            "No Initiative",
+            Traffic={"unique_visitors": _rec("+0.50%")},
+            Engagement={"bounce_rate": _rec("-2.00%")},
+            Revenue={"revenue": _rec("+1.00%")},
+        ),
+        "initiatives": [],
+    }
+    picked = select_top_highlights(processed, limit=3, minimum=2)
+    assert [p["metric"] for p in picked] == ["bounce_rate", "revenue"]
+
+
+def test_select_top_highlights_respects_limit():
+    assert len(select_top_highlights(_processed(), limit=2)) == 2
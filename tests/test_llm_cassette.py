@@ -0,0 +1,69 @@
+import pytest
+from crewai.agents.agent_builder.utilities.base_token_process import TokenProcess
+from crewai.utilities.token_counter_callback import TokenCalcHandler
+
+from aco_report_poc_crew.utilities.llm_cassette import (
+    Cassette,
+    CassetteLLM,
+    CassetteMissError,
+    CassetteMode,
+)
+
+MODEL = "gpt-4o-mini"
+
+
+def _messages(text):
+    return [{"role": "user", "content": text}]
+
+
+@pytest.fixture
+def cassette_path(tmp_path):
+    path = str(tmp_path / "calls.jsonl")
+    recorder = Cassette(path, mode=CassetteMode.RECORD)
+    recorder.record(MODEL, _messages("a"), None, "first a", {"prompt_tokens": 3})
+    recorder.record(MODEL, _messages("b"), None, {"json": "b"})
+    recorder.record(MODEL, _messages("a"), None, "second a")
+    return path
+
+
+def test_replays_identical_requests_in_recording_order(cassette_path):
+    cassette = Cassette(cassette_path)
+
+    def play(text):
+        return cassette.play(MODEL, _messages(text), None)["response"]
+
+    assert [play("a"), play("a"), play("a")] == ["first a", "second a", "second a"]
+    assert play("b") == {"json": "b"}
+    assert (cassette.hits, cassette.misses) == (4, 0)
+
+
+def test_unrecorded_requests_take_the_next_unserved_exchange(cassette_path):
+    cassette = Cassette(cassette_path)
+    assert cassette.play(MODEL, _messages("a"), None)["response"] == "first a"
+    assert cassette.play(MODEL, _messages("drifted"), None)["response"] == {"json": "b"}
+    assert cassette.play(MODEL, _messages("drifted"), None)["response"] == "second a"
+    assert cassette.misses == 2
+    with pytest.raises(CassetteMissError):
+        cassette.play(MODEL, _messages("drifted"), None)
+    with pytest.raises(CassetteMissError):
+        cassette.play("other-model", _messages("a"), None)
+
+
+def test_request_key_depends_on_tools():
+    tools = [{"type": "function", "function": {"name": "lint"}}]
+    assert Cassette.request_key(MODEL, _messages("a"), None) != Cassette.request_key(
+        MODEL, _messages("a"), tools)
+
+
+def test_replay_requires_the_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        Cassette(str(tmp_path / "missing.jsonl"))
+
+
+def test_cassette_llm_replays_response_and_usage(cassette_path):
+    token_process = TokenProcess()
+    llm = CassetteLLM(Cassette(cassette_path), model=MODEL)
+    response = llm.call("a", callbacks=[TokenCalcHandler(token_process)])
+    assert response == "first a"
+    summary = token_process.get_summary()
+    assert (summary.prompt_tokens, summary.successful_requests) == (3, 1)
@@ -0,0 +1,56 @@
+from typing import List
+
+import crewai.agent as crewai_agent
+import crewai.utilities.converter as crewai_converter
+from pydantic import BaseModel
+
+from aco_report_poc_crew import output_formats
+from aco_report_poc_crew.output_formats import precompute_output_format
+
+
+class Highlight(BaseModel):
+    metric: str
+    change: str
+
+
+class Highlights(BaseModel):
+    items: List[Highlight]
+
+
+class _LLM:
+    def __init__(self, function_calling: bool):
+        self.function_calling = function_calling
+
+    def supports_function_calling(self) -> bool:
+        return self.function_calling
+
+
+def test_precomputed_text_matches_crewai_and_is_served_from_the_table(monkeypatch):
+    expected_description = crewai_converter.generate_model_description(Highlights)
+    expected_instructions = crewai_converter.get_conversion_instructions(
+        Highlights, _LLM(False)
+    )
+
+    precompute_output_format(Highlights, _LLM(False))
+    assert crewai_agent.generate_model_description is output_formats.generate_model_description
+
+    def fail(*args):
+        raise AssertionError("model walked again")
+
+    monkeypatch.setattr(output_formats, "_generate_model_description", fail)
+    monkeypatch.setattr(output_formats, "_get_conversion_instructions", fail)
+    assert crewai_agent.generate_model_description(Highlights) == expected_description
+    assert (
+        crewai_converter.get_conversion_instructions(Highlights, _LLM(False))
+        == expected_instructions
+    )
+
+
+def test_models_never_precomputed_fall_through_to_crewai():
+    precompute_output_format(Highlights, _LLM(False))
+    assert crewai_agent.generate_model_description(Highlight) == (
+        output_formats._generate_model_description(Highlight)
+    )
+    assert "schema exactly" in crewai_converter.get_conversion_instructions(
+        Highlights, _LLM(True)
+    )
@@ -0,0 +1,119 @@
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from aco_report_poc_crew.jsonparser import (
+    DIMENSIONS,
+    analyzer_insights,
+    dimension_pages,
+    highlight_entries,
+    process_payload,
+    select_top_highlights,
+)
+from aco_report_poc_crew.partial_regen import (
+    changed_slices,
+    merge_analyzer,
+    merge_report,
+    reduce_payload,
+)
+
+DATA_DIR = Path(__file__).parents[1] / "src" / "aco_report_poc_crew" / "data"
+
+
+@pytest.fixture
+def processed():
+    return process_payload(json.loads((DATA_DIR / "test_data1.json").read_text()))
+
+
+def _revenue(processed):
+    return processed["INIT_001"]["Revenue"]["metrics"]["revenue"]
+
+
+def _report(processed, text):
+    """A finished report whose narratives all read ``text``."""
+    pages = dimension_pages(analyzer_insights(processed), "2025-01-01")
+    for page in pages.values():
+        page["insight_summary"] = text
+        for metric in page["metrics"].values():
+            metric["explanation"] = text
+    highlights = highlight_entries(select_top_highlights(processed))
+    for entry in highlights:
+        entry["summary"] = text
+    return {"Top Highlights": highlights, **pages}
+
+
+# ---------- diff ----------
+
+def test_changed_slices_finds_only_the_edited_dimension(processed):
+    current = copy.deepcopy(processed)
+    _revenue(current)["current_avg"] += 1
+    assert changed_slices(processed, processed) == set()
+    assert changed_slices(processed, current) == {("INIT_001", "Revenue")}
+
+
+def test_changed_slices_sees_metric_metadata(processed):
+    current = copy.deepcopy(processed)
+    current["initiatives"][0]["metrics"][0]["impact_note"] = "new note"
+    code = current["initiatives"][0]["metrics"][0]["metric_code"]
+    changed = changed_slices(processed, current)
+    assert len(changed) == 1
+    (init_id, dimension), = changed
+    assert init_id == "INIT_001"
+    assert code in processed[init_id][dimension]["metrics"]
+
+
+def test_changed_slices_falls_back_on_removed_slices_and_layout_flips(processed):
+    current = copy.deepcopy(processed)
+    current["INIT_001"]["Revenue"]["metrics"] = {}
+    assert changed_slices(processed, current) is None
+
+    no_initiative = {"NO_INITIATIVE": processed["INIT_001"], "initiatives": []}
+    assert changed_slices(processed, {**processed, **no_initiative}) is None
+
+
+def test_reduce_payload_keeps_only_changed_dimensions(processed):
+    reduced = reduce_payload(processed, {("INIT_001", "Revenue")})
+    assert list(reduced) == ["INIT_001", "initiatives"]
+    assert set(reduced["INIT_001"]) == {"initiative_name", "Revenue"}
+    assert reduced["initiatives"] == processed["initiatives"]
+
+
+# ---------- merge ----------
+
+def test_merge_analyzer_takes_changed_dimensions_from_the_partial_run(processed):
+    previous = analyzer_insights(processed)
+    partial = {"INIT_001": {"initiative_name": "ACO Launch",
+                            "Revenue": {"metrics": {"revenue": {"explanation": "new"}}}}}
+    merged = merge_analyzer(previous, partial, processed, {("INIT_001", "Revenue")})
+    assert merged["INIT_001"]["Revenue"] == partial["INIT_001"]["Revenue"]
+    for dimension in DIMENSIONS:
+        if dimension != "Revenue":
+            assert merged["INIT_001"][dimension] == previous["INIT_001"][dimension]
+
+
+def test_merge_report_replaces_only_regenerated_pages_and_highlights(processed):
+    current = copy.deepcopy(processed)
+    _revenue(current)["change"] = "+150.00%"
+    changed = changed_slices(processed, current)
+    reduced = reduce_payload(current, changed)
+
+    previous = _report(processed, "old")
+    partial = _report(reduce_payload(current, changed), "new")
+    partial = {"Top Highlights": [h for h in partial["Top Highlights"]
+                                  if h["dimension"] == "Revenue"],
+               "Revenue": partial["Revenue"]}
+    merged = merge_report(previous, partial, reduced, changed, current)
+
+    assert merged["Revenue"]["insight_summary"] == "new"
+    assert merged["Revenue"]["metrics"]["revenue"]["change"] == "+150.00%"
+    for dimension in DIMENSIONS:
+        if dimension != "Revenue":
+            assert merged[dimension] == previous[dimension]
+
+    highlights = {h["dimension"]: h for h in merged["Top Highlights"]}
+    assert [h["metric"] for h in merged["Top Highlights"]] == [
+        h["metric"] for h in highlight_entries(select_top_highlights(current))]
+    for dimension, entry in highlights.items():
+        assert entry["summary"] == ("new" if dimension == "Revenue" else "old")
@@ -0,0 +1,118 @@
+import os
+import shutil
+from types import SimpleNamespace
+
+import pytest
+from crewai.crews.crew_output import CrewOutput
+from crewai.tasks.task_output import TaskOutput
+
+from aco_report_poc_crew import report_cache
+from aco_report_poc_crew.report_cache import (
+    KEY_SOURCES,
+    ReportCache,
+    crew_output_from_entry,
+    kickoff_cached,
+)
+
+PAYLOAD = {"INIT_001": {"initiative_name": "ACO Launch"}, "initiatives": []}
+
+
+def _output(raw="{}"):
+    return CrewOutput(
+        raw=raw,
+        json_dict={"raw": raw},
+        tasks_output=[TaskOutput(description="d", agent="a", raw=raw, name="story")],
+    )
+
+
+@pytest.fixture
+def package_copy(tmp_path, monkeypatch):
+    """A copy of the package files the key hashes, installed as PACKAGE_DIR."""
+    root = tmp_path / "package"
+    for path in report_cache.key_source_files():
+        target = root / path.relative_to(report_cache.PACKAGE_DIR)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(path, target)
+    monkeypatch.setattr(report_cache, "PACKAGE_DIR", root)
+    return root
+
+
+# ---------- key ----------
+
+def test_key_is_stable_and_depends_on_model_endpoint_and_payload():
+    key = ReportCache.key(PAYLOAD, "azure/gpt-4.1-mini", "http://a")
+    assert key == ReportCache.key(dict(reversed(PAYLOAD.items())), "azure/gpt-4.1-mini", "http://a")
+    assert key != ReportCache.key(PAYLOAD, "azure/gpt-4.1", "http://a")
+    assert key != ReportCache.key(PAYLOAD, "azure/gpt-4.1-mini", "http://b")
+    assert key != ReportCache.key({**PAYLOAD, "initiatives": [{}]}, "azure/gpt-4.1-mini", "http://a")
+
+
+@pytest.mark.parametrize("source", [
+    "config/tasks.yaml",
+    "config/phrasings.yaml",
+    "schemas/stories_data.schema.json",
+    "jsonparser.py",
+    "delta_protocol.py",
+    "template_report.py",
+])
+def test_key_changes_with_every_report_source(package_copy, source):
+    before = ReportCache.key(PAYLOAD, "m", "e")
+    with open(package_copy / source, "a", encoding="utf-8") as f:
+        f.write("\n")
+    assert ReportCache.key(PAYLOAD, "m", "e") != before
+
+
+def test_key_source_patterns_all_match():
+    files = report_cache.key_source_files()
+    assert len(files) >= len(KEY_SOURCES)
+
+
+# ---------- entries ----------
+
+def test_put_get_round_trip(tmp_path):
+    cache = ReportCache(tmp_path)
+    cache.put("k", _output('{"a": 1}'), model="m")
+    output = crew_output_from_entry(cache.get("k"))
+    assert output.raw == '{"a": 1}'
+    assert output.tasks_output[0].name == "story"
+    assert cache.get("missing") is None
+
+
+def test_evicts_least_recently_used_entries_over_budget(tmp_path):
+    cache = ReportCache(tmp_path, max_bytes=1 << 20)
+    for i, key in enumerate(("old", "used", "new")):
+        path = cache.put(key, _output("x" * 1000))
+        os.utime(path, (1000 + i, 1000 + i))
+    cache.get("old")  # a hit refreshes recency
+    cache.max_bytes = sum((tmp_path / f"{key}.json").stat().st_size for key in ("old", "new"))
+    assert cache.evict() == 1
+    assert sorted(p.stem for p in tmp_path.glob("*.json")) == ["new", "old"]
+
+
+def test_invalidate_all_clears_partial_state(tmp_path):
+    cache = ReportCache(tmp_path)
+    cache.put("k", _output())
+    partial = tmp_path / report_cache.PARTIAL_STATE_DIR
+    partial.mkdir()
+    (partial / "scope.json").write_text("{}")
+    assert cache.invalidate() == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_kickoff_cached_replays_callbacks_on_a_hit(tmp_path):
+    seen = []
+    task = SimpleNamespace(callback=lambda output: seen.append(output.raw))
+    crew = SimpleNamespace(tasks=[task])
+    calls = []
+
+    def kickoff(inputs):
+        calls.append(inputs)
+        return _output("fresh")
+
+    cache = ReportCache(tmp_path)
+    inputs = {"payload": PAYLOAD}
+    first = kickoff_cached(crew, inputs, model="m", cache=cache, kickoff=kickoff)
+    second = kickoff_cached(crew, inputs, model="m", cache=cache, kickoff=kickoff)
+    assert len(calls) == 1
+    assert first.raw == second.raw == "fresh"
+    assert seen == ["fresh"]
@@ -0,0 +1,95 @@
+import json
+import random
+import urllib.error
+import urllib.request
+
+import pytest
+
+from aco_report_poc_crew.config import tasks_config
+from aco_report_poc_crew.stub_llm_server import StubLLMServer, parse_latency
+
+
+@pytest.fixture
+def server():
+    server = StubLLMServer(address=("127.0.0.1", 0), stream_chunk_chars=16)
+    server.start_in_background()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _post(server, body):
+    request = urllib.request.Request(
+        f"{server.base_url}/openai/deployments/stub/chat/completions",
+        data=json.dumps(body).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return response.read().decode("utf-8")
+
+
+def _task_messages(name):
+    return [{"role": "system", "content": "You are an analyst."},
+            {"role": "user", "content": tasks_config[name]["expected_output"]}]
+
+
+def test_parse_latency_specs():
+    rng = random.Random(0)
+    assert parse_latency("fixed:250", rng)() == 0.25
+    assert 0.1 <= parse_latency("uniform:100,200", rng)() <= 0.2
+    assert parse_latency("normal:0,0", rng)() == 0.0
+    with pytest.raises(ValueError):
+        parse_latency("poisson:3", rng)
+
+
+def test_answers_each_task_by_its_expected_output(server):
+    for name in tasks_config:
+        assert server.answer(_task_messages(name)).endswith(
+            json.dumps(server.outputs[name], indent=2))
+    assert server.stats["task:analyze_impact_attribution_task"] == 1
+
+
+def test_canned_analyzer_edits_fill_the_placeholders(server):
+    edits = server.outputs["analyze_impact_attribution_task"]
+    assert edits
+    assert not any("[" in text for text in edits.values())
+
+
+def test_chat_completion_and_stats(server):
+    body = json.loads(_post(server, {"model": "m", "messages": _task_messages(
+        "generate_top_highlights_task")}))
+    content = body["choices"][0]["message"]["content"]
+    assert content.startswith("Thought: I now know the final answer")
+    assert body["usage"]["total_tokens"] == (
+        body["usage"]["prompt_tokens"] + body["usage"]["completion_tokens"])
+
+    with urllib.request.urlopen(f"{server.base_url}/stats", timeout=10) as response:
+        stats = json.loads(response.read())
+    assert stats["requests"] == 1
+    assert stats["task:generate_top_highlights_task"] == 1
+
+
+def test_streamed_chunks_reassemble_the_answer(server):
+    messages = _task_messages("generate_dimension_pages_task")
+    events = [
+        line[len("data: "):]
+        for line in _post(server, {"model": "m", "messages": messages,
+                                   "stream": True}).splitlines()
+        if line.startswith("data: ")
+    ]
+    assert events[-1] == "[DONE]"
+    chunks = [json.loads(event) for event in events[:-1]]
+    text = "".join(c["choices"][0]["delta"].get("content", "") for c in chunks)
+    assert text == server.answer(messages)
+    assert chunks[-1]["choices"][0]["finish_reason"] == "stop"
+    assert "usage" in chunks[-1]
+    assert server.stats["streamed"] == 1
+
+
+def test_rejects_with_429_at_full_error_rate(server):
+    server.error_rate = 1.0
+    with pytest.raises(urllib.error.HTTPError) as error:
+        _post(server, {"model": "m", "messages": _task_messages("combine_stories_task")})
+    assert error.value.code == 429
+    assert error.value.headers["Retry-After"] == "1"
+    assert server.stats["rate_limited"] == 1
@@ -0,0 +1,82 @@
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from aco_report_poc_crew.config import phrasings_config
+from aco_report_poc_crew.delta_protocol import narrative_slots
+from aco_report_poc_crew.jsonparser import process_payload
+from aco_report_poc_crew.template_report import (
+    TEMPLATE_ENV_VAR,
+    is_template_eligible,
+    kickoff_template,
+    pick_phrasing,
+    render_no_initiative_report,
+    report_issues,
+)
+
+DATA_DIR = Path(__file__).parents[1] / "src" / "aco_report_poc_crew" / "data"
+LAST_UPDATED = "2025-07-01T00:00:00Z"
+
+
+def _payload():
+    return json.loads((DATA_DIR / "test_data1.json").read_text())
+
+
+@pytest.fixture
+def no_initiative():
+    return process_payload({**_payload(), "initiatives": []})
+
+
+def test_only_no_initiative_payloads_are_eligible(no_initiative):
+    assert is_template_eligible(no_initiative)
+    assert not is_template_eligible(process_payload(_payload()))
+
+
+def test_pick_phrasing_is_deterministic_per_slot_and_seed():
+    pool = [f"phrase {i}" for i in range(16)]
+    assert pick_phrasing(pool, "/a", "seed") == pick_phrasing(pool, "/a", "seed")
+    assert len({pick_phrasing(pool, f"/slot/{i}", "seed") for i in range(32)}) > 1
+
+
+def test_rendered_report_is_valid_and_stable(no_initiative):
+    report = render_no_initiative_report(no_initiative, LAST_UPDATED)
+    assert report_issues(report) == []
+    assert report == render_no_initiative_report(no_initiative, LAST_UPDATED)
+    assert report["Top Highlights"]
+    for page in (v for k, v in report.items() if k != "Top Highlights"):
+        for metric in page["metrics"].values():
+            assert metric["last_updated"] == LAST_UPDATED
+
+
+def _phrasing_pattern(phrasing):
+    parts = re.split(r"\{\w+\}", phrasing.strip())
+    return re.compile(".+".join(re.escape(part) for part in parts) + r"\Z")
+
+
+def test_every_narrative_comes_from_the_phrasings(no_initiative):
+    patterns = [
+        _phrasing_pattern(phrasing)
+        for kind in phrasings_config["no_initiative"].values()
+        for pool in kind.values()
+        for phrasing in pool
+    ]
+    report = render_no_initiative_report(no_initiative, LAST_UPDATED)
+    for path, text in narrative_slots(report).items():
+        assert any(pattern.match(text) for pattern in patterns), path
+
+
+def test_kickoff_template_renders_without_the_crew(no_initiative, monkeypatch):
+    monkeypatch.delenv(TEMPLATE_ENV_VAR, raising=False)
+    output = kickoff_template({"payload": no_initiative, "last_updated": LAST_UPDATED})
+    assert output.json_dict == render_no_initiative_report(no_initiative, LAST_UPDATED)
+    assert json.loads(output.raw) == output.json_dict
+    assert output.token_usage.total_tokens == 0
+
+
+def test_kickoff_template_defers_to_the_crew(no_initiative, monkeypatch):
+    monkeypatch.delenv(TEMPLATE_ENV_VAR, raising=False)
+    assert kickoff_template({"payload": process_payload(_payload())}) is None
+    monkeypatch.setenv(TEMPLATE_ENV_VAR, "0")
+    assert kickoff_template({"payload": no_initiative}) is None
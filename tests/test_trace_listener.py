@@ -0,0 +1,33 @@
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from aco_report_poc_crew.listeners.trace_listener import _micros, tracing_from_env
+
+
+@pytest.fixture
+def new_york(monkeypatch):
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_naive_timestamps_are_read_as_local_time(new_york):
+    local = datetime(2026, 1, 15, 9, 30)
+    aware = local.astimezone(timezone.utc)
+    assert aware.hour == 14
+    assert _micros(local) == _micros(aware) == int(aware.timestamp() * 1_000_000)
+
+
+@pytest.mark.parametrize("value, enabled", [("1", True), ("On", True), ("0", False), ("", False)])
+def test_tracing_from_env_uses_truthy_values(monkeypatch, tmp_path, value, enabled):
+    monkeypatch.setenv("CREW_TRACE", value)
+    monkeypatch.setenv("CREW_TRACE_DIR", str(tmp_path))
+    monkeypatch.setattr(
+        "aco_report_poc_crew.listeners.trace_listener.TraceListener",
+        lambda **kwargs: kwargs,
+    )
+    assert (tracing_from_env() is not None) is enabled